@@ -2,6 +2,7 @@ from src.prep import Prep
 from src.args import Args
 from src.clients import Clients
 from src.search import Search
+from src.metastore import StoredMeta, load_meta, save_meta
 from src.trackers.BLU import BLU
 from src.trackers.BHD import BHD
 from src.trackers.AITHER import AITHER
@@ -15,7 +16,6 @@ from discord.ext import commands  # type: ignore
 import os
 from datetime import datetime
 import asyncio
-import json
 import multiprocessing
 from pathlib import Path
 from glob import glob
@@ -111,9 +111,7 @@ class Commands(commands.Cog):
         parser = Args(config)
         base_dir = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))
         try:
-            with open(f"{base_dir}/tmp/{uuid}/meta.json") as f:
-                meta = json.load(f)
-                f.close()
+            meta = StoredMeta(load_meta(f"{base_dir}/tmp/{uuid}/meta.json"))
         except FileNotFoundError:
             await ctx.send("ID not found, please try again using the ID in the footer")
             return
@@ -362,9 +360,7 @@ class Commands(commands.Cog):
         await message.add_reaction(config['DISCORD']['discord_emojis']['UPLOAD'])
 
         # Save meta to json
-        with open(f"{meta['base_dir']}/tmp/{meta['uuid']}/meta.json", 'w') as f:
-            json.dump(meta, f, indent=4)
-            f.close()
+        save_meta(meta)
 
         def check(reaction, user):
             if reaction.message.id == meta['embed_msg_id']:
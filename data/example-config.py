@@ -39,6 +39,19 @@ config = {
         "img_host_8": "dalexni",
         "img_host_9": "zipline",
 
+        # Cache TMDB, IMDb, TVmaze and srrdb responses in data/http_cache.db, so queued items of the same show
+        # or movie do not ask the same questions again. Entries expire per endpoint (1 to 30 days)
+        "http_cache": True,
+
+        # Size of the HTTP response cache in MB, the least recently used responses are dropped above it
+        "http_cache_size": "64",
+
+        # Reuse earlier uploads of byte-identical images (from any item, tracker or run) instead of uploading them again
+        "image_cache": True,
+
+        # Days after which a cached image is checked to still be online before it is reused, 0 never checks
+        "image_cache_ttl": "0",
+
         # Whether to add a logo for the show/movie from TMDB to the top of the description
         "add_logo": False,
 
@@ -118,6 +131,17 @@ config = {
         # Enable lossless PNG Compression (True/False)
         "optimize_images": True,
 
+        # Capture all screenshot frames of a file with one ffmpeg process (in batches of 8) instead of one process per frame
+        "multi_capture": True,
+
+        # Snap screenshot times to keyframes (from a keyframe index cached in the tmp folder) so each capture
+        # decodes a single frame, much faster on long-GOP HEVC encodes
+        "keyframe_screens": False,
+
+        # Score candidate frames (dark, flat or near duplicate) on small raw frames before capturing any PNG, and
+        # re-pick rejected ones, instead of capturing an extra screenshot and dropping the smallest. Requires numpy
+        "frame_screening": False,
+
         # The name of your default torrent client, set in the torrent client sections below
         "default_torrent_client": "Client1",
 
@@ -135,9 +159,29 @@ config = {
         # set true to only grab meta id's from trackers, not descriptions and images
         "only_id": False,
 
+        # set true to search all trackers with useAPI for existing ids at once instead of one after another,
+        # the first tracker in order with a match is still used and the remaining searches are cancelled
+        "race_tracker_lookups": False,
+
+        # How many tracker uploads of an item run at the same time, 1 uploads to one tracker after another
+        # A tracker can also set "upload_concurrency" and "upload_spacing" (seconds between its uploads) in its own section,
+        # and "add_delay" (seconds to wait after its upload before adding the torrent to the client, PTP 5 and SN 16 by default)
+        # Runs that are not unattended always upload to one tracker after another
+        "tracker_upload_concurrency": "4",
+
         # set true to use mkbrr for torrent creation
         "mkbrr": False,
 
+        # set true to hash torrents with the built-in multi-threaded engine instead of torf (not used with mkbrr)
+        "native_hash": False,
+
+        # number of hashing threads for the built-in engine, 0 = automatic (up to 8)
+        "hash_threads": "0",
+
+        # before reusing an existing .torrent from the client, hash this many random pieces (plus the first and
+        # last piece of every file) against the local files and regenerate on a mismatch, 0 = disabled
+        "verify_reuse_pieces": "0",
+
         # set true to use argument overrides from data/templates/user-args.json
         "user_overrides": False,
 
@@ -0,0 +1,222 @@
+"""
+Micro benchmarks for the hot paths of Upload Assistant.
+
+    python -m src.benchmark hash --size 4096 --files 3
+    python -m src.benchmark screens --source /path/to/4k.hdr.mkv --count 7
+    python -m src.benchmark meta --discs 4 --trackers 25
+"""
+import os
+import sys
+import copy
+import time
+import shutil
+import argparse
+import tempfile
+import tracemalloc
+import subprocess
+from src.console import console
+
+
+def make_synthetic_files(directory, total_mib, count):
+    """Write count files of random data totalling roughly total_mib MiB, with sizes that do not align to pieces."""
+    os.makedirs(directory, exist_ok=True)
+    per_file = (total_mib * 1024 * 1024) // count
+    chunk = os.urandom(1024 * 1024)
+    paths = []
+    for i in range(count):
+        path = os.path.join(directory, f"synthetic.{i:02d}.mkv")
+        size = per_file + 12345 * (i + 1)
+        with open(path, 'wb') as f:
+            written = 0
+            while written < size:
+                n = min(len(chunk), size - written)
+                f.write(chunk[:n])
+                written += n
+        paths.append(path)
+    return paths
+
+
+def bench_hash(args):
+    import torf
+    from src.piecehash import hash_pieces
+    from src.torrentcreate import CustomTorrent, get_mkbrr_path
+
+    base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+    workdir = tempfile.mkdtemp(prefix="ua-hash-bench-")
+    content = os.path.join(workdir, "content")
+    piece_size = args.piece_size * 1024 * 1024
+    results = {}
+    try:
+        make_synthetic_files(content, args.size, args.files)
+        total = sum(os.path.getsize(os.path.join(content, f)) for f in os.listdir(content))
+
+        start = time.time()
+        # torrentcreate replaces torf's piece size limits on import, build the reference the way the uploader does
+        torrent = CustomTorrent(meta={'debug': False}, path=content, piece_size=piece_size, private=True)
+        torrent.generate()
+        results['torf'] = time.time() - start
+        reference = torrent.metainfo['info']['pieces']
+
+        start = time.time()
+        native = hash_pieces(torrent.filepaths, piece_size, threads=args.threads or None)
+        results['native'] = time.time() - start
+        if native != reference:
+            console.print("[red]Native engine produced different piece hashes than torf")
+
+        try:
+            mkbrr = get_mkbrr_path({'base_dir': base_dir})
+            output = os.path.join(workdir, "mkbrr.torrent")
+            exponent = piece_size.bit_length() - 1
+            start = time.time()
+            subprocess.run([mkbrr, "create", content, "-o", output, "-l", str(exponent)], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            results['mkbrr'] = time.time() - start
+            if torf.Torrent.read(output).metainfo['info']['pieces'] != reference:
+                console.print("[yellow]mkbrr produced different piece hashes (file ordering or piece size differs)")
+        except Exception as e:
+            console.print(f"[yellow]Skipping mkbrr: {e}")
+
+        console.print(f"[bold]{args.files} file(s), {total / (1024 * 1024):.0f} MiB, {args.piece_size} MiB pieces[/bold]")
+        for engine, elapsed in results.items():
+            console.print(f"{engine:>8}: {elapsed:8.3f}s  {total / (1024 * 1024) / elapsed:10.2f} MiB/s")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def make_synthetic_video(directory, duration):
+    """Encode a 4K long-GOP test pattern clip with ffmpeg's default encoder for capture benchmarks."""
+    path = os.path.join(directory, "synthetic.mkv")
+    subprocess.run(
+        ["ffmpeg", "-v", "error", "-f", "lavfi", "-i", "testsrc2=size=3840x2160:rate=24", "-t", str(duration), "-g", "240", "-y", path],
+        check=True
+    )
+    return path
+
+
+def bench_screens(args):
+    import asyncio
+    import ffmpeg
+    from src.takescreens import capture_screenshot, capture_screenshots_multi
+
+    workdir = tempfile.mkdtemp(prefix="ua-screens-bench-")
+    try:
+        source = args.source or make_synthetic_video(workdir, args.duration)
+        probe = ffmpeg.probe(source)
+        video = next(stream for stream in probe['streams'] if stream['codec_type'] == 'video')
+        width, height = float(video['width']), float(video['height'])
+        length = float(probe['format']['duration'])
+        times = [length * (i + 1) / (args.count + 1) for i in range(args.count)]
+        meta = {'debug': False, 'filelist': [source]}
+
+        async def per_frame(captures, hdr_tonemap):
+            return await asyncio.gather(*[
+                capture_screenshot((i, source, ss_time, image_path, width, height, 1, 1, 'quiet', hdr_tonemap, meta))
+                for i, ss_time, image_path in captures
+            ])
+
+        async def single_process(captures, hdr_tonemap):
+            return await capture_screenshots_multi(source, captures, width, height, 1, 1, 'quiet', hdr_tonemap, meta)
+
+        console.print(f"[bold]{os.path.basename(source)}: {int(width)}x{int(height)}, {args.count} frames[/bold]")
+        for hdr_tonemap in (False, True):
+            for engine, capture in (("per-frame", per_frame), ("single", single_process)):
+                captures = [(i, ss_time, os.path.join(workdir, f"{engine}-{int(hdr_tonemap)}-{i}.png")) for i, ss_time in enumerate(times)]
+                start = time.time()
+                results = asyncio.run(capture(captures, hdr_tonemap))
+                elapsed = time.time() - start
+                captured = sum(1 for result in results if isinstance(result, tuple) and result[1] is not None)
+                console.print(f"tone_map={'on' if hdr_tonemap else 'off':>3} {engine:>10}: {elapsed:8.3f}s  {captured}/{args.count} captured")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def make_synthetic_meta(discs):
+    """A meta shaped like a multi-disc BDMV item: full MediaInfo JSON, BDInfo, per-disc MediaInfo dumps, images."""
+    track = {f"field_{i}": f"value {i} " * 4 for i in range(80)}
+    mediainfo = {'media': {'@ref': "/path/to/disc", 'track': [dict(track, **{'@type': "Audio"}) for _ in range(40)]}}
+    bdinfo = {
+        'path': "/path/to/disc/BDMV",
+        'files': [{'file': f"{i:05d}.M2TS", 'length': i * 1000, 'size': i * 1048576} for i in range(300)],
+        'video': [{'codec': "MPEG-H HEVC Video", 'bitrate': "60000 kbps", 'res': "2160p"}],
+        'audio': [{'language': "English", 'codec': "Dolby TrueHD/Atmos Audio", 'channels': "7.1"} for _ in range(12)],
+        'subtitles': ["English"] * 30,
+    }
+    summary = "Disc Title: Synthetic\n" + "Playlist line with stream details\n" * 4000
+    return {
+        'name': "Synthetic 2024 2160p UHD BluRay REMUX HEVC TrueHD Atmos 7.1-GROUP",
+        'tag': "-GROUP",
+        'resolution': "2160p",
+        'is_disc': "BDMV",
+        'mediainfo': mediainfo,
+        'bdinfo': bdinfo,
+        'discs': [
+            {
+                'path': f"/path/to/disc/DISC{i}/BDMV",
+                'name': f"DISC{i}",
+                'type': "BDMV",
+                'summary': summary,
+                'bdinfo': copy.deepcopy(bdinfo),
+                'vob_mi_full': "MediaInfo text dump line\n" * 8000,
+                'ifo_mi_full': "MediaInfo text dump line\n" * 4000,
+            }
+            for i in range(discs)
+        ],
+        'image_list': [{'img_url': f"https://img.example/{i}.png", 'raw_url': f"https://img.example/{i}.png", 'web_url': f"https://img.example/{i}"} for i in range(20)],
+        'description': "[center]Synthetic description[/center]\n" * 600,
+        'tracker_status': {},
+    }
+
+
+def bench_meta(args):
+    from src.metaoverlay import MetaOverlay
+
+    def tracker_work(local_meta, tracker):
+        # What the tracker stages typically do with their meta: read the basics, touch the blobs, write a few keys
+        local_meta['name'] = local_meta['name'].replace(" DUPE?", "")
+        local_meta['we_asked'] = False
+        local_meta.get('image_list', []).append({'img_url': f"https://img.example/{tracker}.png"})
+        local_meta['mediainfo']['media']['track'][0].get('field_0')
+        len(local_meta['discs'][0]['summary'])
+        return local_meta
+
+    meta = make_synthetic_meta(args.discs)
+    console.print(f"[bold]Synthetic meta with {args.discs} disc(s), {args.trackers} trackers[/bold]")
+    for engine, make_copy in (("deepcopy", copy.deepcopy), ("overlay", MetaOverlay)):
+        tracemalloc.start()
+        start = time.time()
+        shared_meta = dict(meta)
+        copies = [tracker_work(make_copy(shared_meta), i) for i in range(args.trackers)]
+        elapsed = time.time() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        console.print(f"{engine:>8}: {elapsed:8.3f}s  {peak / 1048576:10.2f} MiB peak")
+        del copies
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m src.benchmark")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    hash_parser = sub.add_parser('hash', help="Compare torf, mkbrr and the native piece hashing engine")
+    hash_parser.add_argument('--size', type=int, default=2048, help="Total size of the synthetic files in MiB")
+    hash_parser.add_argument('--files', type=int, default=3, help="Number of synthetic files")
+    hash_parser.add_argument('--piece-size', dest='piece_size', type=int, default=4, help="Piece size in MiB")
+    hash_parser.add_argument('--threads', type=int, default=0, help="Native engine threads, 0 = automatic")
+    hash_parser.set_defaults(func=bench_hash)
+
+    screens_parser = sub.add_parser('screens', help="Compare per-frame ffmpeg processes with single-process screenshot capture")
+    screens_parser.add_argument('--source', help="Video to capture from, a synthetic 4K clip is encoded when omitted")
+    screens_parser.add_argument('--count', type=int, default=7, help="Number of frames to capture")
+    screens_parser.add_argument('--duration', type=int, default=120, help="Length of the synthetic clip in seconds")
+    screens_parser.set_defaults(func=bench_screens)
+
+    meta_parser = sub.add_parser('meta', help="Compare a deepcopy of meta per tracker with copy-on-write overlays")
+    meta_parser.add_argument('--discs', type=int, default=4, help="Number of discs in the synthetic BDMV meta")
+    meta_parser.add_argument('--trackers', type=int, default=25, help="Number of trackers to copy meta for")
+    meta_parser.set_defaults(func=bench_meta)
+
+    args = parser.parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,7 @@
 import httpx
 import uuid
 from src.bbcode import BBCODE
+from src.trackerhttp import tracker_session
 
 
 async def generate_guid():
@@ -23,7 +24,7 @@ async def get_btn_torrents(btn_api, btn_id, meta):
 
     headers = {"Content-Type": "application/json"}
 
-    async with httpx.AsyncClient() as client:
+    async with tracker_session() as client:
         response = await client.post(post_query_url, headers=headers, json=post_data)
         data = response.json()
 
@@ -48,7 +49,8 @@ async def get_btn_torrents(btn_api, btn_id, meta):
     return meta
 
 
-async def get_bhd_torrents(bhd_api, bhd_rss_key, meta, only_id=False, info_hash=None, filename=None, foldername=None, torrent_id=None):
+async def bhd_search(bhd_api, bhd_rss_key, info_hash=None, filename=None, foldername=None, torrent_id=None):
+    """BHD API search (or details) response data, None when the request or the API failed."""
     print("Fetching BHD data...")
     post_query_url = f"https://beyond-hd.me/api/torrents/{bhd_api}"
 
@@ -75,17 +77,30 @@ async def get_bhd_torrents(bhd_api, bhd_rss_key, meta, only_id=False, info_hash=
     headers = {"Content-Type": "application/json"}
 
     try:
-        async with httpx.AsyncClient() as client:
+        async with tracker_session() as client:
             response = await client.post(post_query_url, headers=headers, json=post_data, timeout=10)
             response.raise_for_status()
             data = response.json()
     except (httpx.RequestError, httpx.HTTPStatusError) as e:
         print(f"[ERROR] Failed to fetch BHD data: {e}")
-        return meta
+        return None
 
     if data.get("status_code") == 0 or data.get("success") is False:
         error_message = data.get("status_message", "Unknown BHD API error")
         print(f"[ERROR] BHD API error: {error_message}")
+        return None
+
+    return data
+
+
+async def get_bhd_torrents(bhd_api, bhd_rss_key, meta, only_id=False, info_hash=None, filename=None, foldername=None, torrent_id=None, data=None):
+    post_query_url = f"https://beyond-hd.me/api/torrents/{bhd_api}"
+    headers = {"Content-Type": "application/json"}
+
+    # data is the response of an earlier bhd_search with the same arguments
+    if data is None:
+        data = await bhd_search(bhd_api, bhd_rss_key, info_hash=info_hash, filename=filename, foldername=foldername, torrent_id=torrent_id)
+    if not data:
         return meta
 
     # Handle different response formats from BHD API
@@ -118,7 +133,7 @@ async def get_bhd_torrents(bhd_api, bhd_rss_key, meta, only_id=False, info_hash=
         }
 
         try:
-            async with httpx.AsyncClient() as client:
+            async with tracker_session() as client:
                 desc_response = await client.post(post_query_url, headers=headers, json=desc_post_data, timeout=10)
                 desc_response.raise_for_status()
                 desc_data = desc_response.json()
@@ -5,6 +5,8 @@ from src.console import console
 from concurrent.futures import ThreadPoolExecutor
 
 running_subprocesses = set()
+# pids of long-running helpers (e.g. mkbrr hashing in the background) that worker cleanup must not kill
+background_pids = set()
 thread_executor: ThreadPoolExecutor = None
 
 
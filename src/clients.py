@@ -14,8 +14,74 @@ import ssl
 import shutil
 import time
 from src.console import console
+from src.torrentindex import TorrentIndex
+from src.piecehash import verify_pieces
 import re
 import platform
+from pathlib import PurePath
+
+
+qbit_sessions = {}
+qbit_session_locks = {}
+
+
+class QbitSession:
+    """
+    A logged in qBittorrent API client shared by every Clients instance for the whole run.
+    Attribute access proxies the qbittorrentapi.Client and records per-method latency;
+    use `await session.call(method, ...)` to run a request in a worker thread off the event loop.
+    """
+
+    def __init__(self, client):
+        self.name = f"{client['qbit_url']}:{client['qbit_port']}"
+        self.client = qbittorrentapi.Client(
+            host=client['qbit_url'],
+            port=client['qbit_port'],
+            username=client['qbit_user'],
+            password=client['qbit_pass'],
+            VERIFY_WEBUI_CERTIFICATE=client.get('VERIFY_WEBUI_CERTIFICATE', True)
+        )
+        self.stats = {}
+
+    def __getattr__(self, name):
+        attr = getattr(self.client, name)
+        if not callable(attr):
+            return attr
+
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return attr(*args, **kwargs)
+            finally:
+                count, total = self.stats.get(name, (0, 0.0))
+                self.stats[name] = (count + 1, total + time.perf_counter() - start)
+        return timed
+
+    async def call(self, method, *args, **kwargs):
+        return await asyncio.to_thread(getattr(self, method), *args, **kwargs)
+
+
+async def get_qbit_session(client):
+    """Return the shared, logged in session for a qbit client config, logging in on first use."""
+    key = (client['qbit_url'], str(client['qbit_port']), client['qbit_user'])
+    lock = qbit_session_locks.setdefault(key, asyncio.Lock())
+    async with lock:
+        session = qbit_sessions.get(key)
+        if session is None:
+            session = QbitSession(client)
+            await session.call('auth_log_in')
+            qbit_sessions[key] = session
+        return session
+
+
+def report_qbit_latency():
+    """Print per-method qBittorrent API call counts and latency for this run."""
+    for session in qbit_sessions.values():
+        if not session.stats:
+            continue
+        console.print(f"[bold]qBittorrent API latency ({session.name}):[/bold]")
+        for method, (count, total) in sorted(session.stats.items()):
+            console.print(f"  {method}: {count} call(s), {total:.3f}s total, {total / count * 1000:.1f} ms avg")
 
 
 class Clients():
@@ -26,25 +92,31 @@ class Clients():
         self.config = config
         pass
 
-    async def add_to_client(self, meta, tracker):
-        torrent_path = f"{meta['base_dir']}/tmp/{meta['uuid']}/[{tracker}]{meta['clean_name']}.torrent"
+    def get_seeding_client(self, meta):
+        """Client config the tracker torrents should be added to, or None when seeding is disabled."""
         if meta.get('no_seed', False) is True:
             console.print("[bold red]--no-seed was passed, so the torrent will not be added to the client")
             console.print("[bold yellow]Add torrent manually to the client")
-            return
-        if os.path.exists(torrent_path):
-            torrent = Torrent.read(torrent_path)
-        else:
-            return
+            return None
         if meta.get('client', None) is None:
             default_torrent_client = self.config['DEFAULT']['default_torrent_client']
         else:
             default_torrent_client = meta['client']
         if meta.get('client', None) == 'none':
-            return
+            return None
         if default_torrent_client == "none":
+            return None
+        return self.config['TORRENT_CLIENTS'][default_torrent_client]
+
+    async def add_to_client(self, meta, tracker):
+        torrent_path = f"{meta['base_dir']}/tmp/{meta['uuid']}/[{tracker}]{meta['clean_name']}.torrent"
+        if os.path.exists(torrent_path):
+            torrent = Torrent.read(torrent_path)
+        else:
+            return
+        client = self.get_seeding_client(meta)
+        if client is None:
             return
-        client = self.config['TORRENT_CLIENTS'][default_torrent_client]
         torrent_client = client['torrent_client']
 
         local_path, remote_path = await self.remote_path_map(meta)
@@ -65,6 +137,35 @@ class Clients():
             shutil.copy(torrent_path, client['watch_folder'])
         return
 
+    async def add_to_client_batch(self, meta, trackers):
+        """
+        Add the torrents of every tracker an item was uploaded to.
+        For qBittorrent, torrents sharing the same save options go in with a single torrents_add call.
+        """
+        if not trackers:
+            return
+        client = self.get_seeding_client(meta)
+        if client is None:
+            return
+        if client['torrent_client'] != "qbit" or len(trackers) == 1:
+            for tracker in trackers:
+                await self.add_to_client(meta, tracker)
+            return
+
+        local_path, remote_path = await self.remote_path_map(meta)
+        groups = {}
+        for tracker in trackers:
+            torrent_path = f"{meta['base_dir']}/tmp/{meta['uuid']}/[{tracker}]{meta['clean_name']}.torrent"
+            if not os.path.exists(torrent_path):
+                continue
+            add_args = self.qbit_add_args(meta['path'], local_path, remote_path, client, meta['filelist'], meta, tracker)
+            groups.setdefault(tuple(sorted(add_args.items())), []).append(Torrent.read(torrent_path))
+
+        if meta['debug']:
+            console.print(f"[bold green]Adding {sum(len(torrents) for torrents in groups.values())} torrent(s) to qbit in {len(groups)} call(s)")
+        for add_args, torrents in groups.items():
+            await self.qbit_add_torrents(torrents, client, meta, dict(add_args))
+
     async def find_existing_torrent(self, meta):
         if meta.get('client', None) is None:
             default_torrent_client = self.config['DEFAULT']['default_torrent_client']
@@ -97,17 +198,10 @@ class Clients():
                     console.print(f"[yellow]Fetching .torrent file from qBittorrent for hash: {hash_value}")
 
                     try:
-                        qbt_client = qbittorrentapi.Client(
-                            host=client['qbit_url'],
-                            port=client['qbit_port'],
-                            username=client['qbit_user'],
-                            password=client['qbit_pass'],
-                            VERIFY_WEBUI_CERTIFICATE=client.get('VERIFY_WEBUI_CERTIFICATE', True)
-                        )
-                        qbt_client.auth_log_in()
+                        qbt_client = await get_qbit_session(client)
 
                         # Retrieve the .torrent file
-                        torrent_file_content = qbt_client.torrents_export(torrent_hash=hash_value)
+                        torrent_file_content = await qbt_client.call('torrents_export', torrent_hash=hash_value)
                         if not torrent_file_content:
                             console.print(f"[bold red]qBittorrent returned an empty response for hash {hash_value}")
                             continue  # Skip to the next hash
@@ -280,6 +374,10 @@ class Clients():
                     console.print(f'[bold red]Error checking reuse torrent: {e}')
                     valid = False
 
+            verify_samples = int(self.config['DEFAULT'].get('verify_reuse_pieces', 0))
+            if valid and verify_samples > 0:
+                valid = await self.verify_reuse_torrent(meta, reuse_torrent, verify_samples)
+
             if meta['debug']:
                 console.log(f"Final validity after piece checks: valid={valid}")
         else:
@@ -287,6 +385,36 @@ class Clients():
 
         return valid, torrent_path
 
+    async def verify_reuse_torrent(self, meta, torrent, samples):
+        """Hash a random sample of the torrent's pieces (and the edges of every file) against the local files."""
+        files = []
+        content_root = meta['path'].rstrip(os.sep)
+        for file in torrent.files:
+            parts = PurePath(str(file)).parts
+            if len(torrent.files) == 1 and len(meta['filelist']) == 1:
+                local_file = meta['filelist'][0]
+            elif os.path.basename(content_root) == torrent.name:
+                local_file = os.path.join(os.path.dirname(content_root), *parts)
+            else:
+                local_file = os.path.join(content_root, *parts[1:])
+            files.append((local_file, file.size))
+
+        start = time.time()
+        threads = int(self.config['DEFAULT'].get('hash_threads', 0)) or None
+        try:
+            checked, failed = await asyncio.to_thread(
+                verify_pieces, files, torrent.piece_size, torrent.metainfo['info']['pieces'], samples, threads
+            )
+        except OSError as e:
+            console.print(f"[bold red]Unable to verify pieces of the existing torrent: {e}")
+            return False
+        if meta['debug']:
+            console.log(f"Verified {checked} of {torrent.pieces} pieces in {time.time() - start:.2f}s, {len(failed)} mismatched")
+        if failed:
+            console.print(f"[bold red]Existing torrent does not match the local files (piece {failed[0]}), regenerating")
+            return False
+        return True
+
     async def search_qbit_for_torrent(self, meta, client):
         mtv_config = self.config['TRACKERS'].get('MTV')
         if isinstance(mtv_config, dict):
@@ -303,14 +431,7 @@ class Clients():
             return None
 
         try:
-            qbt_client = qbittorrentapi.Client(
-                host=client['qbit_url'],
-                port=client['qbit_port'],
-                username=client['qbit_user'],
-                password=client['qbit_pass'],
-                VERIFY_WEBUI_CERTIFICATE=client.get('VERIFY_WEBUI_CERTIFICATE', True)
-            )
-            qbt_client.auth_log_in()
+            qbt_client = await get_qbit_session(client)
 
         except qbittorrentapi.LoginFailed:
             console.print("[bold red]INCORRECT QBIT LOGIN CREDENTIALS")
@@ -322,30 +443,31 @@ class Clients():
         # Ensure extracted torrent directory exists
         os.makedirs(extracted_torrent_dir, exist_ok=True)
 
-        # **Step 1: Find correct torrents using content_path**
+        # **Step 1: Find correct torrents by content name in the local torrent index**
         best_match = None
         matching_torrents = []
+        client_key = torrent_storage_dir or f"{client['qbit_url']}:{client['qbit_port']}"
+        index = TorrentIndex(meta['base_dir'])
+        try:
+            if torrent_storage_dir:
+                await asyncio.to_thread(index.refresh_storage, client_key, torrent_storage_dir, meta['debug'])
+            else:
+                await asyncio.to_thread(index.refresh_qbit, client_key, qbt_client, meta['debug'])
+        except Exception as e:
+            console.print(f"[yellow]Unable to refresh the torrent index, using cached entries: {e}")
 
-        for torrent in qbt_client.torrents.info():
-            try:
-                torrent_path = torrent.name
-            except AttributeError:
-                continue  # Ignore torrents with missing attributes
-
+        # The index only narrows the candidates down by name (and file count for a single file), is_valid_torrent decides
+        for row in await asyncio.to_thread(index.find, client_key, meta['uuid']):
             if meta['is_disc'] in ("", None) and len(meta['filelist']) == 1:
-                if torrent_path != meta['uuid'] or len(torrent.files) != len(meta['filelist']):
+                files = await asyncio.to_thread(index.get_files, client_key, row, qbt_client)
+                if files is None or len(files) != len(meta['filelist']):
                     continue
 
-            elif meta['uuid'] != torrent_path:
-                continue
-
             if meta['debug']:
-                console.print(f"[cyan]Matched Torrent: {torrent.hash}")
-                console.print(f"Name: {torrent.name}")
-                console.print(f"Save Path: {torrent.save_path}")
-                console.print(f"Content Path: {torrent_path}")
+                console.print(f"[cyan]Matched Torrent: {row['hash']}")
+                console.print(f"Name: {row['name']}")
 
-            matching_torrents.append({'hash': torrent.hash, 'name': torrent.name})
+            matching_torrents.append({'hash': row['hash'], 'name': row['name']})
 
         if not matching_torrents:
             console.print("[yellow]No matching torrents found in qBittorrent.")
@@ -370,6 +492,7 @@ class Clients():
                     torrent_file_path = os.path.join(torrent_storage_dir, f"{torrent_hash}.torrent")
                     if not os.path.exists(torrent_file_path):
                         console.print(f"[yellow]Torrent file not found in storage directory: {torrent_file_path}")
+                        index.remove(client_key, torrent_hash)
                         continue
                 else:
                     # **Fetch from qBittorrent API if no `torrent_storage_dir`**
@@ -377,7 +500,7 @@ class Clients():
                         console.print(f"[cyan]Exporting .torrent file for {torrent_hash}")
 
                     try:
-                        torrent_file_content = qbt_client.torrents_export(torrent_hash=torrent_hash)
+                        torrent_file_content = await qbt_client.call('torrents_export', torrent_hash=torrent_hash)
                         torrent_file_path = os.path.join(extracted_torrent_dir, f"{torrent_hash}.torrent")
 
                         with open(torrent_file_path, "wb") as f:
@@ -387,6 +510,7 @@ class Clients():
 
                     except qbittorrentapi.APIError as e:
                         console.print(f"[bold red]Failed to export .torrent for {torrent_hash}: {e}")
+                        index.remove(client_key, torrent_hash)
                         continue  # Skip this torrent if unable to fetch
 
                 # **Validate the .torrent file**
@@ -467,6 +591,11 @@ class Clients():
         return
 
     async def qbittorrent(self, path, torrent, local_path, remote_path, client, is_disc, filelist, meta, tracker):
+        add_args = self.qbit_add_args(path, local_path, remote_path, client, filelist, meta, tracker)
+        await self.qbit_add_torrents([torrent], client, meta, add_args)
+
+    def qbit_add_args(self, path, local_path, remote_path, client, filelist, meta, tracker):
+        """Link the content for tracker if configured and work out the torrents_add save options."""
         if meta.get('keep_folder'):
             path = os.path.dirname(path)
         else:
@@ -626,24 +755,6 @@ class Clients():
                         console.print(f"[bold red]{error_msg}")
                         raise OSError(error_msg)
 
-        # Initialize qBittorrent client
-        qbt_client = qbittorrentapi.Client(
-            host=client['qbit_url'],
-            port=client['qbit_port'],
-            username=client['qbit_user'],
-            password=client['qbit_pass'],
-            VERIFY_WEBUI_CERTIFICATE=client.get('VERIFY_WEBUI_CERTIFICATE', True)
-        )
-
-        if meta['debug']:
-            console.print("[bold yellow]Adding and rechecking torrent")
-
-        try:
-            qbt_client.auth_log_in()
-        except qbittorrentapi.LoginFailed:
-            console.print("[bold red]INCORRECT QBIT LOGIN CREDENTIALS")
-            return
-
         # Apply remote pathing to `tracker_dir` before assigning `save_path`
         if use_symlink or use_hardlink:
             save_path = tracker_dir  # Default to linked directory
@@ -701,40 +812,58 @@ class Clients():
         if meta['debug']:
             console.print(f"Content Layout: {content_layout}")
 
+        return {
+            'save_path': save_path,
+            'use_auto_torrent_management': auto_management,
+            'content_layout': content_layout,
+            'category': qbt_category,
+        }
+
+    async def qbit_add_torrents(self, torrents, client, meta, add_args):
+        """Add torrents to qBittorrent in one torrents_add call, then resume and tag them."""
+        if meta['debug']:
+            console.print("[bold yellow]Adding and rechecking torrent")
+
+        try:
+            qbt_client = await get_qbit_session(client)
+        except qbittorrentapi.LoginFailed:
+            console.print("[bold red]INCORRECT QBIT LOGIN CREDENTIALS")
+            return
+
+        save_path = add_args['save_path']
         console.print(f"[bold yellow]qBittorrent save path: {save_path}")
+        infohashes = list(dict.fromkeys(torrent.infohash for torrent in torrents))
 
         try:
-            qbt_client.torrents_add(
-                torrent_files=torrent.dump(),
-                save_path=save_path,
-                use_auto_torrent_management=auto_management,
+            await qbt_client.call(
+                'torrents_add',
+                torrent_files=[torrent.dump() for torrent in torrents],
                 is_skip_checking=True,
-                content_layout=content_layout,
-                category=qbt_category
+                **add_args
             )
         except qbittorrentapi.APIConnectionError as e:
             console.print(f"[red]Failed to add torrent: {e}")
             return
 
-        # Wait for torrent to be added
+        # Wait for torrents to be added
         timeout = 30
         for _ in range(timeout):
-            if len(qbt_client.torrents_info(torrent_hashes=torrent.infohash)) > 0:
+            if len(await qbt_client.call('torrents_info', torrent_hashes=infohashes)) >= len(infohashes):
                 break
             await asyncio.sleep(1)
         else:
             console.print("[red]Torrent addition timed out.")
             return
 
-        # Resume and tag torrent
-        qbt_client.torrents_resume(torrent.infohash)
+        # Resume and tag torrents
+        await qbt_client.call('torrents_resume', torrent_hashes=infohashes)
         if client.get('qbit_tag'):
-            qbt_client.torrents_add_tags(tags=client['qbit_tag'], torrent_hashes=torrent.infohash)
+            await qbt_client.call('torrents_add_tags', tags=client['qbit_tag'], torrent_hashes=infohashes)
         if meta.get('qbit_tag'):
-            qbt_client.torrents_add_tags(tags=meta['qbit_tag'], torrent_hashes=torrent.infohash)
+            await qbt_client.call('torrents_add_tags', tags=meta['qbit_tag'], torrent_hashes=infohashes)
 
         if meta['debug']:
-            info = qbt_client.torrents_info(torrent_hashes=torrent.infohash)
+            info = await qbt_client.call('torrents_info', torrent_hashes=infohashes)
             console.print(f"[cyan]Actual qBittorrent save path: {info[0].save_path}")
 
         if meta['debug']:
@@ -876,22 +1005,14 @@ class Clients():
     async def get_ptp_from_hash(self, meta):
         default_torrent_client = self.config['DEFAULT']['default_torrent_client']
         client = self.config['TORRENT_CLIENTS'][default_torrent_client]
-        qbt_client = qbittorrentapi.Client(
-            host=client['qbit_url'],
-            port=client['qbit_port'],
-            username=client['qbit_user'],
-            password=client['qbit_pass'],
-            VERIFY_WEBUI_CERTIFICATE=client.get('VERIFY_WEBUI_CERTIFICATE', True)
-        )
-
         try:
-            qbt_client.auth_log_in()
+            qbt_client = await get_qbit_session(client)
         except qbittorrentapi.LoginFailed as e:
             console.print(f"[bold red]Login failed while trying to get info hash: {e}")
             exit(1)
 
         info_hash_v1 = meta.get('infohash')
-        torrents = qbt_client.torrents_info()
+        torrents = await qbt_client.call('torrents_info')
         found = False
 
         extracted_torrent_dir = os.path.join(meta.get('base_dir', ''), "tmp", meta.get('uuid', ''))
@@ -948,7 +1069,7 @@ class Clients():
                         console.print(f"[cyan]Exporting .torrent file for hash: {torrent_hash}")
 
                     try:
-                        torrent_file_content = qbt_client.torrents_export(torrent_hash=torrent_hash)
+                        torrent_file_content = await qbt_client.call('torrents_export', torrent_hash=torrent_hash)
                         torrent_file_path = os.path.join(extracted_torrent_dir, f"{torrent_hash}.torrent")
 
                         with open(torrent_file_path, "wb") as f:
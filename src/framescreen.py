@@ -0,0 +1,116 @@
+import asyncio
+import ffmpeg
+import numpy as np
+from src.console import console
+
+# Frames are scored on a small raw RGB copy, the full size PNG is only encoded for frames that pass
+SCORE_WIDTH = 320
+SCORE_HEIGHT = 180
+# Frames decoded per ffmpeg process
+SCORE_BATCH = 8
+# Rejection thresholds on 0-255 luma
+MIN_MEAN_LUMA = 16
+MAX_MEAN_LUMA = 240
+MIN_LUMA_STD = 6
+# Mean absolute luma difference below which two frames count as the same shot
+DUPLICATE_DIFF = 4
+REPICK_ROUNDS = 3
+
+LUMA_WEIGHTS = np.array([0.2126, 0.7152, 0.0722], dtype=np.float32)
+
+
+async def grab_frames(path, times, seek_options, loglevel='quiet'):
+    """
+    Decode one frame per time into a (len(times), SCORE_HEIGHT, SCORE_WIDTH) float32 luma array.
+    Every time is a seeked input of one ffmpeg process whose scaled frames are concatenated to stdout as raw RGB.
+    Returns None if ffmpeg fails or returns fewer frames than asked for.
+    """
+    streams = [
+        ffmpeg.input(path, ss=max(ss_time, 0), **seek_options)['v:0']
+        .filter('scale', SCORE_WIDTH, SCORE_HEIGHT)
+        .filter('setsar', 1)
+        .filter('trim', end_frame=1)
+        for ss_time in times
+    ]
+    stream = streams[0] if len(streams) == 1 else ffmpeg.concat(*streams, v=1, a=0)
+    command = stream.output('pipe:', format='rawvideo', pix_fmt='rgb24').global_args('-loglevel', loglevel)
+    process = await asyncio.create_subprocess_exec(
+        *command.compile(),
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+    try:
+        stdout, stderr = await process.communicate()
+    except asyncio.CancelledError:
+        process.kill()
+        raise
+
+    frame_bytes = SCORE_WIDTH * SCORE_HEIGHT * 3
+    if process.returncode != 0 or len(stdout) < frame_bytes * len(times):
+        return None
+    frames = np.frombuffer(stdout, dtype=np.uint8, count=frame_bytes * len(times))
+    frames = frames.reshape(len(times), SCORE_HEIGHT, SCORE_WIDTH, 3).astype(np.float32)
+    return frames @ LUMA_WEIGHTS
+
+
+def reject_reason(luma, accepted):
+    """Why a frame should not be used as a screenshot, or None if it is fine."""
+    mean = float(luma.mean())
+    if mean < MIN_MEAN_LUMA:
+        return f"too dark (mean luma {mean:.1f})"
+    if mean > MAX_MEAN_LUMA:
+        return f"too bright (mean luma {mean:.1f})"
+    std = float(luma.std())
+    if std < MIN_LUMA_STD:
+        return f"flat (luma deviation {std:.1f})"
+    for other in accepted:
+        if float(np.abs(luma - other).mean()) < DUPLICATE_DIFF:
+            return "near duplicate of another frame"
+    return None
+
+
+async def screen_frame_times(path, times, wanted, repick, seek_options, meta):
+    """
+    Score candidate times and return `wanted` of them showing usable, distinct frames.
+    Rejected frames are replaced with times from `await repick(accepted_times, count)` for up to REPICK_ROUNDS rounds,
+    after which the most detailed rejected frames fill any gap. Returns None if frames could not be decoded.
+    """
+    loglevel = 'verbose' if meta.get('ffdebug', False) else 'quiet'
+    accepted = {}
+    rejected = []
+    tried = set()
+    candidates = list(times)
+    for round_number in range(REPICK_ROUNDS + 1):
+        candidates = [ss_time for ss_time in candidates if ss_time not in tried]
+        if not candidates:
+            break
+        tried.update(candidates)
+        batches = [candidates[i:i + SCORE_BATCH] for i in range(0, len(candidates), SCORE_BATCH)]
+        lumas = await asyncio.gather(*[grab_frames(path, batch, seek_options, loglevel) for batch in batches])
+        if any(luma is None for luma in lumas):
+            if meta['debug']:
+                console.print("[yellow]Unable to decode frames for screening, using unscreened frames")
+            return None
+
+        for ss_time, luma in zip(candidates, np.concatenate(lumas)):
+            if len(accepted) >= wanted:
+                break
+            reason = reject_reason(luma, accepted.values())
+            if reason is None:
+                accepted[ss_time] = luma
+            else:
+                rejected.append((float(luma.std()), ss_time))
+                if meta['debug']:
+                    console.print(f"[yellow]Rejected frame at {ss_time:.3f}s: {reason}")
+
+        missing = wanted - len(accepted)
+        if missing <= 0 or round_number == REPICK_ROUNDS:
+            break
+        candidates = await repick(sorted(accepted), missing)
+
+    chosen = sorted(accepted)
+    if len(chosen) < wanted:
+        chosen += [ss_time for _, ss_time in sorted(rejected, reverse=True)[:wanted - len(chosen)]]
+    if meta['debug']:
+        console.print(f"[green]Frame screening: {len(accepted)} accepted, {len(rejected)} rejected")
+    return sorted(chosen)
@@ -0,0 +1,204 @@
+import os
+import re
+import json
+import time
+import sqlite3
+import asyncio
+import hashlib
+import httpx
+from contextlib import contextmanager
+from urllib.parse import urlencode
+from src.console import console
+from data.config import config
+
+DAY = 24 * 60 * 60
+
+# (endpoint name, method, URL pattern, seconds a successful response stays fresh), first match wins
+CACHE_RULES = [
+    ("tmdb_search", "GET", re.compile(r"^https://api\.themoviedb\.org/3/search/"), DAY),
+    ("tmdb_find", "GET", re.compile(r"^https://api\.themoviedb\.org/3/find/"), 7 * DAY),
+    ("tmdb_episode", "GET", re.compile(r"^https://api\.themoviedb\.org/3/tv/\d+/season/"), 2 * DAY),
+    ("tmdb", "GET", re.compile(r"^https://api\.themoviedb\.org/3/"), 7 * DAY),
+    ("imdb", "POST", re.compile(r"^https://api\.graphql\.imdb\.com/"), 7 * DAY),
+    ("tvmaze", "GET", re.compile(r"^https://api\.tvmaze\.com/"), DAY),
+    ("srrdb_file", "GET", re.compile(r"^https://www\.srrdb\.com/download/"), 30 * DAY),
+    ("srrdb", "GET", re.compile(r"^https://api\.srrdb\.com/"), DAY),
+]
+# Seconds a "not found" answer is cached, so a missing title is not asked for again on every queued item
+NEGATIVE_TTL = 60 * 60
+NEGATIVE_STATUS = {404, 410}
+# Query parameters left out of cache keys (and never stored)
+IGNORED_PARAMS = {"api_key"}
+# Headers dropped from stored responses, the stored body is already decoded
+DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection", "set-cookie"}
+
+_cache = None
+_stats = {}
+
+
+def _endpoint_rule(request):
+    url = str(request.url.copy_with(query=None))
+    for name, method, pattern, ttl in CACHE_RULES:
+        if request.method == method and pattern.match(url):
+            return name, ttl
+    return None
+
+
+def cache_key(request):
+    """Hash of the method, URL without ignored parameters (sorted) and body (JSON with sorted keys)."""
+    params = sorted((key, value) for key, value in request.url.params.multi_items() if key not in IGNORED_PARAMS)
+    body = request.content or b""
+    if body:
+        try:
+            body = json.dumps(json.loads(body), sort_keys=True, separators=(",", ":")).encode()
+        except ValueError:
+            pass
+    url = str(request.url.copy_with(query=urlencode(params).encode() or None))
+    return hashlib.sha256(request.method.encode() + b" " + url.encode() + b"\n" + body).hexdigest()
+
+
+class HTTPCache:
+    """
+    Persistent SQLite store of metadata API responses (TMDB, IMDb, TVmaze, srrdb) shared by all items and runs.
+    Entries expire per endpoint (CACHE_RULES) and the least recently used ones are evicted above max_bytes.
+    """
+
+    def __init__(self, db_path, max_bytes):
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+        with self._connect() as db:
+            db.execute("""
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    endpoint TEXT,
+                    status INTEGER,
+                    headers TEXT,
+                    body BLOB,
+                    size INTEGER,
+                    expires_at REAL,
+                    accessed_at REAL
+                )
+            """)
+            db.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at)")
+
+    @contextmanager
+    def _connect(self):
+        db = sqlite3.connect(self.db_path, timeout=30)
+        db.row_factory = sqlite3.Row
+        try:
+            with db:
+                yield db
+        finally:
+            db.close()
+
+    def get(self, key):
+        now = time.time()
+        with self._connect() as db:
+            row = db.execute("SELECT status, headers, body, expires_at FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            if row['expires_at'] < now:
+                db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+            db.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            return row['status'], json.loads(row['headers']), row['body']
+
+    def put(self, key, endpoint, status, headers, body, ttl):
+        now = time.time()
+        with self._connect() as db:
+            db.execute(
+                "INSERT OR REPLACE INTO responses (key, endpoint, status, headers, body, size, expires_at, accessed_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, endpoint, status, json.dumps(headers), body, len(body), now + ttl, now)
+            )
+            self._evict(db)
+
+    def _evict(self, db):
+        total = db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        db.execute("DELETE FROM responses WHERE expires_at < ?", (time.time(),))
+        target = self.max_bytes * 0.9
+        total = db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        for row in db.execute("SELECT key, size FROM responses ORDER BY accessed_at").fetchall():
+            if total <= target:
+                break
+            db.execute("DELETE FROM responses WHERE key = ?", (row['key'],))
+            total -= row['size']
+
+
+def get_http_cache():
+    """The shared response cache, or None when http_cache is disabled in the config."""
+    global _cache
+    if not config['DEFAULT'].get('http_cache', True):
+        return None
+    if _cache is None:
+        data_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+        max_bytes = int(float(config['DEFAULT'].get('http_cache_size', 64)) * 1024 * 1024)
+        _cache = HTTPCache(os.path.join(data_dir, "http_cache.db"), max_bytes)
+    return _cache
+
+
+def _count(endpoint, outcome):
+    counts = _stats.setdefault(endpoint, {'hit': 0, 'miss': 0, 'stored': 0})
+    counts[outcome] += 1
+
+
+class CachedTransport(httpx.AsyncBaseTransport):
+    """
+    httpx transport answering cacheable metadata requests from the HTTP cache and storing fresh responses,
+    so modules only swap httpx.AsyncClient() for cached_client(). Successful responses are kept for their
+    endpoint's TTL, 404/410 for NEGATIVE_TTL; errors and everything else pass straight through.
+    """
+
+    def __init__(self, **kwargs):
+        self.transport = httpx.AsyncHTTPTransport(**kwargs)
+
+    async def handle_async_request(self, request):
+        cache = get_http_cache()
+        rule = _endpoint_rule(request) if cache is not None else None
+        if rule is None:
+            return await self.transport.handle_async_request(request)
+
+        endpoint, ttl = rule
+        key = cache_key(request)
+        try:
+            cached = await asyncio.to_thread(cache.get, key)
+        except sqlite3.Error:
+            cached = None
+        if cached is not None:
+            _count(endpoint, 'hit')
+            status, headers, body = cached
+            return httpx.Response(status, headers=headers, content=body, request=request)
+
+        _count(endpoint, 'miss')
+        response = await self.transport.handle_async_request(request)
+        if response.status_code != 200 and response.status_code not in NEGATIVE_STATUS:
+            return response
+        try:
+            # Read through a client-level response so the stored body is already decoded
+            body = await httpx.Response(response.status_code, headers=response.headers, stream=response.stream, request=request).aread()
+        finally:
+            await response.aclose()
+        headers = [(name, value) for name, value in response.headers.items() if name.lower() not in DROPPED_HEADERS]
+        try:
+            await asyncio.to_thread(
+                cache.put, key, endpoint, response.status_code, headers, body,
+                ttl if response.status_code == 200 else NEGATIVE_TTL
+            )
+            _count(endpoint, 'stored')
+        except sqlite3.Error as e:
+            console.print(f"[yellow]Unable to update the HTTP cache: {e}")
+        return httpx.Response(response.status_code, headers=headers, content=body, request=request)
+
+    async def aclose(self):
+        await self.transport.aclose()
+
+
+def cached_client(**kwargs):
+    """httpx.AsyncClient whose metadata API requests go through the HTTP cache."""
+    return httpx.AsyncClient(transport=CachedTransport(), **kwargs)
+
+
+def report_http_cache():
+    for endpoint, counts in sorted(_stats.items()):
+        console.print(f"[cyan]HTTP cache {endpoint}: {counts['hit']} hits, {counts['miss']} misses, {counts['stored']} stored")
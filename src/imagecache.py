@@ -0,0 +1,134 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import asyncio
+import httpx
+from contextlib import contextmanager
+from src.console import console
+
+# Seconds allowed for the liveness check of a cached image URL
+LIVENESS_TIMEOUT = 10
+
+_caches = {}
+
+
+def file_digest(path):
+    """SHA-256 of a file's bytes, read in 1 MiB chunks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def files_digest(paths, extra=""):
+    """
+    Digest of a set of files, independent of their order (used for gallery style uploads).
+    extra mixes in anything else that shapes the upload, such as gallery form fields.
+    """
+    return hashlib.sha256(("".join(sorted(file_digest(path) for path in paths)) + extra).encode()).hexdigest()
+
+
+class ImageCache:
+    """
+    Persistent SQLite cache of uploaded images, keyed by the SHA-256 of the image bytes and the image host,
+    so byte-identical screenshots, posters and galleries are uploaded to a host once across items, trackers and runs.
+    """
+
+    def __init__(self, base_dir):
+        self.db_path = os.path.join(base_dir, "data", "image_cache.db")
+        with self._connect() as db:
+            db.execute("""
+                CREATE TABLE IF NOT EXISTS uploads (
+                    digest TEXT NOT NULL,
+                    host TEXT NOT NULL,
+                    urls TEXT NOT NULL,
+                    uploaded_at REAL,
+                    checked_at REAL,
+                    PRIMARY KEY (digest, host)
+                )
+            """)
+
+    @contextmanager
+    def _connect(self):
+        db = sqlite3.connect(self.db_path, timeout=30)
+        db.row_factory = sqlite3.Row
+        try:
+            with db:
+                yield db
+        finally:
+            db.close()
+
+    def get(self, digest, host):
+        with self._connect() as db:
+            row = db.execute("SELECT urls, checked_at FROM uploads WHERE digest = ? AND host = ?", (digest, host)).fetchone()
+        if row is None:
+            return None
+        return json.loads(row['urls']), row['checked_at']
+
+    def put(self, digest, host, urls):
+        now = time.time()
+        with self._connect() as db:
+            db.execute(
+                "INSERT OR REPLACE INTO uploads (digest, host, urls, uploaded_at, checked_at) VALUES (?, ?, ?, ?, ?)",
+                (digest, host, json.dumps(urls), now, now)
+            )
+
+    def touch(self, digest, host):
+        with self._connect() as db:
+            db.execute("UPDATE uploads SET checked_at = ? WHERE digest = ? AND host = ?", (time.time(), digest, host))
+
+    def remove(self, digest, host):
+        with self._connect() as db:
+            db.execute("DELETE FROM uploads WHERE digest = ? AND host = ?", (digest, host))
+
+
+def get_image_cache(base_dir, config):
+    """The image cache of base_dir, or None when image_cache is disabled in the config."""
+    if not config['DEFAULT'].get('image_cache', True):
+        return None
+    if base_dir not in _caches:
+        _caches[base_dir] = ImageCache(base_dir)
+    return _caches[base_dir]
+
+
+async def url_is_alive(url):
+    try:
+        async with httpx.AsyncClient(timeout=LIVENESS_TIMEOUT, follow_redirects=True) as client:
+            response = await client.head(url)
+            return response.status_code == 200
+    except httpx.HTTPError:
+        return False
+
+
+async def get_cached_upload(cache, digest, host, config, debug=False):
+    """
+    URLs of an earlier upload of these bytes to host, or None. Entries last checked more than image_cache_ttl days ago
+    are checked to still be online first (by their raw_url) and dropped if they are not; a ttl of 0 never checks.
+    """
+    try:
+        cached = await asyncio.to_thread(cache.get, digest, host)
+        if cached is None:
+            return None
+        urls, checked_at = cached
+        ttl = float(config['DEFAULT'].get('image_cache_ttl', 0) or 0) * 24 * 60 * 60
+        if ttl > 0 and urls.get('raw_url') and time.time() - (checked_at or 0) > ttl:
+            if not await url_is_alive(urls['raw_url']):
+                if debug:
+                    console.print(f"[yellow]Cached image {urls['raw_url']} is no longer online, uploading again")
+                await asyncio.to_thread(cache.remove, digest, host)
+                return None
+            await asyncio.to_thread(cache.touch, digest, host)
+        return urls
+    except sqlite3.Error as e:
+        console.print(f"[yellow]Unable to read the image cache: {e}")
+        return None
+
+
+async def store_upload(cache, digest, host, urls):
+    try:
+        await asyncio.to_thread(cache.put, digest, host, urls)
+    except sqlite3.Error as e:
+        console.print(f"[yellow]Unable to update the image cache: {e}")
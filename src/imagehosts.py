@@ -0,0 +1,375 @@
+import os
+import json
+import time
+import base64
+import asyncio
+import httpx
+import pyimgbox
+from email.utils import parsedate_to_datetime
+from src.console import console
+from src.imagecache import get_image_cache, get_cached_upload, store_upload, file_digest
+
+UPLOAD_TIMEOUT = 60
+
+# Highest concurrent uploads per image host, the limit starts here and is halved whenever the host pushes back
+HOST_UPLOAD_LIMITS = {"oeimg": 6, "ptscreens": 1, "lensdump": 1}
+# Hosts not listed above start at DEFAULT_HOST_LIMIT and may grow up to MAX_HOST_LIMIT
+DEFAULT_HOST_LIMIT = 8
+MAX_HOST_LIMIT = 20
+# Seconds a throttled host is left alone when it sends no Retry-After
+DEFAULT_BACKOFF = 5
+# Tries per image on one host, only throttled attempts (429, 5xx, timeouts) are repeated
+UPLOAD_ATTEMPTS = 2
+
+# One pooled client and limiter per image host, reused by every upload of the run
+_clients = {}
+_limiters = {}
+_learned_limits = None
+_limits_path = None
+
+
+class HostThrottled(Exception):
+    def __init__(self, status_code, retry_after=None):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+def parse_retry_after(value):
+    """Seconds to wait from a Retry-After header (delay-seconds or HTTP date), or None."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0)
+    except (TypeError, ValueError):
+        return None
+
+
+async def _raise_for_throttle(response):
+    if response.status_code == 429 or response.status_code >= 500:
+        raise HostThrottled(response.status_code, parse_retry_after(response.headers.get('Retry-After')))
+
+
+def get_client(img_host):
+    """Shared httpx client for img_host, recreated if it was made on another event loop or closed."""
+    loop = asyncio.get_running_loop()
+    client, client_loop = _clients.get(img_host, (None, None))
+    if client is None or client_loop is not loop or client.is_closed:
+        client = httpx.AsyncClient(
+            timeout=UPLOAD_TIMEOUT,
+            limits=httpx.Limits(max_connections=MAX_HOST_LIMIT, max_keepalive_connections=10),
+            event_hooks={'response': [_raise_for_throttle]}
+        )
+        _clients[img_host] = (client, loop)
+    return client
+
+
+class HostLimiter:
+    """
+    AIMD concurrency limit of one image host: every successful upload adds 1/limit (about one more
+    slot per window of uploads) up to max_limit, a throttled one halves the limit and pauses the host
+    for its Retry-After. Only the first throttled response of a burst lowers the limit.
+    """
+
+    def __init__(self, img_host, limit, max_limit):
+        self.img_host = img_host
+        self.max_limit = max_limit
+        self.limit = float(min(max(limit, 1), max_limit))
+        self.active = 0
+        self.blocked_until = 0
+        self.condition = asyncio.Condition()
+
+    async def acquire(self):
+        async with self.condition:
+            while True:
+                wait = self.blocked_until - time.monotonic()
+                if wait <= 0 and self.active < int(self.limit):
+                    break
+                try:
+                    await asyncio.wait_for(self.condition.wait(), timeout=wait if wait > 0 else None)
+                except asyncio.TimeoutError:
+                    pass
+            self.active += 1
+
+    async def release(self, outcome, retry_after=None, debug=False):
+        async with self.condition:
+            self.active -= 1
+            now = time.monotonic()
+            if outcome == 'throttled':
+                if now >= self.blocked_until:
+                    self.limit = max(1.0, self.limit / 2)
+                    if debug:
+                        console.print(f"[yellow]{self.img_host} is throttling, concurrency lowered to {int(self.limit)}")
+                self.blocked_until = max(self.blocked_until, now + (retry_after if retry_after is not None else DEFAULT_BACKOFF))
+            elif outcome == 'success':
+                self.limit = min(float(self.max_limit), self.limit + 1 / self.limit)
+            self.condition.notify_all()
+
+
+def _load_learned_limits(base_dir):
+    global _learned_limits, _limits_path
+    if _learned_limits is not None:
+        return _learned_limits
+    _limits_path = os.path.join(base_dir, "data", "image_host_limits.json")
+    try:
+        with open(_limits_path, encoding='utf-8') as f:
+            _learned_limits = json.load(f)
+    except (OSError, ValueError):
+        _learned_limits = {}
+    return _learned_limits
+
+
+def get_limiter(img_host, base_dir):
+    """Limiter of img_host, starting from the limit learned by earlier runs (kept in data/image_host_limits.json)."""
+    loop = asyncio.get_running_loop()
+    limiter, limiter_loop = _limiters.get(img_host, (None, None))
+    if limiter is None or limiter_loop is not loop:
+        max_limit = HOST_UPLOAD_LIMITS.get(img_host, MAX_HOST_LIMIT)
+        start = _load_learned_limits(base_dir).get(img_host, HOST_UPLOAD_LIMITS.get(img_host, DEFAULT_HOST_LIMIT))
+        limiter = HostLimiter(img_host, start, max_limit)
+        _limiters[img_host] = (limiter, loop)
+    return limiter
+
+
+def save_learned_limits():
+    if _limits_path is None or not _limiters:
+        return
+    learned = dict(_learned_limits or {})
+    learned.update({img_host: max(int(limiter.limit), 1) for img_host, (limiter, _) in _limiters.items()})
+    try:
+        with open(_limits_path, 'w', encoding='utf-8') as f:
+            json.dump(learned, f, indent=4)
+    except OSError:
+        pass
+
+
+async def close_clients():
+    save_learned_limits()
+    for client, client_loop in list(_clients.values()):
+        if client_loop is asyncio.get_running_loop() and not client.is_closed:
+            await client.aclose()
+    _clients.clear()
+
+
+def upload_success(image, img_url, raw_url, web_url):
+    """Result of every uploader: the image URLs on success, or {'status': 'failed', 'reason': ...}."""
+    return {
+        'status': 'success',
+        'img_url': img_url,
+        'raw_url': raw_url,
+        'web_url': web_url,
+        'local_file_path': image
+    }
+
+
+def upload_failure(reason):
+    return {'status': 'failed', 'reason': reason}
+
+
+async def upload_ptpimg(client, image, config, meta):
+    with open(image, 'rb') as f:
+        response = await client.post(
+            "https://ptpimg.me/upload.php",
+            headers={'referer': 'https://ptpimg.me/index.php'},
+            data={'format': 'json', 'api_key': config['DEFAULT']['ptpimg_api']},
+            files=[('file-upload[0]', (os.path.basename(image), f, 'image/png'))]
+        )
+    response.raise_for_status()
+    response_data = response.json()
+    if not response_data or not isinstance(response_data, list) or 'code' not in response_data[0]:
+        return upload_failure("Invalid JSON response from ptpimg")
+    img_url = f"https://ptpimg.me/{response_data[0]['code']}.{response_data[0]['ext']}"
+    return upload_success(image, img_url, img_url, img_url)
+
+
+async def _upload_imgbb_api(client, image, url, api_key, name, meta):
+    with open(image, 'rb') as f:
+        response = await client.post(url, data={'key': api_key}, files={'image': (os.path.basename(image), f, 'image/png')})
+    response_data = response.json()
+    if response.status_code != 200 or not response_data.get('success'):
+        console.print(f"[yellow]{name} failed, trying next image host")
+        return upload_failure(f"{name} upload failed")
+    img_url = response_data['data'].get('medium', {}).get('url') or response_data['data']['thumb']['url']
+    raw_url = response_data['data']['image']['url']
+    web_url = response_data['data']['url_viewer']
+    if meta['debug']:
+        console.print(f"[green]Image URLs: img_url={img_url}, raw_url={raw_url}, web_url={web_url}")
+    return upload_success(image, img_url, raw_url, web_url)
+
+
+async def upload_imgbb(client, image, config, meta):
+    return await _upload_imgbb_api(client, image, "https://api.imgbb.com/1/upload", config['DEFAULT']['imgbb_api'], "imgbb", meta)
+
+
+async def upload_dalexni(client, image, config, meta):
+    return await _upload_imgbb_api(client, image, "https://dalexni.com/1/upload", config['DEFAULT']['dalexni_api'], "DALEXNI", meta)
+
+
+def _read_base64(image):
+    with open(image, 'rb') as f:
+        return base64.b64encode(f.read()).decode('utf8')
+
+
+async def upload_ptscreens(client, image, config, meta):
+    with open(image, 'rb') as f:
+        response = await client.post(
+            "https://ptscreens.com/api/1/upload",
+            headers={'X-API-Key': config['DEFAULT']['ptscreens_api']},
+            files={'source': (os.path.basename(image), f, 'image/png')}
+        )
+    response_data = response.json()
+    if response_data.get('status_code') != 200:
+        console.print("[yellow]ptscreens failed, trying next image host")
+        return upload_failure('ptscreens upload failed')
+    img_url = response_data['image']['medium']['url']
+    raw_url = response_data['image']['url']
+    web_url = response_data['image']['url_viewer']
+    if meta['debug']:
+        console.print(f"[green]Image URLs: img_url={img_url}, raw_url={raw_url}, web_url={web_url}")
+    return upload_success(image, img_url, raw_url, web_url)
+
+
+async def _upload_base64_api(client, image, url, api_key, name, meta):
+    # These hosts only take the image as a base64 form field, encoded off the event loop
+    data = {'image': await asyncio.to_thread(_read_base64, image)}
+    response = await client.post(url, data=data, headers={'X-API-Key': api_key})
+    response_data = response.json()
+    if response.status_code != 200 or response_data.get('status_code', 200) != 200 or not response_data.get('data'):
+        console.print(f"[yellow]{name} failed, trying next image host")
+        return upload_failure(f"{name} upload failed")
+    img_url = response_data['data']['image']['url']
+    web_url = response_data['data']['url_viewer']
+    if meta['debug']:
+        console.print(f"[green]Image URLs: img_url={img_url}, raw_url={img_url}, web_url={web_url}")
+    return upload_success(image, img_url, img_url, web_url)
+
+
+async def upload_oeimg(client, image, config, meta):
+    return await _upload_base64_api(client, image, "https://imgoe.download/api/1/upload", config['DEFAULT']['oeimg_api'], "OEimg", meta)
+
+
+async def upload_lensdump(client, image, config, meta):
+    return await _upload_base64_api(client, image, "https://lensdump.com/api/1/upload", config['DEFAULT']['lensdump_api'], "lensdump", meta)
+
+
+async def upload_pixhost(client, image, config, meta):
+    with open(image, 'rb') as f:
+        response = await client.post(
+            "https://api.pixhost.to/images",
+            data={'content_type': '0', 'max_th_size': 350},
+            files={'img': (os.path.basename(image), f, 'image/png')}
+        )
+    if response.status_code != 200:
+        return upload_failure(f"pixhost upload failed: {response.status_code}")
+    response_data = response.json()
+    img_url = response_data['th_url']
+    raw_url = img_url.replace('https://t', 'https://img').replace('/thumbs/', '/images/')
+    return upload_success(image, img_url, raw_url, response_data['show_url'])
+
+
+async def upload_zipline(client, image, config, meta):
+    url = config['DEFAULT'].get('zipline_url')
+    api_key = config['DEFAULT'].get('zipline_api_key')
+    if not url or not api_key:
+        console.print("[red]Error: Missing Zipline URL or API key in config.")
+        return upload_failure('Missing Zipline URL or API key')
+    with open(image, 'rb') as f:
+        response = await client.post(url, headers={'Authorization': f'{api_key}'}, files={'file': (os.path.basename(image), f, 'image/png')})
+    if response.status_code != 200:
+        return upload_failure(f"Zipline upload failed: {response.text}")
+    response_data = response.json()
+    if 'files' not in response_data:
+        return upload_failure('No valid URL returned from Zipline')
+    img_url = response_data['files'][0]
+    raw_url = img_url.replace('/u/', '/r/')
+    return upload_success(image, img_url, raw_url, raw_url)
+
+
+async def upload_imgbox(client, image, config, meta):
+    # pyimgbox manages its own session, but runs on the caller's event loop
+    async with pyimgbox.Gallery(thumb_width=350, square_thumbs=False) as gallery:
+        async for submission in gallery.add([image]):
+            if not submission['success']:
+                console.print(f"[red]Error uploading to imgbox: [yellow]{submission['error']}[/yellow][/red]")
+                return upload_failure(f"Imgbox upload failed: {submission['error']}")
+            web_url = submission.get('web_url')
+            img_url = submission.get('thumbnail_url')
+            raw_url = submission.get('image_url')
+            if web_url and img_url and raw_url:
+                return upload_success(image, img_url, raw_url, web_url)
+    return upload_failure("Imgbox upload failed. No valid URLs returned.")
+
+
+UPLOADERS = {
+    "ptpimg": upload_ptpimg,
+    "imgbb": upload_imgbb,
+    "dalexni": upload_dalexni,
+    "ptscreens": upload_ptscreens,
+    "oeimg": upload_oeimg,
+    "lensdump": upload_lensdump,
+    "pixhost": upload_pixhost,
+    "zipline": upload_zipline,
+    "imgbox": upload_imgbox,
+}
+
+
+async def upload_image(image, img_host, config, meta):
+    """
+    Upload one image file to img_host on the running event loop. The file is streamed from disk as a
+    multipart body over the host's pooled connection, within the host's adaptive concurrency limit.
+    Bytes already uploaded to img_host (by any item or run) are answered from the image cache instead.
+    Returns the upload_success/upload_failure dict, a success carries the host it landed on as 'img_host'.
+    """
+    uploader = UPLOADERS.get(img_host)
+    if uploader is None:
+        return upload_failure(f"Unsupported image host: {img_host}")
+    cache = get_image_cache(meta['base_dir'], config)
+    digest = None
+    if cache is not None:
+        try:
+            digest = await asyncio.to_thread(file_digest, image)
+            cached = await get_cached_upload(cache, digest, img_host, config, meta['debug'])
+        except OSError as e:
+            return upload_failure(str(e))
+        if cached is not None:
+            if meta['debug']:
+                console.print(f"[cyan]Reusing earlier {img_host} upload of {os.path.basename(image)}")
+            return dict(upload_success(image, cached['img_url'], cached['raw_url'], cached['web_url']), img_host=img_host)
+    limiter = get_limiter(img_host, meta['base_dir'])
+    for attempt in range(UPLOAD_ATTEMPTS):
+        await limiter.acquire()
+        outcome, retry_after = 'failed', None
+        try:
+            result = await uploader(get_client(img_host), image, config, meta)
+            outcome = result['status']
+        except HostThrottled as e:
+            outcome, retry_after = 'throttled', e.retry_after
+            result = upload_failure(f"{img_host} responded with {e}")
+        except httpx.TimeoutException:
+            outcome = 'throttled'
+            console.print("[red]Request timed out. The server took too long to respond.")
+            result = upload_failure('Request timed out')
+        except httpx.HTTPError as e:
+            console.print(f"[red]Request failed with error: {e}")
+            result = upload_failure(f"Request failed: {e}")
+        except (ValueError, KeyError, TypeError, IndexError) as e:
+            console.print(f"[red]Invalid response from {img_host}: {e}")
+            result = upload_failure(f"Invalid response from {img_host}")
+        except OSError as e:
+            result = upload_failure(str(e))
+        finally:
+            await limiter.release(outcome, retry_after, meta['debug'])
+        if outcome != 'throttled':
+            break
+        if meta['debug'] and attempt + 1 < UPLOAD_ATTEMPTS:
+            console.print(f"[yellow]Retrying {os.path.basename(image)} on {img_host}: {result['reason']}")
+    if result['status'] == 'success':
+        result['img_host'] = img_host
+        if digest is not None:
+            urls = {key: result[key] for key in ('img_url', 'raw_url', 'web_url')}
+            await store_upload(cache, digest, img_host, urls)
+    return result
@@ -2,6 +2,7 @@ from imdb import Cinemagoer
 from src.console import console
 import json
 import httpx
+from src.httpcache import cached_client
 from datetime import datetime
 
 
@@ -32,7 +33,7 @@ async def get_imdb_aka_api(imdb_id, manual_language=None):
         """
     }
 
-    async with httpx.AsyncClient() as client:
+    async with cached_client() as client:
         try:
             response = await client.post("https://api.graphql.imdb.com/", json=query, headers={"Content-Type": "application/json"}, timeout=10)
             response.raise_for_status()
@@ -195,7 +196,7 @@ async def get_imdb_info_api(imdbID, manual_language=None, debug=False):
         """
     }
 
-    async with httpx.AsyncClient() as client:
+    async with cached_client() as client:
         try:
             response = await client.post("https://api.graphql.imdb.com/", json=query, headers={"Content-Type": "application/json"}, timeout=10)
             response.raise_for_status()
@@ -0,0 +1,80 @@
+import os
+import json
+import bisect
+import asyncio
+import hashlib
+import ffmpeg
+from src.console import console
+
+# Points across the video (10% - 90%) whose surrounding packets are probed for keyframes
+KEYFRAME_PROBE_POINTS = 100
+# Seconds of packets read at each probe point, enough to cover at least one GOP on most encodes
+KEYFRAME_PROBE_WINDOW = 4
+
+
+def _probe_keyframes(path, length):
+    """
+    Demux-only ffprobe of short windows spread over the file, returning keyframe times in seconds
+    relative to the start of the file (the same reference ffmpeg's input -ss uses).
+    """
+    container = ffmpeg.probe(path, select_streams='v:0')['format']
+    length = length or float(container.get('duration', 0) or 0)
+    if length <= 0:
+        return []
+
+    start = float(container.get('start_time', 0) or 0)
+    points = [start + length * (0.1 + 0.8 * i / (KEYFRAME_PROBE_POINTS - 1)) for i in range(KEYFRAME_PROBE_POINTS)]
+    intervals = ",".join(f"{point:.3f}%+{KEYFRAME_PROBE_WINDOW}" for point in points)
+    probe = ffmpeg.probe(path, select_streams='v:0', read_intervals=intervals, show_entries='packet=pts_time,flags')
+
+    keyframes = set()
+    for packet in probe.get('packets', []):
+        if 'K' in packet.get('flags', '') and packet.get('pts_time') not in (None, 'N/A'):
+            keyframes.add(round(float(packet['pts_time']) - start, 6))
+    return sorted(time for time in keyframes if time >= 0)
+
+
+async def get_keyframe_index(path, cache_dir, length=None, debug=False):
+    """
+    Keyframe times of path, cached as JSON in cache_dir (the item's tmp folder) and keyed by path,
+    size and mtime so screenshots, disc_screenshots, dvd_screenshots and retakes share one probe.
+    Returns an empty list if the source cannot be probed.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return []
+    cache_path = os.path.join(cache_dir, f"keyframes-{hashlib.sha1(path.encode()).hexdigest()[:12]}.json")
+    if os.path.exists(cache_path):
+        try:
+            with open(cache_path, encoding='utf-8') as f:
+                cached = json.load(f)
+            if cached.get('size') == stat.st_size and cached.get('mtime') == stat.st_mtime:
+                return cached['keyframes']
+        except (OSError, ValueError, KeyError):
+            pass
+
+    try:
+        keyframes = await asyncio.to_thread(_probe_keyframes, path, length)
+    except Exception as e:
+        console.print(f"[yellow]Unable to build keyframe index for {os.path.basename(path)}: {e}")
+        return []
+
+    if debug:
+        console.print(f"[cyan]Keyframe index for {os.path.basename(path)}: {len(keyframes)} keyframes")
+    try:
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            json.dump({'path': path, 'size': stat.st_size, 'mtime': stat.st_mtime, 'keyframes': keyframes}, f)
+    except OSError:
+        pass
+    return keyframes
+
+
+def snap_to_keyframe(time, keyframes, max_shift):
+    """Nearest keyframe to time, or time itself when the index has no keyframe within max_shift seconds."""
+    if not keyframes:
+        return time
+    position = bisect.bisect_left(keyframes, time)
+    candidates = keyframes[max(0, position - 1):position + 1]
+    nearest = min(candidates, key=lambda keyframe: abs(keyframe - time))
+    return nearest if abs(nearest - time) <= max_shift else time
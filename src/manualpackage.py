@@ -1,13 +1,13 @@
 import shutil
 import requests
 import os
-import json
 import urllib.parse
 import re
 from torf import Torrent
 import glob
 from src.console import console
 from src.uploadscreens import upload_screens
+from src.metastore import save_meta
 from data.config import config
 
 
@@ -43,13 +43,11 @@ async def package(meta):
                     with open(poster_img, 'wb') as f:
                         shutil.copyfileobj(r.raw, f)
                     if not meta.get('skip_imghost_upload', False):
-                        poster, dummy = await upload_screens(meta, 1, 1, 0, 1, [poster_img], {})
+                        poster, dummy = await upload_screens(meta, 1, 1, 1, [poster_img])
                         poster = poster[0]
                         generic.write(f"TMDB Poster: {poster.get('raw_url', poster.get('img_url'))}\n")
                         meta['rehosted_poster'] = poster.get('raw_url', poster.get('img_url'))
-                    with open(f"{meta['base_dir']}/tmp/{meta['uuid']}/meta.json", 'w') as metafile:
-                        json.dump(meta, metafile, indent=4)
-                        metafile.close()
+                    save_meta(meta)
                 else:
                     console.print("[bold yellow]Poster could not be retrieved")
         elif os.path.exists(poster_img) and meta.get('rehosted_poster') is not None:
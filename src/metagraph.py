@@ -0,0 +1,91 @@
+import time
+import asyncio
+from src.console import console
+
+
+class MetaNode:
+    def __init__(self, name, run, inputs=(), outputs=(), when=None, after=()):
+        self.name = name
+        self.run = run
+        self.inputs = set(inputs)
+        self.outputs = set(outputs)
+        self.when = when
+        self.after = set(after)
+        self.depends_on = []
+        self.status = "pending"
+        self.waited = 0.0
+        self.elapsed = 0.0
+
+
+class MetaGraph:
+    """
+    Small task graph for the metadata lookups of one item. Each node declares the meta keys it reads (inputs)
+    and writes (outputs), and starts as soon as every earlier declared node writing one of those keys is done,
+    so independent lookups overlap and the item costs its critical path instead of the sum of round trips.
+
+    Declaration order is precedence: a node only waits on nodes added before it, and nodes writing the same key
+    finish in declaration order. A node's run(meta) may return a dict that is merged into meta when it finishes;
+    when(meta) is checked once its dependencies are done and skips the node if false.
+    """
+
+    def __init__(self, meta, debug=False):
+        self.meta = meta
+        self.debug = debug
+        self.nodes = {}
+        self.elapsed = 0.0
+
+    def add(self, name, run, inputs=(), outputs=(), when=None, after=()):
+        node = MetaNode(name, run, inputs, outputs, when, after)
+        for earlier in self.nodes.values():
+            if earlier.name in node.after or earlier.outputs & (node.inputs | node.outputs):
+                node.depends_on.append(earlier.name)
+        self.nodes[name] = node
+        return node
+
+    async def _run_node(self, node, tasks, start):
+        if node.depends_on:
+            await asyncio.gather(*(tasks[name] for name in node.depends_on))
+        node_start = time.perf_counter()
+        node.waited = node_start - start
+        if node.when is not None and not node.when(self.meta):
+            node.status = "skipped"
+            return
+        try:
+            result = await node.run(self.meta)
+        except Exception:
+            node.status = "failed"
+            raise
+        finally:
+            node.elapsed = time.perf_counter() - node_start
+        if isinstance(result, dict):
+            self.meta.update(result)
+        node.status = "done"
+
+    async def run(self):
+        start = time.perf_counter()
+        tasks = {}
+        for name, node in self.nodes.items():
+            tasks[name] = asyncio.create_task(self._run_node(node, tasks, start))
+        try:
+            await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            raise
+        finally:
+            self.elapsed = time.perf_counter() - start
+        if self.debug:
+            self.report()
+        return self.meta
+
+    def report(self):
+        """Print when each lookup started, how long it ran, and the graph's wall clock against the sequential sum."""
+        console.print("[bold]Metadata lookups:[/bold]")
+        for node in self.nodes.values():
+            if node.status == "done":
+                console.print(f"  {node.name}: started at {node.waited:.2f}s, ran {node.elapsed:.2f}s")
+            else:
+                console.print(f"  {node.name}: {node.status}")
+        total = sum(node.elapsed for node in self.nodes.values() if node.status == "done")
+        console.print(f"  {total:.2f}s of lookups in {self.elapsed:.2f}s")
@@ -0,0 +1,102 @@
+import copy
+
+# Large values tracker code only reads, handed out from the base instead of being copied into each overlay
+SHARED_KEYS = frozenset({'mediainfo', 'bdinfo', 'discs'})
+
+
+class MetaOverlay(dict):
+    """
+    Copy-on-write view of a meta dict, used instead of a deepcopy per tracker: writes land in the overlay and reads
+    fall through to the shared base, which is never modified. A list, dict or set from the base is copied into the
+    overlay the first time it is read, so in-place changes stay local too; SHARED_KEYS are handed out as they are.
+    """
+
+    def __init__(self, base):
+        super().__init__()
+        self.base = base
+        self.deleted = set()
+
+    def __getitem__(self, key):
+        if dict.__contains__(self, key):
+            return dict.__getitem__(self, key)
+        if key in self.deleted or key not in self.base:
+            raise KeyError(key)
+        value = self.base[key]
+        if key not in SHARED_KEYS and isinstance(value, (dict, list, set)):
+            value = copy.deepcopy(value)
+            dict.__setitem__(self, key, value)
+        return value
+
+    def __setitem__(self, key, value):
+        self.deleted.discard(key)
+        dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        if dict.__contains__(self, key):
+            dict.__delitem__(self, key)
+        if key in self.base:
+            self.deleted.add(key)
+
+    def __contains__(self, key):
+        return dict.__contains__(self, key) or (key in self.base and key not in self.deleted)
+
+    def __iter__(self):
+        yield from dict.__iter__(self)
+        for key in self.base:
+            if key not in self.deleted and not dict.__contains__(self, key):
+                yield key
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+    def __eq__(self, other):
+        return dict(self.items()) == other
+
+    __hash__ = None
+
+    def __copy__(self):
+        return self.copy()
+
+    def __deepcopy__(self, memo):
+        return copy.deepcopy(dict(self.items()), memo)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def pop(self, key, *default):
+        if key in self:
+            value = self[key]
+            del self[key]
+            return value
+        if default:
+            return default[0]
+        raise KeyError(key)
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def keys(self):
+        return list(self)
+
+    def items(self):
+        return [(key, self[key]) for key in self]
+
+    def values(self):
+        return [self[key] for key in self]
+
+    def copy(self):
+        return dict(self.items())
@@ -0,0 +1,168 @@
+import os
+import copy
+import json
+import shutil
+import hashlib
+import tempfile
+
+# Large values kept in content-addressed sidecar files next to meta.json instead of inline
+BLOB_KEYS = ('mediainfo', 'bdinfo', 'discs')
+BLOB_MIN_SIZE = 1024
+BLOB_DIR = "blobs"
+BLOB_REF = "$blob"
+
+# meta.json path -> index text last written or read, so unchanged saves skip the write
+_saved = {}
+
+
+def meta_path(meta):
+    return os.path.join(meta['base_dir'], "tmp", meta['uuid'], "meta.json")
+
+
+def _atomic_write(path, text):
+    """Write text to path through a temporary file in the same directory, so readers never see a partial file."""
+    directory = os.path.dirname(path)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".meta-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+class BlobRef:
+    """A blob of a saved meta that has not been read yet."""
+
+    def __init__(self, directory, digest):
+        self.directory = directory
+        self.digest = digest
+
+    def load(self):
+        with open(os.path.join(self.directory, BLOB_DIR, f"{self.digest}.json"), encoding='utf-8') as f:
+            return json.load(f)
+
+
+class StoredMeta(dict):
+    """
+    meta whose blobs may still be on disk: a BlobRef value is read from its sidecar the first time the key is
+    accessed and then replaces the reference. Saving a blob that was never read writes the reference back as is.
+    """
+
+    def _resolve(self, key, value):
+        if isinstance(value, BlobRef):
+            value = value.load()
+            dict.__setitem__(self, key, value)
+        return value
+
+    def __getitem__(self, key):
+        return self._resolve(key, dict.__getitem__(self, key))
+
+    def __iter__(self):
+        # Overriding __iter__ makes dict(meta) and {**meta} go through __getitem__, which resolves blobs
+        return dict.__iter__(self)
+
+    def get(self, key, default=None):
+        if dict.__contains__(self, key):
+            return self[key]
+        return default
+
+    def setdefault(self, key, default=None):
+        if dict.__contains__(self, key):
+            return self[key]
+        dict.__setitem__(self, key, default)
+        return default
+
+    def pop(self, key, *default):
+        if dict.__contains__(self, key):
+            value = self[key]
+            dict.__delitem__(self, key)
+            return value
+        return dict.pop(self, key, *default)
+
+    def items(self):
+        return [(key, self[key]) for key in self]
+
+    def values(self):
+        return [self[key] for key in self]
+
+    def copy(self):
+        copied = StoredMeta()
+        dict.update(copied, dict.items(self))
+        return copied
+
+    def __copy__(self):
+        return self.copy()
+
+    def __deepcopy__(self, memo):
+        return copy.deepcopy(dict(self.items()), memo)
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+
+def _raw_items(meta):
+    if isinstance(meta, StoredMeta):
+        return dict.items(meta)
+    return meta.items()
+
+
+def _store_blob(directory, text):
+    """Write a serialised blob to its content-addressed sidecar unless it is already there, return the reference."""
+    digest = hashlib.sha256(text.encode('utf-8')).hexdigest()
+    blob_dir = os.path.join(directory, BLOB_DIR)
+    path = os.path.join(blob_dir, f"{digest}.json")
+    if not os.path.exists(path):
+        os.makedirs(blob_dir, exist_ok=True)
+        _atomic_write(path, text)
+    return {BLOB_REF: digest}
+
+
+def save_meta(meta, path=None):
+    """
+    Save meta to tmp/<uuid>/meta.json. Large values go to sidecar blobs written once per content,
+    the remaining small fields are rewritten atomically and only when they changed since the last save or load.
+    """
+    path = path or meta_path(meta)
+    directory = os.path.dirname(path)
+    index = {}
+    for key, value in _raw_items(meta):
+        if isinstance(value, BlobRef):
+            value = {BLOB_REF: value.digest}
+        elif key in BLOB_KEYS and isinstance(value, (dict, list)):
+            text = json.dumps(value, separators=(',', ':'))
+            if len(text) >= BLOB_MIN_SIZE:
+                value = _store_blob(directory, text)
+        index[key] = value
+    text = json.dumps(index, indent=4)
+    if _saved.get(path) == text and os.path.exists(path):
+        return False
+    _atomic_write(path, text)
+    _saved[path] = text
+    return True
+
+
+def load_meta(path):
+    """
+    Read a meta.json written by save_meta (or an older inline one). Blobs are returned as BlobRef values,
+    merge the result into a StoredMeta to have them read on first access.
+    """
+    with open(path, encoding='utf-8') as f:
+        text = f.read()
+    saved_meta = json.loads(text)
+    _saved[path] = json.dumps(saved_meta, indent=4)
+    directory = os.path.dirname(path)
+    for key, value in saved_meta.items():
+        if isinstance(value, dict) and len(value) == 1 and BLOB_REF in value:
+            saved_meta[key] = BlobRef(directory, value[BLOB_REF])
+    return saved_meta
+
+
+def delete_meta(path):
+    """Remove a saved meta.json and its blobs."""
+    _saved.pop(path, None)
+    if os.path.exists(path):
+        os.remove(path)
+    shutil.rmtree(os.path.join(os.path.dirname(path), BLOB_DIR), ignore_errors=True)
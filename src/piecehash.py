@@ -0,0 +1,171 @@
+import os
+import math
+import time
+import random
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# Bytes read per work item. Each worker thread keeps one buffer of this size (rounded up to whole pieces).
+READ_SIZE = 32 * 1024 * 1024
+
+
+def default_threads():
+    return max(1, min(8, os.cpu_count() or 1))
+
+
+class PieceReader:
+    """
+    Reads byte ranges of several files as if they were one contiguous stream,
+    which is how BitTorrent lays pieces out across file boundaries.
+    """
+
+    def __init__(self, filepaths):
+        self.filepaths = [str(path) for path in filepaths]
+        self.sizes = [os.path.getsize(path) for path in self.filepaths]
+        self.offsets = []
+        offset = 0
+        for size in self.sizes:
+            self.offsets.append(offset)
+            offset += size
+        self.total_size = offset
+
+    def filepath_at(self, offset):
+        for path, start, size in zip(self.filepaths, self.offsets, self.sizes):
+            if start <= offset < start + size:
+                return path
+        return self.filepaths[-1] if self.filepaths else None
+
+    def readinto(self, offset, view):
+        """Fill view with the stream bytes starting at offset, returns the number of bytes read."""
+        wanted = len(view)
+        filled = 0
+        for path, start, size in zip(self.filepaths, self.offsets, self.sizes):
+            if filled >= wanted:
+                break
+            end = start + size
+            position = offset + filled
+            if size == 0 or position >= end or position < start:
+                continue
+            with open(path, 'rb', buffering=0) as f:
+                f.seek(position - start)
+                remaining = min(end - position, wanted - filled)
+                while remaining > 0:
+                    n = f.readinto(view[filled:filled + remaining])
+                    if not n:
+                        raise OSError(f"Unexpected end of file: {path}")
+                    filled += n
+                    remaining -= n
+        return filled
+
+
+def hash_pieces(filepaths, piece_size, threads=None, callback=None, interval=0):
+    """
+    SHA-1 hash every piece of filepaths (read back to back) using a thread pool.
+    Returns the concatenated 20 byte piece hashes, or None if the callback cancelled hashing.
+    """
+    pieces = hash_pieces_multi(filepaths, [piece_size], threads=threads, callback=callback, interval=interval)
+    return None if pieces is None else pieces[piece_size]
+
+
+def hash_pieces_multi(filepaths, piece_sizes, threads=None, callback=None, interval=0):
+    """
+    Hash the content for several piece sizes from a single read of the data.
+    Every batch is read once and hashed for each size, so the cost of an extra size is CPU only.
+    hashlib releases the GIL while hashing, so reads and hashes of different batches run in parallel.
+
+    callback(filepath, pieces_done, pieces_total) counts pieces of the first size in piece_sizes and is
+    called from the calling thread at most every interval seconds (and once at the end); if it returns
+    anything other than None hashing is cancelled and None is returned.
+    Otherwise returns {piece_size: concatenated piece hashes}.
+    """
+    piece_sizes = list(dict.fromkeys(piece_sizes))
+    reader = PieceReader(filepaths)
+    if reader.total_size == 0:
+        return {size: b'' for size in piece_sizes}
+
+    # Batches must start on a piece boundary for every size
+    step = math.lcm(*piece_sizes)
+    batch_bytes = math.ceil(max(READ_SIZE, step) / step) * step
+    batches = math.ceil(reader.total_size / batch_bytes)
+    primary = piece_sizes[0]
+    pieces_total = math.ceil(reader.total_size / primary)
+    results = [None] * batches
+    local = threading.local()
+
+    def hash_batch(index):
+        buf = getattr(local, 'buf', None)
+        if buf is None:
+            buf = local.buf = bytearray(batch_bytes)
+        view = memoryview(buf)
+        offset = index * batch_bytes
+        length = min(batch_bytes, reader.total_size - offset)
+        read = reader.readinto(offset, view[:length])
+        digests = {
+            size: b''.join(
+                hashlib.sha1(view[start:min(start + size, read)]).digest()
+                for start in range(0, read, size)
+            )
+            for size in piece_sizes
+        }
+        return index, digests, math.ceil(read / primary)
+
+    pieces_done = 0
+    last_report = 0
+    with ThreadPoolExecutor(max_workers=threads or default_threads()) as executor:
+        futures = [executor.submit(hash_batch, index) for index in range(batches)]
+        try:
+            for future in as_completed(futures):
+                index, digests, count = future.result()
+                results[index] = digests
+                pieces_done += count
+                if callback is not None:
+                    now = time.time()
+                    if pieces_done == pieces_total or now - last_report >= interval:
+                        last_report = now
+                        if callback(reader.filepath_at(index * batch_bytes), pieces_done, pieces_total) is not None:
+                            return None
+        finally:
+            for future in futures:
+                future.cancel()
+
+    return {size: b''.join(batch[size] for batch in results) for size in piece_sizes}
+
+
+def verify_pieces(files, piece_size, piece_hashes, samples, threads=None):
+    """
+    Spot check a torrent against local data without a full recheck.
+    files is [(local path, expected size)] in torrent order and piece_hashes the concatenated 20 byte hashes.
+    Hashes `samples` random pieces plus the first and last piece of every file in parallel.
+    Returns (pieces checked, list of mismatching piece indices); a missing or resized file fails piece 0.
+    """
+    for path, size in files:
+        if not os.path.isfile(path) or os.path.getsize(path) != size:
+            return 0, [0]
+    reader = PieceReader([path for path, _ in files])
+    pieces_total = math.ceil(reader.total_size / piece_size)
+    if len(piece_hashes) != pieces_total * 20:
+        return 0, [0]
+    if pieces_total == 0:
+        return 0, []
+
+    indices = set(random.sample(range(pieces_total), min(samples, pieces_total)))
+    for start, size in zip(reader.offsets, reader.sizes):
+        if size:
+            indices.add(start // piece_size)
+            indices.add((start + size - 1) // piece_size)
+    local = threading.local()
+
+    def check_piece(index):
+        buf = getattr(local, 'buf', None)
+        if buf is None:
+            buf = local.buf = bytearray(piece_size)
+        view = memoryview(buf)
+        offset = index * piece_size
+        read = reader.readinto(offset, view[:min(piece_size, reader.total_size - offset)])
+        return hashlib.sha1(view[:read]).digest() == piece_hashes[index * 20:index * 20 + 20]
+
+    with ThreadPoolExecutor(max_workers=threads or default_threads()) as executor:
+        matches = executor.map(check_piece, sorted(indices))
+        failed = [index for index, match in zip(sorted(indices), matches) if not match]
+    return len(indices), failed
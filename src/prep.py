@@ -6,12 +6,14 @@ from data.config import config
 from src.trackersetup import tracker_class_map
 from src.tvmaze import search_tvmaze
 from src.imdb import get_imdb_info_api, search_imdb
-from src.trackermeta import update_metadata_from_tracker
+from src.trackermeta import update_metadata_from_tracker, probe_tracker
 from src.tmdb import tmdb_other_meta, get_tmdb_imdb_from_mediainfo, get_tmdb_from_imdb, get_tmdb_id, get_episode_details
 from src.region import get_region, get_distributor, get_service
 from src.exportmi import exportInfo, mi_resolution
 from src.getseasonep import get_season_episode
 from src.btnid import get_btn_torrents, get_bhd_torrents
+from src.httpcache import cached_client
+from src.metagraph import MetaGraph
 
 try:
     import traceback
@@ -26,6 +28,7 @@ try:
     import json
     import glob
     import requests
+    import httpx
     from pymediainfo import MediaInfo
     import tmdbsimple as tmdb
     import time
@@ -360,7 +363,7 @@ class Prep():
 
                 specific_tracker = next((tracker_keys[key] for key in tracker_keys if meta.get(key) is not None), None)
 
-                async def process_tracker(tracker_name, meta):
+                async def process_tracker(tracker_name, meta, probe=None):
                     nonlocal found_match
                     if tracker_class_map is None:
                         print(f"Tracker class for {tracker_name} not found.")
@@ -368,8 +371,10 @@ class Prep():
 
                     tracker_instance = tracker_class_map[tracker_name](config=config)
                     try:
+                        if probe is not None:
+                            probe = await probe
                         updated_meta, match = await update_metadata_from_tracker(
-                            tracker_name, tracker_instance, meta, search_term, search_file_folder, only_id
+                            tracker_name, tracker_instance, meta, search_term, search_file_folder, only_id, probe=probe
                         )
                         if match:
                             found_match = True
@@ -410,11 +415,49 @@ class Prep():
                 else:
                     # Process all trackers with API = true if no specific tracker is set in meta
                     tracker_order = ["PTP", "BHD", "BLU", "AITHER", "LST", "OE", "TIK", "HDB"]
+                    api_trackers = [
+                        tracker_name for tracker_name in tracker_order
+                        if str(self.config['TRACKERS'].get(tracker_name, {}).get('useAPI', 'false')).lower() == "true"
+                    ]
 
-                    for tracker_name in tracker_order:
-                        if not found_match:  # Stop checking once a match is found
-                            tracker_config = self.config['TRACKERS'].get(tracker_name, {})
-                            if str(tracker_config.get('useAPI', 'false')).lower() == "true":
+                    if self.config['DEFAULT'].get('race_tracker_lookups', False) and len(api_trackers) > 1:
+                        # Search every tracker at once, then take the results in tracker_order so precedence is unchanged
+                        probe_times = {}
+
+                        async def timed_probe(tracker_name):
+                            probe_start = time.time()
+                            try:
+                                tracker_instance = tracker_class_map[tracker_name](config=config)
+                                return await probe_tracker(tracker_name, tracker_instance, meta, search_term, search_file_folder)
+                            finally:
+                                probe_times[tracker_name] = time.time() - probe_start
+
+                        lookup_start = time.time()
+                        probes = {tracker_name: asyncio.create_task(timed_probe(tracker_name)) for tracker_name in api_trackers}
+                        try:
+                            for tracker_name in api_trackers:
+                                meta = await process_tracker(tracker_name, meta, probe=probes[tracker_name])
+                                if found_match:
+                                    if meta['debug']:
+                                        console.print(f"[cyan]Tracker match taken from {tracker_name} after {time.time() - lookup_start:.2f}s")
+                                    break
+                        finally:
+                            for probe in probes.values():
+                                probe.cancel()
+                            await asyncio.gather(*probes.values(), return_exceptions=True)
+                        if meta['debug']:
+                            console.print("[bold]Tracker lookups:[/bold]")
+                            for tracker_name, probe in probes.items():
+                                if probe.cancelled():
+                                    outcome = "cancelled"
+                                elif probe.exception() is not None:
+                                    outcome = f"failed ({probe.exception()})"
+                                else:
+                                    outcome = "searched"
+                                console.print(f"  {tracker_name}: {outcome} after {probe_times.get(tracker_name, 0):.2f}s")
+                    else:
+                        for tracker_name in api_trackers:
+                            if not found_match:  # Stop checking once a match is found
                                 meta = await process_tracker(tracker_name, meta)
 
                 if not found_match:
@@ -442,54 +485,64 @@ class Prep():
         else:
             meta['category'] = meta['category'].upper()
 
-        # Check if both IMDb and TVDB IDs are present first
-        if int(meta['imdb_id']) != 0 and int(meta['tvdb_id']) != 0:
-            results = await asyncio.gather(
-                get_tmdb_from_imdb(
-                    meta['imdb_id'],
-                    meta.get('tvdb_id'),
-                    meta.get('search_year'),
-                    filename,
-                    debug=meta.get('debug', False),
-                    mode=meta.get('mode', 'discord')
-                ),
-                search_tvmaze(
+        # Metadata lookups run as a task graph, each one starting as soon as the ids it reads are known
+        lookups = MetaGraph(meta, debug=meta.get('debug', False))
+        prefetched_episodes = {}
+
+        async def get_ids_from_mediainfo(meta):
+            console.print("Fetching TMDB ID...")
+            category, tmdb_id, imdb_id = await get_tmdb_imdb_from_mediainfo(
+                mi, meta['category'], meta['is_disc'], meta['tmdb_id'], meta['imdb_id']
+            )
+            return {'category': category, 'tmdb_id': tmdb_id, 'imdb_id': imdb_id}
+
+        async def get_imdb_info(meta):
+            try:
+                imdb_info = await get_imdb_info_api(meta['imdb_id'], manual_language=meta.get('manual_language'), debug=meta.get('debug', False))
+            except Exception as e:
+                console.print(f"[red]IMDb API call failed: {e}[/red]")
+                return {'imdb_info': meta.get('imdb_info', {})}  # Keep previous IMDb info if it exists
+            if not isinstance(imdb_info, dict):
+                console.print("[red]Unexpected IMDb response, setting imdb_info to empty.[/red]")
+                return {'imdb_info': {}}
+            return {'imdb_info': imdb_info, 'tv_year': imdb_info.get('tv_year', None)}
+
+        async def get_tvmaze_id(meta):
+            try:
+                tvmaze_id = await search_tvmaze(
                     filename, meta['search_year'], meta.get('imdb_id', 0), meta.get('tvdb_id', 0),
                     manual_date=meta.get('manual_date'),
                     tvmaze_manual=meta.get('tvmaze_manual'),
                     debug=meta.get('debug', False),
                     return_full_tuple=False
-                ),
-                get_imdb_info_api(
-                    meta['imdb_id'],
-                    manual_language=meta.get('manual_language'),
-                    debug=meta.get('debug', False)
-                ),
-                return_exceptions=True
-            )
-
-            tmdb_result, tvmaze_id, imdb_info_result = results
-
-            if isinstance(tmdb_result, tuple) and len(tmdb_result) == 3:
-                meta['category'], meta['tmdb_id'], meta['original_language'] = tmdb_result
+                )
+            except Exception as e:
+                console.print(f"[red]TVMaze API call failed: {e}[/red]")
+                tvmaze_id = 0
+            return {'tvmaze_id': tvmaze_id if isinstance(tvmaze_id, int) else 0}
 
-            meta['tvmaze_id'] = tvmaze_id if isinstance(tvmaze_id, int) else 0
+        async def get_tmdb_ids(meta):
+            if int(meta['imdb_id']) != 0:
+                category, tmdb_id, original_language = await get_tmdb_from_imdb(
+                    meta['imdb_id'],
+                    meta.get('tvdb_id'),
+                    meta.get('search_year'),
+                    filename,
+                    debug=meta.get('debug', False),
+                    mode=meta.get('mode', 'discord')
+                )
+                return {'category': category, 'tmdb_id': tmdb_id, 'original_language': original_language}
+            console.print("Fetching TMDB ID from filename...")
+            await get_tmdb_id(filename, meta['search_year'], meta, meta['category'], untouched_filename)
 
-            if isinstance(imdb_info_result, dict):
-                meta['imdb_info'] = imdb_info_result
-                meta['tv_year'] = imdb_info_result.get('tv_year', None)
-            elif isinstance(imdb_info_result, Exception):
-                console.print(f"[red]IMDb API call failed: {imdb_info_result}[/red]")
-                meta['imdb_info'] = meta.get('imdb_info', {})  # Keep previous IMDb info if it exists
-            else:
-                console.print("[red]Unexpected IMDb response, setting imdb_info to empty.[/red]")
-                meta['imdb_info'] = {}
+        # Check if essential TMDB metadata is already populated
+        essential_fields = ['title', 'year', 'genres', 'overview']
 
-        # Check if both IMDb and TMDb IDs are present next
-        elif int(meta['imdb_id']) != 0 and int(meta['tmdb_id']) != 0:
-            # Create a list of coroutines to run concurrently
-            coroutines = [
-                tmdb_other_meta(
+        async def get_tmdb_metadata(meta):
+            console.print("Fetching TMDB metadata...")
+            try:
+                # Extract only the needed parameters
+                tmdb_metadata = await tmdb_other_meta(
                     tmdb_id=meta['tmdb_id'],
                     path=meta.get('path'),
                     search_year=meta.get('search_year'),
@@ -502,193 +555,163 @@ class Prep():
                     original_language=meta.get('original_language'),
                     poster=meta.get('poster'),
                     debug=meta.get('debug', False),
-                    mode=meta.get('mode', 'discord'),
+                    mode=meta.get('mode', 'discord' if imdb_tmdb_known else 'cli'),
                     tvdb_id=meta.get('tvdb_id', 0)
-                ),
-                get_imdb_info_api(
-                    meta['imdb_id'],
-                    manual_language=meta.get('manual_language'),
-                    debug=meta.get('debug', False)
-                )
-            ]
-
-            # Add TVMaze search if it's a TV category
-            if meta['category'] == 'TV':
-                coroutines.append(
-                    search_tvmaze(
-                        filename, meta['search_year'], meta.get('imdb_id', 0), meta.get('tvdb_id', 0),
-                        manual_date=meta.get('manual_date'),
-                        tvmaze_manual=meta.get('tvmaze_manual'),
-                        debug=meta.get('debug', False),
-                        return_full_tuple=False
-                    )
                 )
 
-            # Gather results
-            results = await asyncio.gather(*coroutines, return_exceptions=True)
-
-            # Process the results
-            if isinstance(results[0], Exception):
-                error_msg = f"TMDB metadata retrieval failed: {str(results[0])}"
-                console.print(f"[bold red]{error_msg}[/bold red]")
-                raise RuntimeError(error_msg)
-            elif not results[0]:  # Check if the result is empty (empty dict)
-                error_msg = f"Failed to retrieve essential metadata from TMDB ID: {meta['tmdb_id']}"
-                console.print(f"[bold red]{error_msg}[/bold red]")
-                raise ValueError(error_msg)
-            else:
-                tmdb_metadata = results[0]
-
-            # Update meta with TMDB metadata
-            if tmdb_metadata:
-                meta.update(tmdb_metadata)
-
-            imdb_info_result = results[1]
-
-            # Update meta with TMDB metadata
-            if tmdb_metadata:
-                meta.update(tmdb_metadata)
+                # Check if the metadata is empty or missing essential fields
+                if not tmdb_metadata or not all(tmdb_metadata.get(field) for field in ['title', 'year']):
+                    error_msg = f"Failed to retrieve essential metadata from TMDB ID: {meta['tmdb_id']}"
+                    console.print(f"[bold red]{error_msg}[/bold red]")
+                    raise ValueError(error_msg)
 
-            # Process IMDb info
-            if isinstance(imdb_info_result, dict):
-                meta['imdb_info'] = imdb_info_result
-                meta['tv_year'] = imdb_info_result.get('tv_year', None)
-            elif isinstance(imdb_info_result, Exception):
-                console.print(f"[red]IMDb API call failed: {imdb_info_result}[/red]")
-                meta['imdb_info'] = meta.get('imdb_info', {})  # Keep previous IMDb info if it exists
-            else:
-                console.print("[red]Unexpected IMDb response, setting imdb_info to empty.[/red]")
-                meta['imdb_info'] = {}
-
-            # Process TVMaze results if it was included
-            if meta['category'] == 'TV' and len(results) > 2:
-                tvmaze_result = results[2]
-                if isinstance(tvmaze_result, int):
-                    meta['tvmaze_id'] = tvmaze_result
-                elif isinstance(tvmaze_result, Exception):
-                    console.print(f"[red]TVMaze API call failed: {tvmaze_result}[/red]")
-                    meta['tvmaze_id'] = 0  # Set default value if an exception occurred
-
-        # Get TMDB and IMDb metadata only if IDs are still missing
-        if meta.get('tmdb_id') == 0 and meta.get('imdb_id') == 0:
-            console.print("Fetching TMDB ID...")
-            meta['category'], meta['tmdb_id'], meta['imdb_id'] = await get_tmdb_imdb_from_mediainfo(
-                mi, meta['category'], meta['is_disc'], meta['tmdb_id'], meta['imdb_id']
-            )
+                # Update meta with return values from tmdb_other_meta
+                return tmdb_metadata
 
-        if meta.get('tmdb_id') == 0 and meta.get('imdb_id') == 0:
-            console.print("Fetching TMDB ID from filename...")
-            meta = await get_tmdb_id(filename, meta['search_year'], meta, meta['category'], untouched_filename)
-        elif meta.get('imdb_id') != 0 and meta.get('tmdb_id') == 0:
-            category, tmdb_id, original_language = await get_tmdb_from_imdb(
-                meta['imdb_id'],
-                meta.get('tvdb_id'),
-                meta.get('search_year'),
-                filename,
+            except Exception as e:
+                error_msg = f"TMDB metadata retrieval failed for ID {meta['tmdb_id']}: {str(e)}"
+                console.print(f"[bold red]{error_msg}[/bold red]")
+                raise RuntimeError(error_msg) from e
+
+        async def prefetch_episode(meta):
+            # Fetch the episode guessed from the filename alongside the TMDB metadata, used if get_season_episode agrees
+            guess = guessit(video)
+            season, episode = guess.get('season'), guess.get('episode')
+            if isinstance(season, int) and isinstance(episode, int):
+                episode_details = await get_episode_details(meta['tmdb_id'], season, episode, debug=meta.get('debug', False))
+                if episode_details:
+                    prefetched_episodes[(meta['tmdb_id'], season, episode)] = episode_details
+
+        async def get_tvmaze_ids(meta):
+            tvmaze_id, imdb_id, tvdb_id = await search_tvmaze(
+                filename, meta['search_year'], meta.get('imdb_id', 0), meta.get('tvdb_id', 0),
+                manual_date=meta.get('manual_date'),
+                tvmaze_manual=meta.get('tvmaze_manual'),
                 debug=meta.get('debug', False),
-                mode=meta.get('mode', 'discord')
+                return_full_tuple=True
             )
+            return {'tvmaze_id': tvmaze_id, 'imdb_id': imdb_id, 'tvdb_id': tvdb_id}
 
-            meta['category'] = category
-            meta['tmdb_id'] = tmdb_id
-            meta['original_language'] = original_language
+        async def search_imdb_id(meta):
+            return {'imdb_id': await search_imdb(filename, meta['search_year'])}
 
-        # Fetch TMDB metadata if available
-        if int(meta['tmdb_id']) != 0:
-            # Check if essential TMDB metadata is already populated
-            essential_fields = ['title', 'year', 'genres', 'overview']
-            tmdb_metadata_populated = all(meta.get(field) is not None for field in essential_fields)
+        async def get_imdb_aka(meta):
+            imdb_info = meta.get('imdb_info') or {}
+            aka = imdb_info.get('aka', "").strip()
+            title = imdb_info.get('title', "").strip().lower()
+            year = str(imdb_info.get('year', ""))
 
-            if not tmdb_metadata_populated:
-                console.print("Fetching TMDB metadata...")
-                try:
-                    # Extract only the needed parameters
-                    tmdb_metadata = await tmdb_other_meta(
-                        tmdb_id=meta['tmdb_id'],
-                        path=meta.get('path'),
-                        search_year=meta.get('search_year'),
-                        category=meta.get('category'),
-                        imdb_id=meta.get('imdb_id', 0),
-                        manual_language=meta.get('manual_language'),
-                        anime=meta.get('anime', False),
-                        mal_manual=meta.get('mal_manual'),
-                        aka=meta.get('aka', ''),
-                        original_language=meta.get('original_language'),
-                        poster=meta.get('poster'),
-                        debug=meta.get('debug', False),
-                        mode=meta.get('mode', 'cli'),
-                        tvdb_id=meta.get('tvdb_id', 0)
-                    )
-
-                    # Check if the metadata is empty or missing essential fields
-                    if not tmdb_metadata or not all(tmdb_metadata.get(field) for field in ['title', 'year']):
-                        error_msg = f"Failed to retrieve essential metadata from TMDB ID: {meta['tmdb_id']}"
-                        console.print(f"[bold red]{error_msg}[/bold red]")
-                        raise ValueError(error_msg)
-
-                    # Update meta with return values from tmdb_other_meta
-                    meta.update(tmdb_metadata)
+            aka_trimmed = aka[5:].strip().lower() if len(aka) > 5 else aka.lower()
+            difference = SequenceMatcher(None, title, aka_trimmed).ratio()
+            if difference >= 0.9 or not aka_trimmed or aka_trimmed in title:
+                return
 
-                except Exception as e:
-                    error_msg = f"TMDB metadata retrieval failed for ID {meta['tmdb_id']}: {str(e)}"
-                    console.print(f"[bold red]{error_msg}[/bold red]")
-                    raise RuntimeError(error_msg) from e
+            if f"({year})" in aka:
+                aka = aka.replace(f"({year})", "").strip()
 
-        # Search TVMaze only if it's a TV category and tvmaze_id is still missing
-        if meta['category'] == "TV":
-            if meta.get('tvmaze_id', 0) == 0:
-                meta['tvmaze_id'], meta['imdb_id'], meta['tvdb_id'] = await search_tvmaze(
-                    filename, meta['search_year'], meta.get('imdb_id', 0), meta.get('tvdb_id', 0),
-                    manual_date=meta.get('manual_date'),
-                    tvmaze_manual=meta.get('tvmaze_manual'),
-                    debug=meta.get('debug', False),
-                    return_full_tuple=True
-                )
-        else:
-            meta.setdefault('tvmaze_id', 0)
+            return {'aka': f"AKA {aka}"}
 
-        meta['tvmaze'] = meta.get('tvmaze_id', 0)
+        async def get_release_tag(meta):
+            if meta.get('tag', None) is None:
+                return {'tag': await self.get_tag(video, meta)}
+            if not meta['tag'].startswith('-') and meta['tag'] != "":
+                return {'tag': f"-{meta['tag']}"}
+
+        async def get_season_and_episode(meta):
+            await get_season_episode(video, meta)
 
+        async def get_episode_title(meta):
+            key = (meta.get('tmdb_id'), meta.get('season_int'), meta.get('episode_int'))
+            episode_details = prefetched_episodes.get(key) or await get_episode_details(*key, debug=meta.get('debug', False))
+            if meta.get('episode_title') is None and episode_details.get('name') is not None:
+                if 'episode' in episode_details.get("name").lower():
+                    meta['episode_title'] = ""
+                else:
+                    meta['episode_title'] = episode_details['name']
+                meta['overview_meta'] = episode_details.get('overview', None)
+
+        # IMDb info (and TVMaze for TV) is fetched up front only for items that arrive with IMDb and TVDB or TMDB ids,
+        # every other item gets it from imdb_info_late, AKA included
+        imdb_tvdb_known = int(meta['imdb_id']) != 0 and int(meta['tvdb_id']) != 0
+        imdb_tmdb_known = int(meta['imdb_id']) != 0 and int(meta['tmdb_id']) != 0 and not imdb_tvdb_known
+
+        # Get TMDB and IMDb ids from mediainfo only if both are missing
+        lookups.add(
+            'mediainfo_ids', get_ids_from_mediainfo,
+            outputs=('category', 'tmdb_id', 'imdb_id'),
+            when=lambda meta: meta.get('tmdb_id') == 0 and meta.get('imdb_id') == 0
+        )
+        lookups.add(
+            'imdb_info', get_imdb_info,
+            inputs=('imdb_id',), outputs=('imdb_info', 'tv_year'),
+            when=lambda meta: imdb_tvdb_known or imdb_tmdb_known
+        )
+        lookups.add(
+            'tvmaze', get_tvmaze_id,
+            inputs=('imdb_id', 'tvdb_id', 'category'), outputs=('tvmaze_id',),
+            when=lambda meta: imdb_tvdb_known or (imdb_tmdb_known and meta['category'] == "TV")
+        )
+        # IMDb + TVDB ids are resolved against TMDB even when a TMDB id is already known
+        lookups.add(
+            'tmdb_id', get_tmdb_ids,
+            inputs=('imdb_id', 'tvdb_id', 'tmdb_id', 'category'), outputs=('category', 'tmdb_id', 'original_language', 'imdb_id'),
+            when=lambda meta: int(meta['tmdb_id']) == 0 or (int(meta['imdb_id']) != 0 and int(meta['tvdb_id']) != 0)
+        )
+        lookups.add(
+            'tmdb_metadata', get_tmdb_metadata,
+            inputs=('tmdb_id', 'category', 'imdb_id'),
+            outputs=('title', 'year', 'genres', 'overview', 'aka', 'original_language', 'anime', 'mal_id', 'imdb_id', 'tvdb_id', 'poster'),
+            when=lambda meta: int(meta['tmdb_id']) != 0 and not all(meta.get(field) is not None for field in essential_fields)
+        )
+        lookups.add(
+            'episode_prefetch', prefetch_episode,
+            inputs=('tmdb_id', 'category'),
+            when=lambda meta: meta['category'] == "TV" and int(meta['tmdb_id']) != 0 and not meta.get('manual_date') and not meta.get('manual_season') and not meta.get('manual_episode')
+        )
+        # Search TVMaze only if it's a TV category and tvmaze_id is still missing
+        lookups.add(
+            'tvmaze_ids', get_tvmaze_ids,
+            inputs=('category', 'tvmaze_id', 'imdb_id', 'tvdb_id'), outputs=('tvmaze_id', 'imdb_id', 'tvdb_id'),
+            when=lambda meta: meta['category'] == "TV" and meta.get('tvmaze_id', 0) == 0
+        )
         # If no IMDb ID, search for it
-        if meta.get('imdb_id') == 0:
-            meta['imdb_id'] = await search_imdb(filename, meta['search_year'])
+        lookups.add(
+            'imdb_search', search_imdb_id,
+            inputs=('imdb_id',), outputs=('imdb_id',),
+            when=lambda meta: meta.get('imdb_id') == 0
+        )
         # Ensure IMDb info is retrieved if it wasn't already fetched
-        if meta.get('imdb_info', None) is None and int(meta['imdb_id']) != 0:
-            imdb_info = await get_imdb_info_api(meta['imdb_id'], manual_language=meta.get('manual_language'), debug=meta.get('debug', False))
-            meta['imdb_info'] = imdb_info
-            meta['tv_year'] = imdb_info.get('tv_year', None)
-
-            aka = meta.get('imdb_info', {}).get('aka', "").strip()
-            title = meta.get('imdb_info', {}).get('title', "").strip().lower()
-            year = str(meta.get('imdb_info', {}).get('year', ""))
-
-            if aka and not meta.get('aka'):
-                aka_trimmed = aka[5:].strip().lower() if len(aka) > 5 else aka.lower()
-                difference = SequenceMatcher(None, title, aka_trimmed).ratio()
-                if difference >= 0.9 or not aka_trimmed or aka_trimmed in title:
-                    aka = None
-
-                if aka is not None:
-                    if f"({year})" in aka:
-                        aka = aka.replace(f"({year})", "").strip()
-
-                    meta['aka'] = f"AKA {aka}"
-
-        if meta.get('tag', None) is None:
-            meta['tag'] = await self.get_tag(video, meta)
-        else:
-            if not meta['tag'].startswith('-') and meta['tag'] != "":
-                meta['tag'] = f"-{meta['tag']}"
-        if meta['category'] == "TV":
-            meta = await get_season_episode(video, meta)
-            if not meta.get('tv_pack', False) and meta.get('episode_int') != 0:
-                episode_details = await get_episode_details(meta.get('tmdb_id'), meta.get('season_int'), meta.get('episode_int'), debug=meta.get('debug', False))
-                if meta.get('episode_title') is None and episode_details.get('name') is not None:
-                    if 'episode' in episode_details.get("name").lower():
-                        meta['episode_title'] = ""
-                    else:
-                        meta['episode_title'] = episode_details['name']
-                    meta['overview_meta'] = episode_details.get('overview', None)
+        lookups.add(
+            'imdb_info_late', get_imdb_info,
+            inputs=('imdb_id', 'imdb_info'), outputs=('imdb_info', 'tv_year'),
+            when=lambda meta: meta.get('imdb_info', None) is None and int(meta['imdb_id']) != 0
+        )
+        # The IMDb AKA only fills in for info fetched late, as before; a marker in meta would be saved into meta.json
+        lookups.add(
+            'imdb_aka', get_imdb_aka,
+            inputs=('imdb_info', 'aka'), outputs=('aka',), after=('imdb_info_late',),
+            when=lambda meta: (
+                lookups.nodes['imdb_info_late'].status == "done"
+                and (meta.get('imdb_info') or {}).get('aka', "").strip() and not meta.get('aka')
+            )
+        )
+        lookups.add('tag', get_release_tag, inputs=('anime', 'tag'), outputs=('tag',))
+        lookups.add(
+            'season_episode', get_season_and_episode,
+            inputs=('category', 'anime', 'mal_id', 'tmdb_id', 'tvdb_id', 'title', 'tag'),
+            outputs=('season', 'episode', 'season_int', 'episode_int', 'tv_pack', 'mal_id', 'tag', 'episode_title'),
+            when=lambda meta: meta['category'] == "TV"
+        )
+        lookups.add(
+            'episode_details', get_episode_title,
+            inputs=('tmdb_id', 'season_int', 'episode_int', 'tv_pack', 'episode_title'), outputs=('episode_title', 'overview_meta'),
+            after=('episode_prefetch',),
+            when=lambda meta: meta['category'] == "TV" and not meta.get('tv_pack', False) and meta.get('episode_int') != 0
+        )
+        await lookups.run()
+
+        meta.setdefault('tvmaze_id', 0)
+        meta['tvmaze'] = meta.get('tvmaze_id', 0)
         meta = await self.tag_override(meta)
         user_overrides = config['DEFAULT'].get('user_overrides', False)
         if user_overrides:
@@ -926,8 +949,9 @@ class Prep():
         if meta['debug']:
             console.print("Using SRRDB url", url)
         if 'scene' not in meta:
+            client = cached_client(timeout=30, follow_redirects=True)
             try:
-                response = requests.get(url, timeout=30)
+                response = await client.get(url)
                 response_json = response.json()
                 if meta['debug']:
                     console.print(response_json)
@@ -954,7 +978,7 @@ class Prep():
                                 nfo_file_path = os.path.join(save_path, f"{release_lower}.nfo")
 
                                 # Download the NFO file
-                                nfo_response = requests.get(nfo_url, timeout=30)
+                                nfo_response = await client.get(nfo_url)
                                 if nfo_response.status_code == 200:
                                     with open(nfo_file_path, 'wb') as f:
                                         f.write(nfo_response.content)
@@ -968,7 +992,7 @@ class Prep():
 
                     # IMDb Handling
                     try:
-                        response = requests.get(f"https://api.srrdb.com/v1/imdb/{base}")
+                        response = await client.get(f"https://api.srrdb.com/v1/imdb/{base}")
 
                         if response.status_code == 200:
                             r = response.json()
@@ -986,7 +1010,7 @@ class Prep():
                         else:
                             console.print(f"[yellow]SRRDB API request failed with status: {response.status_code}")
 
-                    except requests.RequestException as e:
+                    except httpx.RequestError as e:
                         console.print("[yellow]Failed to fetch IMDb information:", e)
 
                 else:
@@ -994,6 +1018,8 @@ class Prep():
 
             except Exception as e:
                 console.print("[yellow]SRRDB: No match found, or request has timed out", e)
+            finally:
+                await client.aclose()
 
         return video, scene, imdb
 
@@ -6,7 +6,9 @@ import asyncio
 from src.console import console
 from urllib.parse import urlparse
 from src.takescreens import disc_screenshots, dvd_screenshots, screenshots
-from src.uploadscreens import upload_screens
+from src.uploadscreens import upload_screens, screenshot_files
+from src.imagehosts import UPLOADERS, upload_image
+from src.imagecache import get_image_cache
 from data.config import config
 
 
@@ -17,7 +19,85 @@ def match_host(hostname, approved_hosts):
     return hostname
 
 
+def images_on_approved_hosts(images, url_host_mapping, approved_image_hosts):
+    return all(
+        url_host_mapping.get(
+            match_host(urlparse(image.get('raw_url', '')).netloc, url_host_mapping.keys()),
+            None
+        ) in approved_image_hosts for image in images
+    )
+
+
+async def plan_rehosts(meta, tracker_classes):
+    """
+    Upload the screenshots, once per item and before any tracker upload starts, to every image host the
+    selected trackers need. A tracker declaring approved_image_hosts whose image_list is not on one of them
+    gets the first img_host_N it approves. Every (screenshot, host) pair uploads concurrently within the hosts'
+    limits and the results are stored in meta['<TRACKER>_images_key'], which check_hosts then uses as is.
+    HDB's gallery is uploaded at the same time and picked up from the image cache by HDB.edit_desc.
+    """
+    if meta.get('skip_imghost_upload', False) or not meta.get('image_list'):
+        return
+
+    host_trackers = {}
+    for tracker_class in tracker_classes:
+        approved_image_hosts = getattr(tracker_class, 'approved_image_hosts', None)
+        if not approved_image_hosts:
+            continue
+        new_images_key = f'{tracker_class.tracker}_images_key'
+        if images_on_approved_hosts(meta['image_list'], tracker_class.url_host_mapping, approved_image_hosts):
+            # Pinned so that another tracker's rehost replacing meta['image_list'] cannot affect this one
+            meta[new_images_key] = list(meta['image_list'])
+            continue
+        img_host_index = 1
+        while f'img_host_{img_host_index}' in config['DEFAULT']:
+            img_host = config['DEFAULT'][f'img_host_{img_host_index}']
+            if img_host in approved_image_hosts and img_host in UPLOADERS:
+                host_trackers.setdefault(img_host, []).append(tracker_class.tracker)
+                break
+            img_host_index += 1
+
+    tasks = {}
+    for tracker_class in tracker_classes:
+        if getattr(tracker_class, 'rehost_images', False) is True and hasattr(tracker_class, 'hdbimg_upload') \
+                and get_image_cache(meta['base_dir'], config) is not None:
+            tasks[('gallery', tracker_class.tracker)] = tracker_class.hdbimg_upload(meta)
+
+    multi_screens = int(config['DEFAULT'].get('screens', 6))
+    tmp_dir = os.path.join(meta['base_dir'], 'tmp', meta['uuid'])
+    screens = [os.path.join(tmp_dir, image) for image in await asyncio.to_thread(screenshot_files, meta)][:multi_screens]
+    if host_trackers and len(screens) < multi_screens:
+        # Not enough local screenshots, check_hosts captures the missing ones per tracker
+        if meta['debug']:
+            console.print(f"[yellow]Only {len(screens)} local screenshots, leaving image rehosting to each tracker")
+        host_trackers = {}
+    for img_host in host_trackers:
+        for index, screen in enumerate(screens):
+            tasks[(img_host, index)] = upload_image(screen, img_host, config, meta)
+    if not tasks:
+        return
+
+    console.print(f"[green]Rehosting screenshots to {', '.join(list(host_trackers) + [f'{key[1]} gallery' for key in tasks if key[0] == 'gallery'])}")
+    results = dict(zip(tasks, await asyncio.gather(*tasks.values(), return_exceptions=True)))
+    for img_host, trackers in host_trackers.items():
+        uploads = [results[(img_host, index)] for index in range(len(screens))]
+        if not all(isinstance(upload, dict) and upload.get('status') == 'success' for upload in uploads):
+            console.print(f"[yellow]Some screenshots failed to upload to {img_host}, {', '.join(trackers)} will rehost on upload")
+            continue
+        images = [{'img_url': upload['img_url'], 'raw_url': upload['raw_url'], 'web_url': upload['web_url']} for upload in uploads]
+        for tracker in trackers:
+            meta[f'{tracker}_images_key'] = images
+            if meta['debug']:
+                console.print(f"[green]{tracker} screenshots rehosted to {img_host}")
+
+
 async def check_hosts(meta, tracker, url_host_mapping, img_host_index=1, approved_image_hosts=None):
+    # Images already rehosted for this tracker by plan_rehosts
+    planned_images = meta.get(f'{tracker}_images_key')
+    if planned_images and images_on_approved_hosts(planned_images, url_host_mapping, approved_image_hosts):
+        meta['image_list'] = planned_images
+        return meta['image_list'], False, False
+
     reuploaded_images_path = os.path.join(meta['base_dir'], "tmp", meta['uuid'], "reuploaded_images.json")
     reuploaded_images = []
 
@@ -68,12 +148,7 @@ async def check_hosts(meta, tracker, url_host_mapping, img_host_index=1, approve
                 else:
                     console.print(f"[red]URL '{raw_url}' is not recognized as part of an approved host.")
 
-    all_images_valid = all(
-        url_host_mapping.get(
-            match_host(urlparse(image.get('raw_url', '')).netloc, url_host_mapping.keys()),
-            None
-        ) in approved_image_hosts for image in meta['image_list']
-    )
+    all_images_valid = images_on_approved_hosts(meta['image_list'], url_host_mapping, approved_image_hosts)
 
     if all_images_valid:
         return meta['image_list'], False, False
@@ -292,8 +367,7 @@ async def handle_image_upload(meta, tracker, url_host_mapping, approved_image_ho
                 break
 
         uploaded_images, _ = await upload_screens(
-            meta, multi_screens, img_host_index, 0, multi_screens,
-            all_screenshots, {new_images_key: meta[new_images_key]}, retry_mode
+            meta, multi_screens, img_host_index, multi_screens, all_screenshots, retry_mode
         )
 
         if uploaded_images:
@@ -301,7 +375,7 @@ async def handle_image_upload(meta, tracker, url_host_mapping, approved_image_ho
 
         if meta['debug']:
             for image in uploaded_images:
-                console.print(f"[debug] Response in upload_image_task: {image['img_url']}, {image['raw_url']}, {image['web_url']}")
+                console.print(f"[debug] Uploaded image: {image['img_url']}, {image['raw_url']}, {image['web_url']}")
 
         for image in meta.get(new_images_key, []):
             raw_url = image['raw_url']
@@ -16,6 +16,8 @@ import gc
 import traceback
 from pymediainfo import MediaInfo
 from src.console import console
+from src.cleanup import background_pids
+from src.keyframes import get_keyframe_index, snap_to_keyframe
 from data.config import config
 
 img_host = [
@@ -33,6 +35,21 @@ except ValueError:
     task_limit = 1
 tone_map = config['DEFAULT'].get('tone_map', False)
 optimize_images = config['DEFAULT'].get('optimize_images', True)
+multi_capture = config['DEFAULT'].get('multi_capture', True)
+# Frames captured per ffmpeg process when multi_capture is enabled
+MULTI_CAPTURE_BATCH = 8
+keyframe_screens = config['DEFAULT'].get('keyframe_screens', False)
+frame_screening = config['DEFAULT'].get('frame_screening', False)
+
+
+def keyframe_seek(meta=None):
+    """
+    ffmpeg input options for keyframe_screens: frame times are already snapped to keyframes, so output the
+    keyframe the seek lands on instead of decoding forward from it. Manual frames keep exact seeking.
+    """
+    if keyframe_screens and not (meta or {}).get('manual_frames'):
+        return {'noaccurate_seek': None}
+    return {}
 
 
 async def sanitize_filename(filename):
@@ -40,7 +57,7 @@ async def sanitize_filename(filename):
     return re.sub(r'[<>:"/\\|?*]', '_', filename)
 
 
-async def disc_screenshots(meta, filename, bdinfo, folder_id, base_dir, use_vs, image_list, ffdebug, num_screens=None, force_screenshots=False):
+async def disc_screenshots(meta, filename, bdinfo, folder_id, base_dir, use_vs, image_list, ffdebug, num_screens=None, force_screenshots=False, upload_stream=None):
     screens = meta['screens']
     if meta['debug']:
         start_time = time.time()
@@ -115,10 +132,12 @@ async def disc_screenshots(meta, filename, bdinfo, folder_id, base_dir, use_vs,
         else:
             loglevel = 'quiet'
 
-        ss_times = await valid_ss_time([], num_screens + 1, length, frame_rate)
+        keyframes = await get_keyframe_index(file, f"{base_dir}/tmp/{folder_id}", length, meta['debug']) if keyframe_screens else None
+        ss_times = await valid_ss_time([], num_screens + 1, length, frame_rate, keyframes=keyframes)
         existing_indices = {int(p.split('-')[-1].split('.')[0]) for p in existing_screens}
+        optimize_tasks = {}
         capture_tasks = [
-            capture_disc_task(
+            capture_and_optimize(capture_disc_task(
                 i,
                 file,
                 ss_times[i],
@@ -126,7 +145,7 @@ async def disc_screenshots(meta, filename, bdinfo, folder_id, base_dir, use_vs,
                 keyframe,
                 loglevel,
                 hdr_tonemap
-            )
+            ), optimize_tasks, upload_stream)
             for i in range(num_screens + 1)
         ]
 
@@ -139,16 +158,6 @@ async def disc_screenshots(meta, filename, bdinfo, folder_id, base_dir, use_vs,
         filtered_results.sort(key=lambda x: x[0])  # Ensure order is preserved
         capture_results = [r[1] for r in filtered_results if r[1] is not None]
 
-        if capture_results and len(capture_results) > num_screens:
-            try:
-                smallest = min(capture_results, key=os.path.getsize)
-                if meta['debug']:
-                    console.print(f"[yellow]Removing smallest image: {smallest} ({os.path.getsize(smallest)} bytes)")
-                os.remove(smallest)
-                capture_results.remove(smallest)
-            except Exception as e:
-                console.print(f"[red]Error removing smallest image: {str(e)}")
-
         console.print(f"[green]Successfully captured {len(capture_results)} screenshots.")
 
         optimized_results = []
@@ -158,18 +167,13 @@ async def disc_screenshots(meta, filename, bdinfo, folder_id, base_dir, use_vs,
             console.print("[red]No valid images found for optimization.[/red]")
             return []
 
-        # Dynamically determine the number of processes
-        num_tasks = len(valid_images)
-        num_workers = min(num_tasks, task_limit)
         console.print("[yellow]Now optimizing images...[/yellow]")
-        if meta['debug']:
-            console.print(f"Using {num_workers} worker(s) for {num_tasks} image(s)")
         loop = asyncio.get_running_loop()
         stop_event = asyncio.Event()
 
         def handle_sigint(sig, frame):
             console.print("\n[red]CTRL+C detected. Cancelling optimization...[/red]")
-            executor.shutdown(wait=False)
+            optimize_pool.shutdown(wait=False)
             stop_event.set()
             for task in asyncio.all_tasks(loop):
                 task.cancel()
@@ -177,25 +181,22 @@ async def disc_screenshots(meta, filename, bdinfo, folder_id, base_dir, use_vs,
         signal.signal(signal.SIGINT, handle_sigint)
 
         try:
-            with concurrent.futures.ProcessPoolExecutor(max_workers=num_workers) as executor:
-                tasks = [asyncio.create_task(worker_wrapper(image, optimize_image_task, executor)) for image in valid_images]
-
-                optimized_results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        except KeyboardInterrupt:
-            console.print("\n[red]CTRL+C detected. Cancelling tasks...[/red]")
-            executor.shutdown(wait=False)
-            await kill_all_child_processes()
-            console.print("[red]All tasks cancelled. Exiting.[/red]")
-            sys.exit(1)
+            optimized_results = await asyncio.gather(
+                *[optimize_tasks.get(image) or optimize_pool.optimize(image) for image in valid_images], return_exceptions=True
+            )
         finally:
-            console.print("[yellow]Shutting down optimization workers...[/yellow]")
-            executor.shutdown(wait=False)
-            await asyncio.sleep(0.1)
-            await kill_all_child_processes()
             gc.collect()
 
-        optimized_results = [res for res in optimized_results if not isinstance(res, str) or not res.startswith("Error")]
+        optimized_results = [res for res in optimized_results if isinstance(res, str) and not res.startswith("Error") and os.path.exists(res)]
+        if len(optimized_results) > num_screens:
+            try:
+                smallest = min(optimized_results, key=os.path.getsize)
+                if meta['debug']:
+                    console.print(f"[yellow]Removing smallest image: {smallest} ({os.path.getsize(smallest)} bytes)")
+                os.remove(smallest)
+                optimized_results.remove(smallest)
+            except Exception as e:
+                console.print(f"[red]Error removing smallest image: {str(e)}")
         if meta['debug']:
             console.print("Optimized results:", optimized_results)
 
@@ -240,7 +241,7 @@ async def disc_screenshots(meta, filename, bdinfo, folder_id, base_dir, use_vs,
                             (index, file, random_time, image_path, keyframe, loglevel, hdr_tonemap)
                         )
 
-                        await optimize_image_task(screenshot_response)
+                        await optimize_pool.optimize(screenshot_response)
                         new_size = os.path.getsize(screenshot_response)
                         valid_image = False
 
@@ -279,7 +280,7 @@ async def disc_screenshots(meta, filename, bdinfo, folder_id, base_dir, use_vs,
 
 async def capture_disc_task(index, file, ss_time, image_path, keyframe, loglevel, hdr_tonemap):
     try:
-        ff = ffmpeg.input(file, ss=ss_time, skip_frame=keyframe)
+        ff = ffmpeg.input(file, ss=ss_time, skip_frame=keyframe, **keyframe_seek())
         if hdr_tonemap:
             ff = (
                 ff
@@ -306,7 +307,7 @@ async def capture_disc_task(index, file, ss_time, image_path, keyframe, loglevel
         return None
 
 
-async def dvd_screenshots(meta, disc_num, num_screens=None, retry_cap=None):
+async def dvd_screenshots(meta, disc_num, num_screens=None, retry_cap=None, upload_stream=None):
     screens = meta['screens']
     if 'image_list' not in meta:
         meta['image_list'] = []
@@ -392,6 +393,12 @@ async def dvd_screenshots(meta, disc_num, num_screens=None, retry_cap=None):
     os.chdir(f"{meta['base_dir']}/tmp/{meta['uuid']}")
     voblength, n = await _is_vob_good(0, 0, num_screens)
     ss_times = await valid_ss_time([], num_screens + 1, voblength, frame_rate)
+    if keyframe_screens:
+        # Frames rotate over the VOBs of the main set, so each time is snapped on its own file's index
+        for i in range(num_screens + 1):
+            input_file = f"{meta['discs'][disc_num]['path']}/VTS_{main_set[i % len(main_set)]}"
+            keyframes = await get_keyframe_index(input_file, f"{meta['base_dir']}/tmp/{meta['uuid']}", debug=meta['debug'])
+            ss_times[i] = snap_to_keyframe(ss_times[i], keyframes, voblength / (num_screens + 1) / 2)
     capture_tasks = []
     existing_images = 0
     existing_image_paths = []
@@ -408,14 +415,15 @@ async def dvd_screenshots(meta, disc_num, num_screens=None, retry_cap=None):
         capture_results = existing_image_paths
         return
     else:
+        optimize_tasks = {}
         for i in range(num_screens + 1):
             image = f"{meta['base_dir']}/tmp/{meta['uuid']}/{meta['discs'][disc_num]['name']}-{i}.png"
             input_file = f"{meta['discs'][disc_num]['path']}/VTS_{main_set[i % len(main_set)]}"
             if not os.path.exists(image) or meta.get('retake', False):
                 capture_tasks.append(
-                    capture_dvd_screenshot(
+                    capture_and_optimize(capture_dvd_screenshot(
                         (i, input_file, image, ss_times[i], meta, width, height, w_sar, h_sar)
-                    )
+                    ), optimize_tasks, upload_stream)
                 )
 
         capture_results = []
@@ -428,35 +436,12 @@ async def dvd_screenshots(meta, disc_num, num_screens=None, retry_cap=None):
         filtered_results.sort(key=lambda x: x[0])  # Ensure order is preserved
         capture_results = [r[1] for r in filtered_results if r[1] is not None]
 
-        if capture_results and len(capture_results) > num_screens:
-            smallest = None
-            smallest_size = float('inf')
-            for screens in glob.glob1(f"{meta['base_dir']}/tmp/{meta['uuid']}/", f"{meta['discs'][disc_num]['name']}-*"):
-                screen_path = os.path.join(f"{meta['base_dir']}/tmp/{meta['uuid']}/", screens)
-                try:
-                    screen_size = os.path.getsize(screen_path)
-                    if screen_size < smallest_size:
-                        smallest_size = screen_size
-                        smallest = screen_path
-                except FileNotFoundError:
-                    console.print(f"[red]File not found: {screen_path}[/red]")  # Handle potential edge cases
-                    continue
-
-            if smallest:
-                if meta['debug']:
-                    console.print(f"[yellow]Removing smallest image: {smallest} ({smallest_size} bytes)[/yellow]")
-                os.remove(smallest)
-
         optimized_results = []
 
         # Filter out non-existent files first
         valid_images = [image for image in capture_results if os.path.exists(image)]
 
-        # Dynamically determine the number of processes
-        num_tasks = len(valid_images)
-        num_workers = min(num_tasks, task_limit)
-
-        if num_workers == 0:
+        if not valid_images:
             console.print("[red]No valid images found for optimization.[/red]")
             return
         console.print("[yellow]Now optimizing images...[/yellow]")
@@ -466,7 +451,7 @@ async def dvd_screenshots(meta, disc_num, num_screens=None, retry_cap=None):
 
         def handle_sigint(sig, frame):
             console.print("\n[red]CTRL+C detected. Cancelling optimization...[/red]")
-            executor.shutdown(wait=False)
+            optimize_pool.shutdown(wait=False)
             stop_event.set()
             for task in asyncio.all_tasks(loop):
                 task.cancel()
@@ -474,33 +459,26 @@ async def dvd_screenshots(meta, disc_num, num_screens=None, retry_cap=None):
         signal.signal(signal.SIGINT, handle_sigint)
 
         try:
-            with concurrent.futures.ProcessPoolExecutor(max_workers=num_workers) as executor:
-                # Start all tasks in parallel using worker_wrapper()
-                tasks = [asyncio.create_task(worker_wrapper(image, optimize_image_task, executor)) for image in valid_images]
-
-                # Wait for all tasks to complete
-                optimized_results = await asyncio.gather(*tasks, return_exceptions=True)
-        except KeyboardInterrupt:
-            console.print("\n[red]CTRL+C detected. Cancelling tasks...[/red]")
-            executor.shutdown(wait=False)
-            await kill_all_child_processes()
-            console.print("[red]All tasks cancelled. Exiting.[/red]")
-            sys.exit(1)
+            # Captured frames were handed to the optimisation pool as they finished, wait for the rest
+            optimized_results = await asyncio.gather(
+                *[optimize_tasks.get(image) or optimize_pool.optimize(image) for image in valid_images], return_exceptions=True
+            )
         finally:
-            console.print("[yellow]Shutting down optimization workers...[/yellow]")
-            await asyncio.sleep(0.1)
-            await kill_all_child_processes()
-            executor.shutdown(wait=False)
             gc.collect()
 
-        optimized_results = [res for res in optimized_results if not isinstance(res, str) or not res.startswith("Error")]
+        optimized_results = [res for res in optimized_results if isinstance(res, str) and not res.startswith("Error") and os.path.exists(res)]
+
+        if len(optimized_results) > num_screens:
+            smallest = min(optimized_results, key=os.path.getsize)
+            if meta['debug']:
+                console.print(f"[yellow]Removing smallest image: {smallest} ({os.path.getsize(smallest)} bytes)[/yellow]")
+            os.remove(smallest)
+            optimized_results.remove(smallest)
 
         if meta['debug']:
             console.print("Optimized results:", optimized_results)
         console.print(f"[green]Successfully optimized {len(optimized_results)} images.")
 
-        executor.shutdown(wait=True)  # Ensure cleanup
-
         valid_results = []
         remaining_retakes = []
 
@@ -548,7 +526,7 @@ async def dvd_screenshots(meta, disc_num, num_screens=None, retry_cap=None):
                             console.print(f"[red]Failed to capture screenshot for {image}. Retrying...[/red]")
                             continue
 
-                        await optimize_image_task(screenshot_result)
+                        await optimize_pool.optimize(screenshot_result)
 
                         retaken_size = os.path.getsize(screenshot_result)
                         if retaken_size > 75000:
@@ -583,7 +561,7 @@ async def capture_dvd_screenshot(task):
             seek_time = max(0, video_duration - 1)
 
         # Construct ffmpeg command
-        ff = ffmpeg.input(input_file, ss=seek_time)
+        ff = ffmpeg.input(input_file, ss=seek_time, **keyframe_seek(meta))
         if w_sar != 1 or h_sar != 1:
             ff = ff.filter('scale', int(round(width * w_sar)), int(round(height * h_sar)))
 
@@ -613,7 +591,7 @@ async def capture_dvd_screenshot(task):
         return (index, None)
 
 
-async def screenshots(path, filename, folder_id, base_dir, meta, num_screens=None, force_screenshots=False, manual_frames=None):
+async def screenshots(path, filename, folder_id, base_dir, meta, num_screens=None, force_screenshots=False, manual_frames=None, upload_stream=None):
     screens = meta['screens']
     if meta['debug']:
         start_time = time.time()
@@ -660,6 +638,8 @@ async def screenshots(path, filename, folder_id, base_dir, meta, num_screens=Non
     loglevel = 'verbose' if meta.get('ffdebug', False) else 'quiet'
     os.chdir(f"{base_dir}/tmp/{folder_id}")
 
+    # One frame more than needed is captured, the smallest is dropped as the likely bad frame
+    total_frames = num_screens + 1
     if manual_frames:
         if meta.get('debug', False):
             console.print(f"[yellow]Using manual frames: {manual_frames}")
@@ -675,13 +655,36 @@ async def screenshots(path, filename, folder_id, base_dir, meta, num_screens=Non
             console.print(f"[red]Error processing manual frames: {e}. Using auto-generated frames.[/red]")
             ss_times = await valid_ss_time([], num_screens + 1, length, frame_rate, exclusion_zone=500)
     else:
-        ss_times = await valid_ss_time([], num_screens + 1, length, frame_rate, exclusion_zone=500)
+        keyframes = None
+        video_file = meta['filelist'][0] if os.path.isdir(path) and meta.get('filelist') else path
+        if keyframe_screens:
+            keyframes = await get_keyframe_index(video_file, f"{base_dir}/tmp/{folder_id}", length, meta['debug'])
+        ss_times = await valid_ss_time([], num_screens + 1, length, frame_rate, exclusion_zone=500, keyframes=keyframes)
+
+        if frame_screening:
+            from src.framescreen import screen_frame_times
+
+            async def repick(accepted_times, count):
+                times = await valid_ss_time(accepted_times, count - 1, length, frame_rate, exclusion_zone=500, keyframes=keyframes)
+                return [ss_time for ss_time in times if ss_time not in accepted_times]
+
+            # Bad and duplicate frames are rejected before any PNG is encoded, so no spare frame is captured
+            screened_times = await screen_frame_times(video_file, ss_times, num_screens, repick, keyframe_seek(meta), meta)
+            if screened_times:
+                ss_times = screened_times
+                total_frames = num_screens
 
     if meta['debug']:
         console.print(f"[green]Final list of frames for screenshots: {ss_times}")
 
     sanitized_filename = await sanitize_filename(filename)
 
+    if total_frames == num_screens:
+        # Screened frames need no spare, one left by an earlier unscreened run would be uploaded with the rest
+        spare_path = os.path.abspath(f"{base_dir}/tmp/{folder_id}/{sanitized_filename}-{num_screens}.png")
+        if os.path.exists(spare_path):
+            os.remove(spare_path)
+
     tone_map = meta.get('tone_map', False)
     if tone_map and "HDR" in meta['hdr']:
         hdr_tonemap = True
@@ -690,7 +693,7 @@ async def screenshots(path, filename, folder_id, base_dir, meta, num_screens=Non
 
     existing_images_count = 0
     existing_image_paths = []
-    for i in range(num_screens + 1):
+    for i in range(total_frames):
         image_path = os.path.abspath(f"{base_dir}/tmp/{folder_id}/{sanitized_filename}-{i}.png")
         if os.path.exists(image_path) and not meta.get('retake', False):
             existing_images_count += 1
@@ -700,25 +703,45 @@ async def screenshots(path, filename, folder_id, base_dir, meta, num_screens=Non
         console.print("[yellow]The correct number of screenshots already exists. Skipping capture process.")
         return existing_image_paths
 
-    num_capture = num_screens + 1 - existing_images_count
+    num_capture = total_frames - existing_images_count
     num_tasks = num_capture
     num_workers = min(num_tasks, task_limit)
 
     if meta['debug']:
         console.print(f"Using {num_workers} worker(s) for {num_capture} image(s)")
 
-    capture_tasks = []
-    for i in range(num_screens + 1):
+    captures = []
+    for i in range(total_frames):
         image_path = os.path.abspath(f"{base_dir}/tmp/{folder_id}/{sanitized_filename}-{i}.png")
         if not os.path.exists(image_path) or meta.get('retake', False):
-            capture_tasks.append(
-                capture_screenshot(  # Direct async function call
-                    (i, path, ss_times[i], image_path, width, height, w_sar, h_sar, loglevel, meta.get('hdr_tonemap', False), meta)
-                )
-            )
+            captures.append((i, ss_times[i], image_path))
 
+    capture_args = (width, height, w_sar, h_sar, loglevel, meta.get('hdr_tonemap', False), meta)
+    optimize_tasks = {}
     try:
-        results = await asyncio.gather(*capture_tasks, return_exceptions=True)
+        if multi_capture:
+            # One ffmpeg process per batch of frames, frames that fail are retried one process each
+            batches = [captures[i:i + MULTI_CAPTURE_BATCH] for i in range(0, len(captures), MULTI_CAPTURE_BATCH)]
+            batch_results = await asyncio.gather(
+                *[capture_and_optimize(capture_screenshots_multi(path, batch, *capture_args), optimize_tasks, upload_stream) for batch in batches],
+                return_exceptions=True
+            )
+            results = []
+            for batch, batch_result in zip(batches, batch_results):
+                if isinstance(batch_result, BaseException):
+                    batch_result = [(index, None) for index, _, _ in batch]
+                results.extend(r for r in batch_result if r[1] is not None)
+            captured = {r[0] for r in results}
+            failed = [(i, ss_time, image_path) for i, ss_time, image_path in captures if i not in captured]
+            if failed and meta['debug']:
+                console.print(f"[yellow]Retrying {len(failed)} frame(s) with one ffmpeg process each")
+        else:
+            results = []
+            failed = captures
+        results += await asyncio.gather(
+            *[capture_and_optimize(capture_screenshot((i, path, ss_time, image_path, *capture_args)), optimize_tasks, upload_stream) for i, ss_time, image_path in failed],
+            return_exceptions=True
+        )
         capture_results = [r for r in results if isinstance(r, tuple) and len(r) == 2]
         capture_results.sort(key=lambda x: x[0])
         capture_results = [r[1] for r in capture_results if r[1] is not None]
@@ -726,67 +749,52 @@ async def screenshots(path, filename, folder_id, base_dir, meta, num_screens=Non
     except KeyboardInterrupt:
         console.print("\n[red]CTRL+C detected. Cancelling capture tasks...[/red]")
         await asyncio.sleep(0.1)
+        optimize_pool.shutdown()
         await kill_all_child_processes()
         console.print("[red]All tasks cancelled. Exiting.[/red]")
         gc.collect()
         sys.exit(1)
     except asyncio.CancelledError:
+        for task in optimize_tasks.values():
+            task.cancel()
         await asyncio.sleep(0.1)
         await kill_all_child_processes()
         gc.collect()
         raise
     except Exception as e:
         console.print(f"[red]Error during screenshot capture: {e}[/red]")
+        for task in optimize_tasks.values():
+            task.cancel()
         await asyncio.sleep(0.1)
         await kill_all_child_processes()
         gc.collect()
         return []
-    finally:
-        await asyncio.sleep(0.1)
-        await kill_all_child_processes()
-        console.print("[yellow]All capture tasks finished. Cleaning up...[/yellow]")
 
     console.print(f"[green]Successfully captured {len(capture_results)} screenshots.")
 
-    if len(capture_results) > num_screens:
-        smallest = min(capture_results, key=os.path.getsize)
-        if meta['debug']:
-            console.print(f"[yellow]Removing smallest image: {smallest} ({os.path.getsize(smallest)} bytes)")
-        os.remove(smallest)
-        capture_results.remove(smallest)
-
-    optimized_results = []
+    # Captured frames were handed to the optimisation pool as they finished, wait for the rest
     valid_images = [image for image in capture_results if os.path.exists(image)]
-    num_workers = min(task_limit, len(capture_results))
-    console.print("[yellow]Now optimizing images...[/yellow]")
-    if meta['debug']:
-        console.print(f"Using {num_workers} worker(s) for {len(capture_results)} image(s)")
-
-    executor = concurrent.futures.ProcessPoolExecutor(max_workers=num_workers)
+    if optimize_images:
+        console.print("[yellow]Now optimizing images...[/yellow]")
     try:
-        with executor:
-            # Start all tasks in parallel using worker_wrapper()
-            tasks = [asyncio.create_task(worker_wrapper(image, optimize_image_task, executor)) for image in valid_images]
-
-            # Wait for all tasks to complete
-            optimized_results = await asyncio.gather(*tasks, return_exceptions=True)
-    except KeyboardInterrupt:
-        console.print("\n[red]CTRL+C detected. Cancelling optimization tasks...[/red]")
-        await asyncio.sleep(0.1)
-        executor.shutdown(wait=True, cancel_futures=True)
-        await kill_all_child_processes()
-        console.print("[red]All tasks cancelled. Exiting.[/red]")
-        gc.collect()
-        sys.exit(1)
-    finally:
-        console.print("[yellow]Shutting down optimization workers...[/yellow]")
-        await asyncio.sleep(0.1)
-        executor.shutdown(wait=True, cancel_futures=True)
-        for task in tasks:
+        optimized_results = await asyncio.gather(
+            *[optimize_tasks.get(image) or optimize_pool.optimize(image) for image in valid_images], return_exceptions=True
+        )
+    except asyncio.CancelledError:
+        for task in optimize_tasks.values():
             task.cancel()
-        await kill_all_child_processes()
+        raise
+    finally:
         gc.collect()
 
+    optimized_results = [res for res in optimized_results if isinstance(res, str) and "Error" not in res and os.path.exists(res)]
+    if len(optimized_results) > num_screens:
+        smallest = min(optimized_results, key=os.path.getsize)
+        if meta['debug']:
+            console.print(f"[yellow]Removing smallest image: {smallest} ({os.path.getsize(smallest)} bytes)")
+        os.remove(smallest)
+        optimized_results.remove(smallest)
+
     # Filter out failed results
     optimized_results = [res for res in optimized_results if isinstance(res, str) and "Error" not in res]
     console.print(f"[green]Successfully optimized {len(optimized_results)} images.[/green]")
@@ -835,7 +843,7 @@ async def screenshots(path, filename, folder_id, base_dir, meta, num_screens=Non
                     if not os.path.exists(screenshot_response):
                         raise FileNotFoundError(f"Screenshot {screenshot_response} was not created successfully.")
 
-                    await optimize_image_task(screenshot_response)
+                    await optimize_pool.optimize(screenshot_response)
                     new_size = os.path.getsize(screenshot_response)
                     valid_image = False
 
@@ -928,18 +936,7 @@ async def capture_screenshot(args):
             console.print(f"[cyan]Processing file: {path}[/cyan]")
 
         # Proceed with screenshot capture
-        ff = ffmpeg.input(path, ss=ss_time)
-        if w_sar != 1 or h_sar != 1:
-            ff = ff.filter('scale', int(round(width * w_sar)), int(round(height * h_sar)))
-
-        if hdr_tonemap:
-            ff = (
-                ff
-                .filter('zscale', transfer='linear')
-                .filter('tonemap', tonemap='mobius', desat=10.0)
-                .filter('zscale', transfer='bt709')
-                .filter('format', 'rgb24')
-            )
+        ff = screenshot_filters(ffmpeg.input(path, ss=ss_time, **keyframe_seek(meta)), width, height, w_sar, h_sar, hdr_tonemap)
 
         command = (
             ff
@@ -986,7 +983,71 @@ async def capture_screenshot(args):
         return f"Error: {str(e)}"
 
 
-async def valid_ss_time(ss_times, num_screens, length, frame_rate, exclusion_zone=None):
+def screenshot_filters(ff, width, height, w_sar, h_sar, hdr_tonemap):
+    """Apply the anamorphic scale and optional HDR tonemap chain to a screenshot input stream."""
+    if w_sar != 1 or h_sar != 1:
+        ff = ff.filter('scale', int(round(width * w_sar)), int(round(height * h_sar)))
+
+    if hdr_tonemap:
+        ff = (
+            ff
+            .filter('zscale', transfer='linear')
+            .filter('tonemap', tonemap='mobius', desat=10.0)
+            .filter('zscale', transfer='bt709')
+            .filter('format', 'rgb24')
+        )
+    return ff
+
+
+async def capture_screenshots_multi(path, captures, width, height, w_sar, h_sar, loglevel, hdr_tonemap, meta):
+    """
+    Capture several frames of one file with a single ffmpeg process. Every timestamp is its own
+    input seeked with -ss feeding its own PNG output, so process start-up, library and filter
+    initialisation are paid once per batch instead of once per frame.
+    captures is [(index, ss_time, image_path)], returns [(index, image_path or None)].
+    """
+    path = os.path.normpath(path)
+    if os.path.isdir(path) and meta.get('filelist'):
+        path = meta['filelist'][0]
+    if not os.path.exists(path) or width <= 0 or height <= 0:
+        return [(index, None) for index, _, _ in captures]
+
+    outputs = []
+    for index, ss_time, image_path in captures:
+        if os.path.exists(image_path):
+            os.remove(image_path)
+        ff = screenshot_filters(ffmpeg.input(path, ss=max(ss_time, 0), **keyframe_seek(meta))['v:0'], width, height, w_sar, h_sar, hdr_tonemap)
+        outputs.append(ff.output(image_path, vframes=1, pix_fmt="rgb24"))
+
+    command = (
+        ffmpeg.merge_outputs(*outputs)
+        .overwrite_output()
+        .global_args('-loglevel', loglevel)
+    )
+    if loglevel == 'verbose' or meta.get('debug', False):
+        console.print(f"[cyan]FFmpeg command: {' '.join(command.compile())}[/cyan]")
+
+    process = await asyncio.create_subprocess_exec(
+        *command.compile(),
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+    try:
+        stdout, stderr = await process.communicate()
+    except asyncio.CancelledError:
+        process.kill()
+        raise
+
+    if process.returncode != 0:
+        console.print(f"[red]FFmpeg error capturing screenshots: {stderr.decode('utf-8', errors='replace')}[/red]")
+    return [(index, image_path if os.path.exists(image_path) else None) for index, _, image_path in captures]
+
+
+async def valid_ss_time(ss_times, num_screens, length, frame_rate, exclusion_zone=None, keyframes=None):
+    """
+    Pick one random frame time per section of the middle of the video, keeping exclusion_zone seconds between picks.
+    With a keyframe index, each pick is snapped to the nearest keyframe within its section before the exclusion check.
+    """
     total_screens = num_screens + 1
 
     if exclusion_zone is None:
@@ -1006,6 +1067,9 @@ async def valid_ss_time(ss_times, num_screens, length, frame_rate, exclusion_zon
             attempts += 1
             frame = random.randint(start_frame, end_frame)
             time = frame / frame_rate
+            if keyframes:
+                time = snap_to_keyframe(time, keyframes, section_size / 2)
+                frame = round(time * frame_rate)
 
             if all(abs(frame - existing_time * frame_rate) > exclusion_zone * frame_rate for existing_time in result_times):
                 result_times.append(time)
@@ -1020,27 +1084,96 @@ async def valid_ss_time(ss_times, num_screens, length, frame_rate, exclusion_zon
     return result_times
 
 
-async def worker_wrapper(image, optimize_image_task, executor):
-    """ Async wrapper to run optimize_image_task in a separate process """
-    loop = asyncio.get_running_loop()
-    try:
-        return await loop.run_in_executor(executor, optimize_image_task, image)
-    except KeyboardInterrupt:
-        console.print(f"[red][{time.strftime('%X')}] Worker interrupted while processing {image}[/red]")
-        gc.collect()
-        return None
-    except Exception as e:
-        console.print(f"[red][{time.strftime('%X')}] Worker error on {image}: {e}[/red]")
-        gc.collect()
-        return f"Error: {e}"
-    finally:
-        gc.collect()
+class OptimizePool:
+    """
+    Process pool for optimize_image_task, created on first use and kept for the whole run so queue items
+    do not respawn workers. Images are submitted one by one as soon as they are captured.
+    Records time taken and bytes saved per image.
+    """
+
+    def __init__(self, max_workers):
+        self.max_workers = max(1, max_workers)
+        self.executor = None
+        self.stats = []
+
+    def get_executor(self):
+        if self.executor is None or getattr(self.executor, '_broken', False):
+            self.executor = concurrent.futures.ProcessPoolExecutor(max_workers=self.max_workers)
+        return self.executor
+
+    def worker_pids(self):
+        if self.executor is None:
+            return set()
+        return set((getattr(self.executor, '_processes', None) or {}).keys())
+
+    async def optimize(self, image):
+        """Optimize image in place, returns the image path or an "Error: ..." string."""
+        if not optimize_images:
+            return image
+        if not os.path.exists(image):
+            return f"Error: File not found - {image}"
+        size_before = os.path.getsize(image)
+        start = time.time()
+        loop = asyncio.get_running_loop()
+        try:
+            try:
+                result = await loop.run_in_executor(self.get_executor(), optimize_image_task, image)
+            except concurrent.futures.BrokenExecutor:
+                # Workers were killed (e.g. by a full cleanup between items), start a fresh pool once
+                self.executor = None
+                result = await loop.run_in_executor(self.get_executor(), optimize_image_task, image)
+        except Exception as e:
+            console.print(f"[red][{time.strftime('%X')}] Worker error on {image}: {e}[/red]")
+            return f"Error: {e}"
+        if isinstance(result, str) and os.path.exists(result):
+            self.stats.append((os.path.basename(image), time.time() - start, size_before, os.path.getsize(result)))
+        return result
+
+    def report(self):
+        """Print per-image optimisation time and bytes saved for this run."""
+        if not self.stats:
+            return
+        console.print("[bold]Image optimization:[/bold]")
+        for name, elapsed, before, after in self.stats:
+            console.print(f"  {name}: {elapsed:.2f}s, {before / 1048576:.2f} MiB -> {after / 1048576:.2f} MiB ({(before - after) / 1048576:.2f} MiB saved)")
+        total_before = sum(stat[2] for stat in self.stats)
+        total_after = sum(stat[3] for stat in self.stats)
+        console.print(f"  {len(self.stats)} image(s), {sum(stat[1] for stat in self.stats):.2f}s worker time, {(total_before - total_after) / 1048576:.2f} MiB saved")
+
+    def shutdown(self, wait=True):
+        if self.executor is not None:
+            self.executor.shutdown(wait=wait, cancel_futures=True)
+            self.executor = None
+
+
+optimize_pool = OptimizePool(task_limit)
+
+
+async def capture_and_optimize(capture, optimize_tasks, upload_stream=None):
+    """
+    Await a capture coroutine and hand every image it produced to the optimisation pool straight away.
+    With an upload_stream, each optimised image is published for upload as soon as it is ready.
+    """
+    result = await capture
+    for item in (result if isinstance(result, list) else [result]):
+        if (optimize_images or upload_stream is not None) and isinstance(item, tuple) and len(item) == 2 and item[1] is not None:
+            optimize_tasks[item[1]] = asyncio.create_task(optimize_and_publish(item[1], upload_stream))
+    return result
+
+
+async def optimize_and_publish(image, upload_stream=None):
+    result = await optimize_pool.optimize(image)
+    # Frames below the retake threshold are not published, upload_stream.finish() picks up their retakes
+    if upload_stream is not None and isinstance(result, str) and os.path.exists(result) and os.path.getsize(result) > 75000:
+        upload_stream.publish(result)
+    return result
 
 
 async def kill_all_child_processes():
     """Ensures all child processes (e.g., ProcessPoolExecutor workers) are terminated."""
     current_process = psutil.Process()
     children = current_process.children(recursive=True)  # Get child processes once
+    children = [child for child in children if child.pid not in background_pids and child.pid not in optimize_pool.worker_pids()]
 
     for child in children:
         console.print(f"[red]Killing stuck worker process: {child.pid}[/red]")
@@ -11,6 +11,7 @@ from difflib import SequenceMatcher
 import requests
 import json
 import httpx
+from src.httpcache import cached_client
 
 TMDB_API_KEY = config['DEFAULT'].get('tmdb_api', False)
 TMDB_BASE_URL = "https://api.themoviedb.org/3"
@@ -30,7 +31,7 @@ async def get_tmdb_from_imdb(imdb_id, tvdb_id=None, search_year=None, filename=N
         url = f"{TMDB_BASE_URL}/find/{external_id}"
         params = {"api_key": TMDB_API_KEY, "external_source": source}
 
-        async with httpx.AsyncClient() as client:
+        async with cached_client() as client:
             try:
                 response = await client.get(url, params=params, timeout=10)
                 response.raise_for_status()
@@ -117,7 +118,7 @@ async def get_tmdb_id(filename, search_year, meta, category, untouched_filename=
     search_results = {"results": []}
     secondary_results = {"results": []}
 
-    async with httpx.AsyncClient() as client:
+    async with cached_client() as client:
         try:
             # Primary search attempt with year
             if category == "MOVIE":
@@ -380,7 +381,7 @@ async def tmdb_other_meta(
     title = None
     year = None
 
-    async with httpx.AsyncClient() as client:
+    async with cached_client() as client:
         if category == "MOVIE":
             # Get movie details
             response = await client.get(
@@ -679,7 +680,7 @@ async def get_keywords(tmdb_id, category):
     endpoint = "movie" if category == "MOVIE" else "tv"
     url = f"{TMDB_BASE_URL}/{endpoint}/{tmdb_id}/keywords"
 
-    async with httpx.AsyncClient() as client:
+    async with cached_client() as client:
         try:
             response = await client.get(url, params={"api_key": TMDB_API_KEY})
             response.raise_for_status()
@@ -724,7 +725,7 @@ async def get_directors(tmdb_id, category):
     endpoint = "movie" if category == "MOVIE" else "tv"
     url = f"{TMDB_BASE_URL}/{endpoint}/{tmdb_id}/credits"
 
-    async with httpx.AsyncClient() as client:
+    async with cached_client() as client:
         try:
             response = await client.get(url, params={"api_key": TMDB_API_KEY})
             response.raise_for_status()
@@ -894,7 +895,7 @@ async def get_tmdb_imdb_from_mediainfo(mediainfo, category, is_disc, tmdbid, imd
 async def daily_to_tmdb_season_episode(tmdbid, date):
     date = datetime.fromisoformat(str(date))
 
-    async with httpx.AsyncClient() as client:
+    async with cached_client() as client:
         # Get TV show information to get seasons
         response = await client.get(
             f"{TMDB_BASE_URL}/tv/{tmdbid}",
@@ -936,7 +937,7 @@ async def daily_to_tmdb_season_episode(tmdbid, date):
 
 
 async def get_episode_details(tmdb_id, season_number, episode_number, debug=False):
-    async with httpx.AsyncClient() as client:
+    async with cached_client() as client:
         try:
             # Get episode details
             response = await client.get(
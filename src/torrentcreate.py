@@ -11,7 +11,17 @@ import time
 import subprocess
 import sys
 import platform
+import asyncio
 from src.console import console
+from src.cleanup import background_pids
+from src.piecehash import hash_pieces_multi
+
+# Largest piece size accepted by trackers that cap it below what calculate_piece_size may pick
+TRACKER_PIECE_SIZE_CAPS = {
+    'MTV': 8388608,  # 8 MiB
+    'HDB': 16777216,  # 16 MiB
+    'PTP': 16777216,  # 16 MiB
+}
 
 
 def calculate_piece_size(total_size, min_size, max_size, files, meta):
@@ -121,8 +131,61 @@ class CustomTorrent(torf.Torrent):
             self.piece_size = calculate_piece_size(total_size, self.piece_size_min, self.piece_size_max, self.files, meta)
         self.metainfo['info']['piece length'] = self.piece_size  # Ensure 'piece length' is set
 
-
-def create_torrent(meta, path, output_filename):
+    def generate(self, threads=None, callback=None, interval=0, extra_piece_sizes=None):
+        """
+        Hash with the built-in threaded engine when 'native_hash' is set or extra_piece_sizes are requested,
+        otherwise defer to torf. Hashes for extra_piece_sizes are computed from the same read of the data
+        and stored in self.piece_variants as {piece_size: pieces}.
+        """
+        self.piece_variants = {}
+        if not self._meta.get('native_hash') and not extra_piece_sizes:
+            return super().generate(threads=threads, callback=callback, interval=interval)
+
+        if callback is not None:
+            def native_cb(filepath, pieces_done, pieces_total):
+                return callback(self, filepath, pieces_done, pieces_total)
+        else:
+            native_cb = None
+
+        piece_sizes = [self.piece_size] + [size for size in (extra_piece_sizes or []) if size != self.piece_size]
+        pieces = hash_pieces_multi(self.filepaths, piece_sizes, threads=threads or self._meta.get('hash_threads'), callback=native_cb, interval=interval)
+        if pieces is None:
+            return False
+        self.metainfo['info']['pieces'] = pieces.pop(self.piece_size)
+        self.piece_variants = pieces
+        return True
+
+
+def get_piece_size_caps(meta):
+    """Piece size caps of the trackers selected for this upload."""
+    trackers = meta.get('trackers') or []
+    return sorted({cap for tracker, cap in TRACKER_PIECE_SIZE_CAPS.items() if tracker in trackers})
+
+
+def variant_filename(output_filename, piece_size):
+    """Name (without .torrent) of the copy of output_filename hashed with piece_size."""
+    return f"{output_filename}-{piece_size // 1048576}MiB"
+
+
+def find_piece_size_variant(meta, max_piece_size, output_filename="BASE"):
+    """Return the name of the largest variant of output_filename within max_piece_size, or None."""
+    size = max_piece_size
+    while size >= torf.Torrent.piece_size_min:
+        name = variant_filename(output_filename, size)
+        if os.path.exists(f"{meta['base_dir']}/tmp/{meta['uuid']}/{name}.torrent"):
+            return name
+        size //= 2
+    return None
+
+
+def create_torrent(meta, path, output_filename, progress=None, piece_sizes=None):
+    """
+    Create a .torrent for path in tmp/<uuid>/.
+    When a progress dict is given, hashing progress is stored in it instead of drawn to the terminal,
+    so the caller can report it (see create_torrent_background).
+    piece_sizes lists piece size caps required by trackers; any cap below the chosen piece size is
+    hashed from the same read of the data and written as a variant_filename() copy.
+    """
     if meta['debug']:
         start_time = time.time()
 
@@ -131,7 +194,6 @@ def create_torrent(meta, path, output_filename):
             cli_ui.info('--keep-folder was specified. Using complete folder for torrent creation.')
             path = path
         else:
-            os.chdir(path)
             globs = glob.glob1(path, "*.mkv") + glob.glob1(path, "*.mp4") + glob.glob1(path, "*.ts")
             no_sample_globs = [
                 os.path.abspath(f"{path}{os.sep}{file}") for file in globs
@@ -155,6 +217,7 @@ def create_torrent(meta, path, output_filename):
 
             cmd = [mkbrr_binary, "create", path, "-o", output_path]
             process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1)
+            background_pids.add(process.pid)
 
             total_pieces = 100  # Default to 100% for scaling progress
             pieces_done = 0
@@ -178,13 +241,17 @@ def create_torrent(meta, path, output_filename):
                     else:
                         eta = "--:--"  # Placeholder if we can't estimate yet
 
-                    cli_ui.info_progress(f"mkbrr hashing... {speed} | ETA: {eta}", pieces_done, total_pieces)
+                    if progress is not None:
+                        progress.update({'percent': pieces_done, 'speed': speed, 'eta': eta})
+                    else:
+                        cli_ui.info_progress(f"mkbrr hashing... {speed} | ETA: {eta}", pieces_done, total_pieces)
 
                 # Detect final output line
                 if "Wrote" in line and ".torrent" in line:
                     console.print(f"[bold cyan]{line}")  # Print the final torrent file creation message
 
             process.wait()
+            background_pids.discard(process.pid)
             return output_path
         except subprocess.CalledProcessError as e:
             console.print(f"[bold red]Error creating torrent: {e.stderr}")
@@ -205,10 +272,25 @@ def create_torrent(meta, path, output_filename):
     )
 
     torrent.validate_piece_size(meta)
-    torrent.generate(callback=torf_cb, interval=5)
-    torrent.write(f"{meta['base_dir']}/tmp/{meta['uuid']}/{output_filename}.torrent", overwrite=True)
+    for stale in glob.glob(glob.escape(f"{meta['base_dir']}/tmp/{meta['uuid']}/{output_filename}-") + "*MiB.torrent"):
+        os.remove(stale)
+    extra_piece_sizes = sorted({size for size in (piece_sizes or []) if size < torrent.piece_size}, reverse=True)
+    if progress is not None:
+        torrent.generate(callback=lambda *args: torf_progress_cb(progress, *args), interval=5, extra_piece_sizes=extra_piece_sizes)
+    else:
+        torrent.generate(callback=torf_cb, interval=5, extra_piece_sizes=extra_piece_sizes)
+    output_path = f"{meta['base_dir']}/tmp/{meta['uuid']}/{output_filename}.torrent"
+    torrent.write(output_path, overwrite=True)
     torrent.verify_filesize(path)
 
+    for piece_size, pieces in torrent.piece_variants.items():
+        variant = Torrent.read(output_path)
+        variant.metainfo['info']['piece length'] = piece_size
+        variant.metainfo['info']['pieces'] = pieces
+        variant.write(f"{meta['base_dir']}/tmp/{meta['uuid']}/{variant_filename(output_filename, piece_size)}.torrent", overwrite=True)
+        if meta['debug']:
+            console.print(f"Wrote {piece_size // 1048576} MiB piece size variant of {output_filename}.torrent")
+
     if meta['debug']:
         finish_time = time.time()
         console.print(f"torrent created in {finish_time - start_time:.4f} seconds")
@@ -254,6 +336,42 @@ def torf_cb(torrent, filepath, pieces_done, pieces_total):
     cli_ui.info_progress(f"Hashing... {speed_str} | ETA: {eta}", int(percentage_done), 100)
 
 
+def torf_progress_cb(progress, torrent, filepath, pieces_done, pieces_total):
+    if pieces_done == 0 or 'start' not in progress:
+        progress['start'] = time.time()
+    elapsed_time = time.time() - progress['start']
+    percentage_done = (pieces_done / pieces_total) * 100 if pieces_total > 0 else 0
+
+    if pieces_done > 0 and elapsed_time > 0:
+        eta_seconds = max(0, elapsed_time / (pieces_done / pieces_total) - elapsed_time)
+        eta = time.strftime("%M:%S", time.gmtime(eta_seconds))
+        speed_str = f"{(pieces_done * torrent.piece_size / (1024 * 1024)) / elapsed_time:.2f} MB/s"
+    else:
+        eta = "--:--"
+        speed_str = "-- MB/s"
+
+    progress.update({'percent': int(percentage_done), 'speed': speed_str, 'eta': eta})
+
+
+async def create_torrent_background(meta, path, output_filename, interval=15, piece_sizes=None):
+    """
+    Run create_torrent in a worker thread so the event loop (screenshots, image uploads)
+    keeps running while the content is hashed. Progress is reported from the loop every interval seconds.
+    """
+    progress = {'percent': 0, 'speed': "-- MB/s", 'eta': "--:--"}
+    task = asyncio.ensure_future(asyncio.to_thread(create_torrent, meta, path, output_filename, progress, piece_sizes))
+    try:
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=interval)
+            if done:
+                break
+            console.print(f"[cyan]Hashing {output_filename}.torrent in background... {progress['percent']}% | {progress['speed']} | ETA: {progress['eta']}")
+    except asyncio.CancelledError:
+        task.cancel()
+        raise
+    return task.result()
+
+
 def create_random_torrents(base_dir, uuid, num, path):
     manual_name = re.sub(r"[^0-9a-zA-Z\[\]\'\-]+", ".", os.path.basename(path))
     base_torrent = Torrent.read(f"{base_dir}/tmp/{uuid}/BASE.torrent")
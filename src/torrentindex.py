@@ -0,0 +1,170 @@
+import os
+import json
+import time
+import sqlite3
+from contextlib import contextmanager
+from torf import Torrent
+from src.console import console
+
+# Page size used when walking qBittorrent's torrent list newest first
+QBIT_PAGE_SIZE = 200
+# Do a complete resync of a client (to drop removed torrents) at most this often
+FULL_SYNC_INTERVAL = 24 * 60 * 60
+
+
+class TorrentIndex:
+    """
+    Persistent SQLite index of the torrents known to a torrent client, keyed by content name,
+    total size and file list, so reuse lookups are an indexed query instead of a walk over the client.
+
+    Rows come from either a torrent_storage_dir (BT_backup style <hash>.torrent files, refreshed by mtime)
+    or the qBittorrent API (refreshed incrementally by added_on). File lists from the API are fetched lazily,
+    only for torrents whose name matches a lookup.
+    """
+
+    def __init__(self, base_dir):
+        self.db_path = os.path.join(base_dir, "data", "torrent_index.db")
+        with self._connect() as db:
+            db.execute("""
+                CREATE TABLE IF NOT EXISTS torrents (
+                    client TEXT NOT NULL,
+                    hash TEXT NOT NULL,
+                    name TEXT NOT NULL,
+                    total_size INTEGER,
+                    file_count INTEGER,
+                    files TEXT,
+                    piece_size INTEGER,
+                    added_on INTEGER,
+                    mtime REAL,
+                    PRIMARY KEY (client, hash)
+                )
+            """)
+            db.execute("CREATE INDEX IF NOT EXISTS torrents_name ON torrents (client, name)")
+            db.execute("""
+                CREATE TABLE IF NOT EXISTS sync_state (
+                    client TEXT PRIMARY KEY,
+                    last_added_on INTEGER,
+                    last_full_sync REAL
+                )
+            """)
+
+    @contextmanager
+    def _connect(self):
+        db = sqlite3.connect(self.db_path, timeout=30)
+        db.row_factory = sqlite3.Row
+        try:
+            with db:
+                yield db
+        finally:
+            db.close()
+
+    def find(self, client_key, name):
+        """Return the indexed torrents of client_key with this content name."""
+        with self._connect() as db:
+            return [dict(row) for row in db.execute("SELECT * FROM torrents WHERE client = ? AND name = ?", (client_key, name))]
+
+    def remove(self, client_key, torrent_hash):
+        with self._connect() as db:
+            db.execute("DELETE FROM torrents WHERE client = ? AND hash = ?", (client_key, torrent_hash))
+
+    def get_files(self, client_key, row, qbt_client=None):
+        """File list of an indexed torrent, fetched from qBittorrent and stored on first use."""
+        if row.get('files') is not None:
+            return json.loads(row['files'])
+        if qbt_client is None:
+            return None
+        files = [(f.name, f.size) for f in qbt_client.torrents_files(torrent_hash=row['hash'])]
+        with self._connect() as db:
+            db.execute(
+                "UPDATE torrents SET files = ?, file_count = ? WHERE client = ? AND hash = ?",
+                (json.dumps(files), len(files), client_key, row['hash'])
+            )
+        row['files'] = json.dumps(files)
+        row['file_count'] = len(files)
+        return files
+
+    def refresh_storage(self, client_key, storage_dir, debug=False):
+        """Index new or modified .torrent files in storage_dir and drop entries whose file is gone."""
+        start = time.time()
+        with self._connect() as db:
+            known = {row['hash']: row['mtime'] for row in db.execute("SELECT hash, mtime FROM torrents WHERE client = ?", (client_key,))}
+            seen = set()
+            parsed = 0
+            for entry in os.scandir(storage_dir):
+                if not entry.is_file() or not entry.name.endswith('.torrent'):
+                    continue
+                torrent_hash = entry.name[:-len('.torrent')].lower()
+                seen.add(torrent_hash)
+                mtime = entry.stat().st_mtime
+                if known.get(torrent_hash) == mtime:
+                    continue
+                try:
+                    torrent = Torrent.read(entry.path, validate=False)
+                    files = [(str(f), f.size) for f in torrent.files]
+                    db.execute(
+                        "INSERT OR REPLACE INTO torrents (client, hash, name, total_size, file_count, files, piece_size, added_on, mtime) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (client_key, torrent_hash, torrent.name, torrent.size, len(files), json.dumps(files), torrent.piece_size, None, mtime)
+                    )
+                    parsed += 1
+                except Exception as e:
+                    if debug:
+                        console.print(f"[yellow]Unable to index {entry.path}: {e}")
+            gone = [(client_key, torrent_hash) for torrent_hash in known if torrent_hash not in seen]
+            db.executemany("DELETE FROM torrents WHERE client = ? AND hash = ?", gone)
+        if debug:
+            console.print(f"[cyan]Torrent index: {parsed} new/changed, {len(gone)} removed, {len(seen)} total in {time.time() - start:.2f}s")
+
+    def refresh_qbit(self, client_key, qbt_client, debug=False):
+        """
+        Index torrents added to qBittorrent since the last refresh by paging torrents/info newest first.
+        A complete resync (which also drops removed torrents) runs every FULL_SYNC_INTERVAL.
+        """
+        start = time.time()
+        with self._connect() as db:
+            state = db.execute("SELECT last_added_on, last_full_sync FROM sync_state WHERE client = ?", (client_key,)).fetchone()
+            last_added_on = state['last_added_on'] if state else None
+            full_sync = state is None or not state['last_full_sync'] or time.time() - state['last_full_sync'] > FULL_SYNC_INTERVAL
+
+            seen = set()
+            newest = last_added_on or 0
+            added = 0
+            offset = 0
+            done = False
+            while not done:
+                page = qbt_client.torrents_info(sort='added_on', reverse=True, limit=QBIT_PAGE_SIZE, offset=offset)
+                if not page:
+                    break
+                for torrent in page:
+                    added_on = torrent.get('added_on') or 0
+                    if not full_sync and last_added_on is not None and added_on < last_added_on:
+                        done = True
+                        break
+                    torrent_hash = torrent['hash'].lower()
+                    seen.add(torrent_hash)
+                    newest = max(newest, added_on)
+                    existing = db.execute("SELECT added_on, name FROM torrents WHERE client = ? AND hash = ?", (client_key, torrent_hash)).fetchone()
+                    if existing and existing['added_on'] == added_on and existing['name'] == torrent['name']:
+                        continue
+                    db.execute(
+                        "INSERT OR REPLACE INTO torrents (client, hash, name, total_size, file_count, files, piece_size, added_on, mtime) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (client_key, torrent_hash, torrent['name'], torrent.get('total_size'), None, None, None, added_on, None)
+                    )
+                    added += 1
+                if len(page) < QBIT_PAGE_SIZE:
+                    break
+                offset += QBIT_PAGE_SIZE
+
+            removed = 0
+            if full_sync:
+                known = [row['hash'] for row in db.execute("SELECT hash FROM torrents WHERE client = ?", (client_key,))]
+                gone = [(client_key, torrent_hash) for torrent_hash in known if torrent_hash not in seen]
+                db.executemany("DELETE FROM torrents WHERE client = ? AND hash = ?", gone)
+                removed = len(gone)
+
+            db.execute(
+                "INSERT OR REPLACE INTO sync_state (client, last_added_on, last_full_sync) VALUES (?, ?, ?)",
+                (client_key, newest, time.time() if full_sync else state['last_full_sync'])
+            )
+        if debug:
+            kind = "full" if full_sync else "incremental"
+            console.print(f"[cyan]Torrent index ({kind} sync): {added} new/changed, {removed} removed in {time.time() - start:.2f}s")
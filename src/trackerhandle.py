@@ -7,6 +7,9 @@ from src.trackers.PTP import PTP
 from src.trackersetup import TRACKER_SETUP
 from src.trackers.COMMON import COMMON
 from src.manualpackage import package
+from src.rehostimages import plan_rehosts
+from src.uploadscheduler import get_upload_scheduler, report_uploads
+from src.metaoverlay import MetaOverlay
 
 
 async def check_mod_q_and_draft(tracker_class, meta, debug, disctype):
@@ -38,11 +41,10 @@ async def process_trackers(meta, config, client, console, api_trackers, tracker_
     common = COMMON(config=config)
     tracker_setup = TRACKER_SETUP(config=config)
     enabled_trackers = tracker_setup.trackers_enabled(meta)
+    scheduler = get_upload_scheduler(config)
 
-    async def process_single_tracker(tracker):
-        if meta['name'].endswith('DUPE?'):
-            meta['name'] = meta['name'].replace(' DUPE?', '')
-
+    async def process_single_tracker(tracker, meta):
+        """Upload to one tracker, returns the tracker name to add the torrent to the client under when it was uploaded."""
         if meta['debug']:
             debug = "(DEBUG)"
         else:
@@ -63,7 +65,7 @@ async def process_trackers(meta, config, client, console, api_trackers, tracker_
                 if draft == "Yes":
                     console.print(f"(draft: {draft})")
                 await tracker_class.upload(meta, disctype)
-                await client.add_to_client(meta, tracker_class.tracker)
+                return tracker_class.tracker
 
         elif tracker in other_api_trackers:
             tracker_class = tracker_class_map[tracker](config=config)
@@ -75,9 +77,7 @@ async def process_trackers(meta, config, client, console, api_trackers, tracker_
                 if tracker == "RTF":
                     await tracker_class.api_test(meta)
                 await tracker_class.upload(meta, disctype)
-                if tracker == 'SN':
-                    await asyncio.sleep(16)
-                await client.add_to_client(meta, tracker_class.tracker)
+                return tracker_class.tracker
 
         elif tracker in http_trackers:
             tracker_class = tracker_class_map[tracker](config=config)
@@ -86,30 +86,15 @@ async def process_trackers(meta, config, client, console, api_trackers, tracker_
             color = "green" if upload_status else "red"
             console.print(f"[yellow]Tracker: {tracker}, Upload: [{color}]{'YES' if upload_status else 'No'}[/{color}]")
             if upload_status:
-                if await tracker_class.validate_credentials(meta) is True:
+                valid = await tracker_class.validate_credentials(meta) is True
+                if not valid and meta.get('recreate_session', False):
+                    # Attended runs upload one tracker at a time, so the session can be recreated here
+                    meta['recreate_session'] = False
+                    valid = cli_ui.ask_yes_no("Log in again and create new session?") and await tracker_class.recreate_session(meta) is True
+                if valid:
                     await tracker_class.upload(meta, disctype)
-                    await client.add_to_client(meta, tracker_class.tracker)
-
-        elif tracker == "MANUAL":
-            if meta['unattended']:
-                do_manual = True
-            else:
-                do_manual = cli_ui.ask_yes_no("Get files for manual upload?", default=True)
-            if do_manual:
-                for manual_tracker in enabled_trackers:
-                    if manual_tracker != 'MANUAL':
-                        manual_tracker = manual_tracker.replace(" ", "").upper().strip()
-                        tracker_class = tracker_class_map[manual_tracker](config=config)
-                        if manual_tracker in api_trackers:
-                            await common.unit3d_edit_desc(meta, tracker_class.tracker, tracker_class.signature)
-                        else:
-                            await tracker_class.edit_desc(meta)
-                url = await package(meta)
-                if url is False:
-                    console.print(f"[yellow]Unable to upload prep files, they can be found at `tmp/{meta['uuid']}")
-                else:
-                    console.print(f"[green]{meta['name']}")
-                    console.print(f"[green]Files can be found at: [yellow]{url}[/yellow]")
+                    return tracker_class.tracker
+                console.print(f"[red]Skipping {tracker}: unable to validate its credentials")
 
         elif tracker == "THR":
             tracker_status = meta.get('tracker_status', {})
@@ -123,7 +108,7 @@ async def process_trackers(meta, config, client, console, api_trackers, tracker_
                         console.print("[yellow]Logging in to THR")
                         session = thr.login(session)
                         await thr.upload(session, meta, disctype)
-                        await client.add_to_client(meta, "THR")
+                        return "THR"
                 except Exception:
                     console.print(traceback.format_exc())
 
@@ -137,9 +122,83 @@ async def process_trackers(meta, config, client, console, api_trackers, tracker_
                 groupID = meta.get('ptp_groupID', None)
                 ptpUrl, ptpData = await ptp.fill_upload_form(groupID, meta)
                 await ptp.upload(meta, ptpUrl, ptpData, disctype)
-                await asyncio.sleep(5)
-                await client.add_to_client(meta, "PTP")
+                return "PTP"
+
+    # Rehost screenshots for every selected tracker at once, before the first tracker upload
+    selected_trackers = [tracker.replace(" ", "").upper().strip() for tracker in enabled_trackers]
+    tracker_status = meta.get('tracker_status', {})
+    try:
+        await plan_rehosts(meta, [
+            tracker_class_map[tracker](config=config) for tracker in selected_trackers
+            if tracker in tracker_class_map and tracker_status.get(tracker, {}).get('upload', False)
+        ])
+    except Exception as e:
+        console.print(f"[yellow]Unable to rehost screenshots ahead of the tracker uploads: {e}")
+
+    if meta['name'].endswith('DUPE?'):
+        meta['name'] = meta['name'].replace(' DUPE?', '')
+
+    # Torrents are added to the client as their uploads return, uploads finishing while an add is running go in together
+    pending_adds = []
+    add_lock = asyncio.Lock()
+
+    async def add_uploaded(tracker):
+        pending_adds.append(tracker)
+        async with add_lock:
+            trackers = pending_adds[:]
+            pending_adds.clear()
+            if trackers:
+                await client.add_to_client_batch(meta, trackers)
+
+    async def upload_to_tracker(tracker):
+        uploaded_as = None
+
+        async def upload():
+            nonlocal uploaded_as
+            # Each upload works on its own overlay of meta, trackers change it while building their upload
+            uploaded_as = await process_single_tracker(tracker, MetaOverlay(shared_meta))
+            return uploaded_as
+
+        row = await scheduler.run(tracker, upload)
+        if uploaded_as:
+            try:
+                # Some trackers need a moment before the new torrent can be fetched by the client
+                delay = scheduler.add_delay(tracker)
+                if delay:
+                    await asyncio.sleep(delay)
+                await add_uploaded(uploaded_as)
+            except Exception:
+                console.print(f"[red]Unable to add the {uploaded_as} torrent to the client")
+                console.print(traceback.format_exc())
+        return row
+
+    # Upload to every tracker at once within the scheduler's limits, the manual package is made after.
+    # Attended runs go one tracker after another, some tracker uploads ask questions along the way
+    upload_trackers = [tracker.replace(" ", "").upper().strip() for tracker in enabled_trackers]
+    shared_meta = dict(meta)
+    if not meta['unattended'] or (meta['unattended'] and meta.get('unattended-confirm', False)):
+        rows = [await upload_to_tracker(tracker) for tracker in upload_trackers if tracker != "MANUAL"]
+    else:
+        rows = await asyncio.gather(*(upload_to_tracker(tracker) for tracker in upload_trackers if tracker != "MANUAL"))
+    report_uploads(rows)
 
-    # Process each tracker sequentially
-    for tracker in enabled_trackers:
-        await process_single_tracker(tracker)
+    if "MANUAL" in upload_trackers:
+        if meta['unattended']:
+            do_manual = True
+        else:
+            do_manual = cli_ui.ask_yes_no("Get files for manual upload?", default=True)
+        if do_manual:
+            for manual_tracker in enabled_trackers:
+                if manual_tracker != 'MANUAL':
+                    manual_tracker = manual_tracker.replace(" ", "").upper().strip()
+                    tracker_class = tracker_class_map[manual_tracker](config=config)
+                    if manual_tracker in api_trackers:
+                        await common.unit3d_edit_desc(meta, tracker_class.tracker, tracker_class.signature)
+                    else:
+                        await tracker_class.edit_desc(meta)
+            url = await package(meta)
+            if url is False:
+                console.print(f"[yellow]Unable to upload prep files, they can be found at `tmp/{meta['uuid']}")
+            else:
+                console.print(f"[green]{meta['name']}")
+                console.print(f"[green]Files can be found at: [yellow]{url}[/yellow]")
@@ -0,0 +1,233 @@
+import time
+import asyncio
+import httpx
+import requests
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from urllib.parse import urlsplit
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from src.console import console
+
+try:
+    import h2  # noqa F401
+    HTTP2 = True
+except ImportError:
+    HTTP2 = False
+
+# Default seconds for tracker API calls that do not pass their own timeout
+TRACKER_TIMEOUT = 30
+# (connect, read) seconds for blocking calls, uploads included, that do not pass their own timeout
+BLOCKING_TIMEOUT = (15, 300)
+# Tries per request; only idempotent methods are repeated, on connection errors and these statuses
+RETRY_ATTEMPTS = 3
+RETRY_STATUSES = {429, 502, 503, 504}
+RETRY_METHODS = {"GET", "HEAD", "OPTIONS"}
+MAX_BACKOFF = 10
+MAX_CONNECTIONS_PER_HOST = 10
+
+# One pooled session per tracker host, reused by every search and upload of the run
+_sessions = {}
+_blocking_sessions = {}
+_stats = {}
+
+
+class HostStats:
+    def __init__(self):
+        self.requests = 0
+        self.connections = 0
+        self.blocking_connections = 0
+        self.retries = 0
+        self.errors = 0
+        self.elapsed = 0.0
+        self.versions = set()
+
+    def record(self, started, response=None):
+        self.requests += 1
+        self.elapsed += time.perf_counter() - started
+        if response is None:
+            self.errors += 1
+        elif response.extensions.get('http_version'):
+            self.versions.add(response.extensions['http_version'].decode())
+
+
+def host_stats(host):
+    if host not in _stats:
+        _stats[host] = HostStats()
+    return _stats[host]
+
+
+def _no_cookie_jar():
+    # Sessions are shared by every call to a host, cookies a response sets must not leak into the next call
+    return CookieJar(policy=DefaultCookiePolicy(allowed_domains=[]))
+
+
+def _backoff(attempt, response=None):
+    retry_after = response.headers.get('Retry-After') if response is not None else None
+    try:
+        delay = float(retry_after) if retry_after else 2 ** attempt
+    except ValueError:
+        delay = 2 ** attempt
+    return min(max(delay, 0), MAX_BACKOFF)
+
+
+class TrackerTransport(httpx.AsyncBaseTransport):
+    """
+    Keep-alive transport of a tracker session: counts requests, new connections and latency per host, and repeats
+    idempotent requests that hit a connection error or a RETRY_STATUSES response, waiting out any Retry-After.
+    """
+
+    def __init__(self):
+        self.transport = httpx.AsyncHTTPTransport(
+            http2=HTTP2,
+            limits=httpx.Limits(max_connections=MAX_CONNECTIONS_PER_HOST, max_keepalive_connections=MAX_CONNECTIONS_PER_HOST),
+        )
+
+    async def handle_async_request(self, request):
+        stats = host_stats(request.url.host)
+
+        async def trace(event_name, info):
+            if event_name == "connection.connect_tcp.complete":
+                stats.connections += 1
+
+        request.extensions = {**request.extensions, 'trace': trace}
+        attempts = RETRY_ATTEMPTS if request.method in RETRY_METHODS else 1
+        for attempt in range(attempts):
+            started = time.perf_counter()
+            try:
+                response = await self.transport.handle_async_request(request)
+            except httpx.TransportError:
+                stats.record(started)
+                if attempt + 1 >= attempts:
+                    raise
+                stats.retries += 1
+                await asyncio.sleep(_backoff(attempt))
+                continue
+            stats.record(started, response)
+            if response.status_code not in RETRY_STATUSES or attempt + 1 >= attempts:
+                return response
+            # Drain the body so the connection goes back to the pool for the next attempt
+            await response.aread()
+            await response.aclose()
+            stats.retries += 1
+            await asyncio.sleep(_backoff(attempt, response))
+
+    async def aclose(self):
+        await self.transport.aclose()
+
+
+def _host(url):
+    return urlsplit(str(url)).hostname or ""
+
+
+def get_session(url):
+    """Shared httpx client for the host of url, recreated if it was made on another event loop or closed."""
+    host = _host(url)
+    loop = asyncio.get_running_loop()
+    client, client_loop = _sessions.get(host, (None, None))
+    if client is None or client_loop is not loop or client.is_closed:
+        client = httpx.AsyncClient(transport=TrackerTransport(), timeout=TRACKER_TIMEOUT, cookies=_no_cookie_jar())
+        _sessions[host] = (client, loop)
+    return client
+
+
+class SessionView:
+    """
+    The shared clients as handed to `async with`: each request goes to the session of its URL's host with the
+    caller's timeout, and nothing is closed on exit.
+    """
+
+    def __init__(self, timeout=None, cookies=None):
+        self.timeout = timeout
+        self.cookies = cookies
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def request(self, method, url, **kwargs):
+        if self.timeout is not None:
+            kwargs.setdefault('timeout', self.timeout)
+        if self.cookies:
+            # Sent as a header, the shared client keeps no cookies of its own
+            pairs = [(c.name, c.value) for c in self.cookies] if isinstance(self.cookies, CookieJar) else self.cookies.items()
+            cookie = "; ".join(f"{name}={value}" for name, value in pairs)
+            kwargs['headers'] = {**(kwargs.get('headers') or {}), 'Cookie': cookie}
+        return await get_session(url).request(method, url, **kwargs)
+
+    async def get(self, url, **kwargs):
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url, **kwargs):
+        return await self.request("POST", url, **kwargs)
+
+
+def tracker_session(timeout=None, cookies=None):
+    """`async with tracker_session(timeout=10.0) as client:` in place of a throwaway httpx.AsyncClient."""
+    return SessionView(timeout, cookies)
+
+
+def get_blocking_session(url):
+    """Shared requests session for the host of url, for calls that still go through requests."""
+    host = _host(url)
+    if host not in _blocking_sessions:
+        session = requests.Session()
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        retry = Retry(
+            total=RETRY_ATTEMPTS - 1, status_forcelist=sorted(RETRY_STATUSES), allowed_methods=sorted(RETRY_METHODS),
+            backoff_factor=1, respect_retry_after_header=True, raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_maxsize=MAX_CONNECTIONS_PER_HOST, max_retries=retry)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _blocking_sessions[host] = session
+    return _blocking_sessions[host]
+
+
+async def blocking_request(method, url, **kwargs):
+    """A requests call on the host's shared session, run in a worker thread so it does not stall the event loop."""
+    kwargs.setdefault('timeout', BLOCKING_TIMEOUT)
+    stats = host_stats(_host(url))
+    session = get_blocking_session(url)
+    started = time.perf_counter()
+    response = None
+    try:
+        response = await asyncio.to_thread(session.request, method, url, **kwargs)
+        return response
+    finally:
+        stats.requests += 1
+        stats.elapsed += time.perf_counter() - started
+        if response is None:
+            stats.errors += 1
+        stats.blocking_connections = _pool_connections(session)
+
+
+def _pool_connections(session):
+    """Connections urllib3 has opened for a requests session so far."""
+    pools = session.get_adapter("https://").poolmanager.pools
+    return sum(pools[key].num_connections for key in pools.keys())
+
+
+async def close_sessions():
+    for client, client_loop in list(_sessions.values()):
+        if client_loop is asyncio.get_running_loop() and not client.is_closed:
+            await client.aclose()
+    _sessions.clear()
+    for session in _blocking_sessions.values():
+        session.close()
+    _blocking_sessions.clear()
+
+
+def report_tracker_http():
+    """Print per-host request counts, new connections, retries and latency of the tracker sessions."""
+    if not _stats:
+        return
+    console.print("[bold]Tracker HTTP:[/bold]")
+    for host, stats in sorted(_stats.items()):
+        versions = ", ".join(sorted(stats.versions)) or "-"
+        avg = stats.elapsed / stats.requests * 1000 if stats.requests else 0
+        console.print(
+            f"  {host}: {stats.requests} request(s), {stats.connections + stats.blocking_connections} new connection(s), {stats.retries} retries, "
+            f"{stats.errors} errors, {avg:.1f} ms avg, {versions}"
+        )
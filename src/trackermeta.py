@@ -4,16 +4,20 @@ from data.config import config
 import aiohttp
 import asyncio
 import sys
-from PIL import Image
+from PIL import Image, ImageFile
 import io
-from io import BytesIO
 import os
 import click
-from src.btnid import get_bhd_torrents
+from src.btnid import get_bhd_torrents, bhd_search
 
 # Define expected amount of screenshots from the config
 expected_images = int(config['DEFAULT']['screens'])
 valid_images = []
+# Bytes requested to read an image's dimensions when it does not have to be saved locally
+IMAGE_HEADER_BYTES = 64 * 1024
+# Trackers that need reused screenshots in the tmp folder: BHD, HDB, HUNO and MTV may rehost them,
+# THR uploads every png it finds there to its own image host
+REHOST_TRACKERS = {'BHD', 'HDB', 'HUNO', 'MTV', 'THR'}
 
 
 async def prompt_user_for_confirmation(message: str) -> bool:
@@ -26,6 +30,35 @@ async def prompt_user_for_confirmation(message: str) -> bool:
         sys.exit(1)
 
 
+def images_needed_locally(meta):
+    """Reused images are saved to the tmp folder only when a selected tracker may have to rehost them."""
+    trackers = meta.get('trackers') or config['TRACKERS'].get('default_trackers', '')
+    if isinstance(trackers, str):
+        trackers = trackers.split(',')
+    return any(tracker.strip().upper() in REHOST_TRACKERS for tracker in trackers)
+
+
+async def read_image_header(stream, limit=IMAGE_HEADER_BYTES):
+    """
+    (width, height) read from the start of an image stream, or None if no header parses within limit bytes.
+    Chunks are fed to the parser as they arrive, so headers behind EXIF, ICC or thumbnail segments are found too.
+    """
+    parser = ImageFile.Parser()
+    received = 0
+    while received < limit:
+        chunk = await stream.read(limit - received)
+        if not chunk:
+            return None
+        received += len(chunk)
+        try:
+            parser.feed(chunk)
+        except (IOError, SyntaxError):
+            return None
+        if parser.image:
+            return parser.image.size
+    return None
+
+
 async def check_images_concurrently(imagelist, meta):
     # Ensure meta['image_sizes'] exists
     if 'image_sizes' not in meta:
@@ -57,8 +90,9 @@ async def check_images_concurrently(imagelist, meta):
 
     # Function to check each image's URL, host, and log resolution
     save_directory = f"{meta['base_dir']}/tmp/{meta['uuid']}"  # Change this to your desired directory
+    save_images = images_needed_locally(meta)
 
-    async def check_and_collect(image_dict):
+    async def check_and_collect(session, image_dict):
         img_url = image_dict.get('raw_url')
         if not img_url:
             return None
@@ -68,54 +102,42 @@ async def check_images_concurrently(imagelist, meta):
             image_dict['raw_url'] = img_url
             image_dict['web_url'] = img_url
 
-        # Verify the image link
-        if await check_image_link(img_url):
-            async with aiohttp.ClientSession() as session:
-                async with session.get(img_url) as response:
-                    if response.status == 200:
-                        image_content = await response.read()
-
-                        try:
-                            image = Image.open(BytesIO(image_content))
-                            vertical_resolution = image.height
-                            lower_bound = expected_vertical_resolution * 0.70
-                            upper_bound = expected_vertical_resolution * (1.30 if meta['is_disc'] == "DVD" else 1.00)
-
-                            if not (lower_bound <= vertical_resolution <= upper_bound):
-                                console.print(
-                                    f"[red]Image {img_url} resolution ({vertical_resolution}p) "
-                                    f"is outside the allowed range ({int(lower_bound)}-{int(upper_bound)}p). Skipping.[/red]"
-                                )
-                                return None
-
-                            # Save image
-                            os.makedirs(save_directory, exist_ok=True)
-                            image_filename = os.path.join(save_directory, os.path.basename(img_url))
-                            with open(image_filename, "wb") as f:
-                                f.write(image_content)
-
-                            console.print(f"Saved {img_url} as {image_filename}")
-
-                            meta['image_sizes'][img_url] = len(image_content)
-
-                            if meta['debug']:
-                                console.print(
-                                    f"Valid image {img_url} with resolution {image.width}x{image.height} "
-                                    f"and size {len(image_content) / 1024:.2f} KiB"
-                                )
-                        except Exception as e:
-                            console.print(f"[red]Failed to process image {img_url}: {e}")
-                            return None
-                    else:
-                        console.print(f"[red]Failed to fetch image {img_url}. Skipping.")
-
-            return image_dict
-        else:
+        # Verify the image link, fetching it only once
+        checked = await check_image_link(session, img_url, full_body=save_images)
+        if checked is None:
+            return None
+        image_content, image_size, (width, height) = checked
+
+        lower_bound = expected_vertical_resolution * 0.70
+        upper_bound = expected_vertical_resolution * (1.30 if meta['is_disc'] == "DVD" else 1.00)
+        if not (lower_bound <= height <= upper_bound):
+            console.print(
+                f"[red]Image {img_url} resolution ({height}p) "
+                f"is outside the allowed range ({int(lower_bound)}-{int(upper_bound)}p). Skipping.[/red]"
+            )
             return None
 
-    # Run image verification concurrently
-    tasks = [check_and_collect(image_dict) for image_dict in imagelist]
-    results = await asyncio.gather(*tasks)
+        if image_content is not None:
+            try:
+                os.makedirs(save_directory, exist_ok=True)
+                image_filename = os.path.join(save_directory, os.path.basename(img_url))
+                with open(image_filename, "wb") as f:
+                    f.write(image_content)
+                console.print(f"Saved {img_url} as {image_filename}")
+            except OSError as e:
+                console.print(f"[red]Failed to save image {img_url}: {e}")
+                return None
+
+        if image_size:
+            meta['image_sizes'][img_url] = image_size
+        if meta['debug']:
+            size_text = f"{image_size / 1024:.2f} KiB" if image_size else "unknown size"
+            console.print(f"Valid image {img_url} with resolution {width}x{height} and {size_text}")
+        return image_dict
+
+    # Run image verification concurrently over one session
+    async with aiohttp.ClientSession() as session:
+        results = await asyncio.gather(*[check_and_collect(session, image_dict) for image_dict in imagelist])
 
     # Collect valid images and limit to amount set in config
     valid_images = [image for image in results if image is not None]
@@ -125,31 +147,49 @@ async def check_images_concurrently(imagelist, meta):
     return valid_images
 
 
-async def check_image_link(url):
-    async with aiohttp.ClientSession() as session:
-        try:
-            async with session.get(url) as response:
-                if response.status == 200:
-                    content_type = response.headers.get('Content-Type', '').lower()
-                    if 'image' in content_type:
-                        # Attempt to load the image
-                        image_data = await response.read()
-                        try:
-                            image = Image.open(io.BytesIO(image_data))
-                            image.verify()  # This will check if the image is broken
-                            return True
-                        except (IOError, SyntaxError) as e:  # noqa #F841
-                            console.print(f"[red]Image verification failed (corrupt image): {url}[/red]")
-                            return False
-                    else:
-                        console.print(f"[red]Content type is not an image: {url}[/red]")
-                        return False
-                else:
-                    console.print(f"[red]Failed to retrieve image: {url} (status code: {response.status})[/red]")
-                    return False
-        except Exception as e:
-            console.print(f"[red]Exception occurred while checking image: {url} - {str(e)}[/red]")
-            return False
+async def check_image_link(session, url, full_body=True):
+    """
+    Fetch an image once and return (content, size, (width, height)), or None if it is missing or not a valid image.
+    With full_body the whole image is downloaded and verified; otherwise only the first IMAGE_HEADER_BYTES are
+    requested (as a range) to read the dimensions from its header, and content is None.
+    """
+    headers = {} if full_body else {'Range': f"bytes=0-{IMAGE_HEADER_BYTES - 1}"}
+    try:
+        async with session.get(url, headers=headers) as response:
+            if response.status not in (200, 206):
+                console.print(f"[red]Failed to retrieve image: {url} (status code: {response.status})[/red]")
+                return None
+            content_type = response.headers.get('Content-Type', '').lower()
+            if 'image' not in content_type:
+                console.print(f"[red]Content type is not an image: {url}[/red]")
+                return None
+
+            if full_body:
+                image_data = await response.read()
+                try:
+                    image = Image.open(io.BytesIO(image_data))
+                    dimensions = image.size
+                    image.verify()  # This will check if the image is broken
+                except (IOError, SyntaxError):
+                    console.print(f"[red]Image verification failed (corrupt image): {url}[/red]")
+                    return None
+                return image_data, len(image_data), dimensions
+
+            # A server ignoring the range answers 200 with the whole file, only its start is read
+            dimensions = await read_image_header(response.content)
+            if dimensions is None:
+                console.print(f"[red]Image verification failed (unreadable image header): {url}[/red]")
+                return None
+            content_range = response.headers.get('Content-Range', '')
+            if response.status == 206 and '/' in content_range:
+                total = content_range.rsplit('/', 1)[1]
+                image_size = int(total) if total.isdigit() else None
+            else:
+                image_size = response.content_length
+            return None, image_size, dimensions
+    except Exception as e:
+        console.print(f"[red]Exception occurred while checking image: {url} - {str(e)}[/red]")
+        return None
 
 
 async def update_meta_with_unit3d_data(meta, tracker_data, tracker_name):
@@ -189,7 +229,40 @@ async def update_meta_with_unit3d_data(meta, tracker_data, tracker_name):
     console.print(f"[green]{tracker_name} data successfully updated in meta[/green]")
 
 
-async def update_metadata_from_tracker(tracker_name, tracker_instance, meta, search_term, search_file_folder, only_id=False):
+def bhd_search_names(meta):
+    """File and folder name BHD is searched by: the folder for discs and folders, the first file otherwise."""
+    use_foldername = (meta.get('is_disc') is not None or
+                      meta.get('keep_folder') is True or
+                      meta.get('isdir') is True)
+
+    if use_foldername:
+        # Use folder name from path if available, fall back to UUID
+        folder_path = meta.get('path', '')
+        foldername = os.path.basename(folder_path) if folder_path else meta.get('uuid', '')
+        return None, foldername
+    # Only use filename if none of the folder conditions are met
+    filename = os.path.basename(meta['filelist'][0]) if meta.get('filelist') else None
+    return filename, None
+
+
+async def probe_tracker(tracker_name, tracker_instance, meta, search_term, search_file_folder):
+    """
+    The search by file name update_metadata_from_tracker makes for tracker_name, without prompts or changes to meta,
+    so several trackers can be searched at once. Pass the result back as its probe.
+    """
+    if tracker_name in ["BLU", "AITHER", "LST", "OE", "TIK", "JPTV"]:
+        return await COMMON(config).unit3d_search(tracker_name, tracker_instance.search_url, search_term)
+    elif tracker_name == "PTP":
+        return await tracker_instance.get_ptp_id_imdb(search_term, search_file_folder, meta)
+    elif tracker_name == "HDB":
+        return await tracker_instance.search_filename(search_term, search_file_folder, meta)
+    elif tracker_name == "BHD":
+        filename, foldername = bhd_search_names(meta)
+        return await bhd_search(config['DEFAULT'].get('bhd_api'), config['DEFAULT'].get('bhd_rss_key'), filename=filename, foldername=foldername) or {}
+    return None
+
+
+async def update_metadata_from_tracker(tracker_name, tracker_instance, meta, search_term, search_file_folder, only_id=False, probe=None):
     tracker_key = tracker_name.lower()
     manual_key = f"{tracker_key}_manual"
     found_match = False
@@ -211,7 +284,8 @@ async def update_metadata_from_tracker(tracker_name, tracker_instance, meta, sea
                 tracker_instance.torrent_url,
                 tracker_instance.search_url,
                 meta,
-                file_name=search_term
+                file_name=search_term,
+                response=probe
             )
 
         if any(item not in [None, '0'] for item in tracker_data[:3]):  # Check for valid tmdb, imdb, or tvdb
@@ -225,7 +299,9 @@ async def update_metadata_from_tracker(tracker_name, tracker_instance, meta, sea
     elif tracker_name == "PTP":
         imdb_id = None
         if meta.get('ptp') is None:
-            imdb_id, ptp_torrent_id, ptp_torrent_hash = await tracker_instance.get_ptp_id_imdb(search_term, search_file_folder, meta)
+            if probe is None:
+                probe = await tracker_instance.get_ptp_id_imdb(search_term, search_file_folder, meta)
+            imdb_id, ptp_torrent_id, ptp_torrent_hash = probe
             if ptp_torrent_id:
                 if imdb_id:
                     console.print(f"[green]{tracker_name} IMDb ID found: tt{imdb_id}[/green]")
@@ -317,7 +393,9 @@ async def update_metadata_from_tracker(tracker_name, tracker_instance, meta, sea
             console.print("[yellow]No ID found in meta for HDB, searching by file name[/yellow]")
 
             # Use search_filename function if ID is not found in meta
-            imdb, tvdb_id, hdb_name, meta['ext_torrenthash'], tracker_id = await tracker_instance.search_filename(search_term, search_file_folder, meta)
+            if probe is None:
+                probe = await tracker_instance.search_filename(search_term, search_file_folder, meta)
+            imdb, tvdb_id, hdb_name, meta['ext_torrenthash'], tracker_id = probe
             meta['hdb_name'] = hdb_name
             if tracker_id:
                 meta[tracker_key] = tracker_id
@@ -346,19 +424,8 @@ async def update_metadata_from_tracker(tracker_name, tracker_instance, meta, sea
     elif tracker_name == "BHD":
         bhd_api = config['DEFAULT'].get('bhd_api')
         bhd_rss_key = config['DEFAULT'].get('bhd_rss_key')
-        use_foldername = (meta.get('is_disc') is not None or
-                          meta.get('keep_folder') is True or
-                          meta.get('isdir') is True)
-
-        if use_foldername:
-            # Use folder name from path if available, fall back to UUID
-            folder_path = meta.get('path', '')
-            foldername = os.path.basename(folder_path) if folder_path else meta.get('uuid', '')
-            await get_bhd_torrents(bhd_api, bhd_rss_key, meta, only_id, foldername=foldername)
-        else:
-            # Only use filename if none of the folder conditions are met
-            filename = os.path.basename(meta['filelist'][0]) if meta.get('filelist') else None
-            await get_bhd_torrents(bhd_api, bhd_rss_key, meta, only_id, filename=filename)
+        filename, foldername = bhd_search_names(meta)
+        await get_bhd_torrents(bhd_api, bhd_rss_key, meta, only_id, filename=filename, foldername=foldername, data=probe)
 
         if meta.get('imdb_id') or meta.get('tmdb_id'):
             if not meta['unattended']:
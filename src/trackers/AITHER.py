@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
 # import discord
 import asyncio
-import requests
 import platform
 import re
 import os
@@ -111,7 +110,7 @@ class AITHER():
             data['season_number'] = meta.get('season_int', '0')
             data['episode_number'] = meta.get('episode_int', '0')
         if meta['debug'] is False:
-            response = requests.post(url=self.upload_url, files=files, data=data, headers=headers, params=params)
+            response = await COMMON.blocking_request("POST", self.upload_url, files=files, data=data, headers=headers, params=params)
             try:
                 console.print(response.json())
                 # adding torrent link to comment of torrent file
@@ -259,7 +258,7 @@ class AITHER():
             params['name'] = params['name'] + f" {meta['edition']}"
 
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with COMMON.session(timeout=10.0) as client:
                 response = await client.get(url=self.search_url, params=params)
                 if response.status_code == 200:
                     data = response.json()
@@ -2,7 +2,6 @@
 # import discord
 import os
 import asyncio
-import requests
 import platform
 import httpx
 import json
@@ -117,7 +116,7 @@ class ANT():
 
         try:
             if not meta['debug']:
-                response = requests.post(url=self.upload_url, files=files, data=data, headers=headers)
+                response = await COMMON.blocking_request("POST", self.upload_url, files=files, data=data, headers=headers)
                 if response.status_code in [200, 201]:
                     response_data = response.json()
                 else:
@@ -153,7 +152,7 @@ class ANT():
             params['imdb'] = meta['imdb']
 
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with COMMON.session(timeout=5.0) as client:
                 response = await client.get(url='https://anthelion.me/api', params=params)
                 if response.status_code == 200:
                     try:
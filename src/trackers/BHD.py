@@ -1,14 +1,12 @@
 # -*- coding: utf-8 -*-
 # import discord
 import asyncio
-import requests
 from difflib import SequenceMatcher
 import os
 import platform
 import bencodepy
 import httpx
 import re
-import cli_ui
 from src.trackers.COMMON import COMMON
 from src.console import console
 from src.rehostimages import check_hosts
@@ -29,11 +27,7 @@ class BHD():
         self.upload_url = 'https://beyond-hd.me/api/upload/'
         self.signature = "\n[center][url=https://github.com/Audionut/Upload-Assistant]Created by Audionut's Upload Assistant[/url][/center]"
         self.banned_groups = ['Sicario', 'TOMMY', 'x0r', 'nikt0', 'FGT', 'd3g', 'MeGusta', 'YIFY', 'tigole', 'TEKNO3D', 'C4K', 'RARBG', '4K4U', 'EASports', 'ReaLHD', 'Telly', 'AOC', 'WKS', 'SasukeducK']
-        pass
-
-    async def upload(self, meta, disctype):
-        common = COMMON(config=self.config)
-        url_host_mapping = {
+        self.url_host_mapping = {
             "ibb.co": "imgbb",
             "ptpimg.me": "ptpimg",
             "pixhost.to": "pixhost",
@@ -41,9 +35,13 @@ class BHD():
             "beyondhd.co": "bhd",
             "imagebam.com": "bam",
         }
+        self.approved_image_hosts = ['ptpimg', 'imgbox', 'imgbb', 'pixhost', 'bhd', 'bam']
+        pass
 
-        approved_image_hosts = ['ptpimg', 'imgbox', 'imgbb', 'pixhost', 'bhd', 'bam']
-        await check_hosts(meta, self.tracker, url_host_mapping=url_host_mapping, img_host_index=1, approved_image_hosts=approved_image_hosts)
+    async def upload(self, meta, disctype):
+        common = COMMON(config=self.config)
+
+        await check_hosts(meta, self.tracker, url_host_mapping=self.url_host_mapping, img_host_index=1, approved_image_hosts=self.approved_image_hosts)
         await common.edit_torrent(meta, self.tracker, self.source_flag)
         cat_id = await self.get_cat_id(meta['category'])
         source_id = await self.get_source(meta['source'])
@@ -113,7 +111,7 @@ class BHD():
         url = self.upload_url + self.config['TRACKERS'][self.tracker]['api_key'].strip()
         details_link = {}
         if meta['debug'] is False:
-            response = requests.post(url=url, files=files, data=data, headers=headers)
+            response = await COMMON.blocking_request("POST", url, files=files, data=data, headers=headers)
             try:
                 response = response.json()
                 if int(response['status_code']) == 0:
@@ -121,7 +119,7 @@ class BHD():
                     if response['status_message'].startswith('Invalid imdb_id'):
                         console.print('[yellow]RETRYING UPLOAD')
                         data['imdb_id'] = 1
-                        response = requests.post(url=url, files=files, data=data, headers=headers)
+                        response = await COMMON.blocking_request("POST", url, files=files, data=data, headers=headers)
                         response = response.json()
                     elif response['status_message'].startswith('Invalid name value'):
                         console.print(f"[bold yellow]Submitted Name: {bhd_name}")
@@ -268,14 +266,11 @@ class BHD():
             "-ncmt", "-tdd", "-flux", "-crfw", "-sonny", "-zr-", "-mkvultra",
             "-rpg", "-w4nk3r", "-irobot", "-beyondhd"
         )):
-            console.print("[bold red]This is an internal BHD release, skipping upload[/bold red]")
             if not meta['unattended'] or (meta['unattended'] and meta.get('unattended-confirm', False)):
-                if cli_ui.ask_yes_no("Do you want to upload anyway?", default=False):
-                    pass
-                else:
-                    meta['skipping'] = "BHD"
-                    return []
+                # Asked by the tracker review, once the checks of every tracker are done
+                meta['upload_warnings'] = meta.get('upload_warnings', []) + ["This is an internal BHD release"]
             else:
+                console.print("[bold red]This is an internal BHD release, skipping upload[/bold red]")
                 meta['skipping'] = "BHD"
                 return []
         if meta['sd'] and not (meta['is_disc'] or "REMUX" in meta['type'] or "WEBDL" in meta['type']):
@@ -310,7 +305,7 @@ class BHD():
 
         url = f"https://beyond-hd.me/api/torrents/{self.config['TRACKERS']['BHD']['api_key'].strip()}"
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with COMMON.session(timeout=5.0) as client:
                 response = await client.post(url, params=data)
                 if response.status_code == 200:
                     data = response.json()
@@ -1,6 +1,5 @@
 # -*- coding: utf-8 -*-
 # import discord
-import requests
 from src.console import console
 from pprint import pprint
 import os
@@ -86,7 +85,7 @@ class BHDTV():
         }
 
         if meta['debug'] is False:
-            response = requests.post(url=self.upload_url, data=data, files=files)
+            response = await COMMON.blocking_request("POST", self.upload_url, data=data, files=files)
             try:
                 # pprint(data)
                 console.print(response.json())
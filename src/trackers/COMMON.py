@@ -2,7 +2,6 @@ from torf import Torrent
 import os
 import requests
 import re
-import json
 import click
 import sys
 import glob
@@ -11,6 +10,8 @@ from pymediainfo import MediaInfo
 from src.bbcode import BBCODE
 from src.console import console
 from src.uploadscreens import upload_screens
+from src.metastore import save_meta
+from src.trackerhttp import tracker_session, blocking_request
 from src.takescreens import disc_screenshots, dvd_screenshots, screenshots
 
 
@@ -20,6 +21,16 @@ class COMMON():
         self.parser = self.MediaInfoParser()
         pass
 
+    @staticmethod
+    def session(timeout=None, cookies=None):
+        """Shared keep-alive tracker clients, `async with COMMON.session(timeout=10.0) as client:` (see src/trackerhttp)."""
+        return tracker_session(timeout, cookies)
+
+    @staticmethod
+    async def blocking_request(method, url, **kwargs):
+        """A requests call on the shared session of url's host, run off the event loop (see src/trackerhttp)."""
+        return await blocking_request(method, url, **kwargs)
+
     async def edit_torrent(self, meta, tracker, source_flag, torrent_filename="BASE"):
         if os.path.exists(f"{meta['base_dir']}/tmp/{meta['uuid']}/{torrent_filename}.torrent"):
             new_torrent = Torrent.read(f"{meta['base_dir']}/tmp/{meta['uuid']}/{torrent_filename}.torrent")
@@ -152,7 +163,7 @@ class COMMON():
                                         print(f"Error during BDMV screenshot capture: {e}")
                                     new_screens = glob.glob1(f"{meta['base_dir']}/tmp/{meta['uuid']}", f"PLAYLIST_{i}-*.png")
                                 if new_screens and not meta.get('skip_imghost_upload', False):
-                                    uploaded_images, _ = await upload_screens(meta, multi_screens, 1, 0, multi_screens, new_screens, {new_images_key: meta[new_images_key]})
+                                    uploaded_images, _ = await upload_screens(meta, multi_screens, 1, multi_screens, new_screens)
                                     for img in uploaded_images:
                                         meta[new_images_key].append({
                                             'img_url': img['img_url'],
@@ -168,9 +179,7 @@ class COMMON():
                                         descfile.write(image_str)
                                     descfile.write("[/center]\n\n")
 
-                                meta_filename = f"{meta['base_dir']}/tmp/{meta['uuid']}/meta.json"
-                                with open(meta_filename, 'w') as f:
-                                    json.dump(meta, f, indent=4)
+                                save_meta(meta)
 
             # Handle multiple discs case
             elif len(discs) > 1:
@@ -261,7 +270,7 @@ class COMMON():
                                         new_screens = glob.glob1(f"{meta['base_dir']}/tmp/{meta['uuid']}", f"{meta['discs'][i]['name']}-*.png")
 
                                 if new_screens and not meta.get('skip_imghost_upload', False):
-                                    uploaded_images, _ = await upload_screens(meta, multi_screens, 1, 0, multi_screens, new_screens, {new_images_key: meta[new_images_key]})
+                                    uploaded_images, _ = await upload_screens(meta, multi_screens, 1, multi_screens, new_screens)
 
                                     # Append each uploaded image's data to `meta[new_images_key]`
                                     for img in uploaded_images:
@@ -281,9 +290,7 @@ class COMMON():
                                     descfile.write("[/center]\n\n")
 
                                 # Save the updated meta to `meta.json` after upload
-                                meta_filename = f"{meta['base_dir']}/tmp/{meta['uuid']}/meta.json"
-                                with open(meta_filename, 'w') as f:
-                                    json.dump(meta, f, indent=4)
+                                save_meta(meta)
 
             # Handle single file case
             if len(filelist) == 1:
@@ -337,7 +344,7 @@ class COMMON():
 
                             # Upload generated screenshots
                             if new_screens and not meta.get('skip_imghost_upload', False):
-                                uploaded_images, _ = await upload_screens(meta, multi_screens, 1, 0, multi_screens, new_screens, {new_images_key: meta[new_images_key]})
+                                uploaded_images, _ = await upload_screens(meta, multi_screens, 1, multi_screens, new_screens)
                                 for img in uploaded_images:
                                     meta[new_images_key].append({
                                         'img_url': img['img_url'],
@@ -346,9 +353,7 @@ class COMMON():
                                     })
 
             # Save updated meta
-            meta_filename = f"{meta['base_dir']}/tmp/{meta['uuid']}/meta.json"
-            with open(meta_filename, 'w') as f:
-                json.dump(meta, f, indent=4)
+            save_meta(meta)
 
             # Second Pass: Process MediaInfo and Write Descriptions
             if len(filelist) > 1:
@@ -523,7 +528,12 @@ class COMMON():
             return True
         return False
 
-    async def unit3d_torrent_info(self, tracker, torrent_url, search_url, meta, id=None, file_name=None):
+    async def unit3d_search(self, tracker, search_url, file_name):
+        """Search a UNIT3D tracker by file name, off the event loop so several trackers can be searched at once."""
+        params = {'api_token': self.config['TRACKERS'][tracker].get('api_key', ''), 'file_name': file_name}
+        return await self.blocking_request("GET", search_url, params=params)
+
+    async def unit3d_torrent_info(self, tracker, torrent_url, search_url, meta, id=None, file_name=None, response=None):
         only_id = self.config['DEFAULT'].get('only_id', False)
         tmdb = imdb = tvdb = description = category = infohash = mal = files = None  # noqa F841
         imagelist = []
@@ -543,8 +553,9 @@ class COMMON():
             console.print("[red]No ID or file name provided for search.[/red]")
             return None, None, None, None, None, None, None, None, None
 
-        # Make the GET request with proper encoding handled by 'params'
-        response = requests.get(url=url, params=params)
+        # Make the GET request with proper encoding handled by 'params', unless the search was already made (unit3d_search)
+        if response is None:
+            response = await self.blocking_request("GET", url, params=params)
         # console.print(f"[blue]Raw API Response: {response}[/blue]")
 
         try:
@@ -675,11 +686,11 @@ class COMMON():
         # get douban url
         if int(meta.get('imdb_id')) != 0:
             data['search'] = f"tt{meta['imdb_id']}"
-            ptgen = requests.get(url, params=data)
+            ptgen = await self.blocking_request("GET", url, params=data)
             if ptgen.json()["error"] is not None:
                 for retry in range(ptgen_retry):
                     try:
-                        ptgen = requests.get(url, params=params)
+                        ptgen = await self.blocking_request("GET", url, params=params)
                         if ptgen.json()["error"] is None:
                             break
                     except requests.exceptions.JSONDecodeError:
@@ -693,17 +704,15 @@ class COMMON():
             console.print("[red]No IMDb id was found.")
             params['url'] = console.input("[red]Please enter [yellow]Douban[/yellow] link: ")
         try:
-            ptgen = requests.get(url, params=params)
+            ptgen = await self.blocking_request("GET", url, params=params)
             if ptgen.json()["error"] is not None:
                 for retry in range(ptgen_retry):
-                    ptgen = requests.get(url, params=params)
+                    ptgen = await self.blocking_request("GET", url, params=params)
                     if ptgen.json()["error"] is None:
                         break
             ptgen = ptgen.json()
             meta['ptgen'] = ptgen
-            with open(f"{meta['base_dir']}/tmp/{meta['uuid']}/meta.json", 'w') as f:
-                json.dump(meta, f, indent=4)
-                f.close()
+            save_meta(meta)
             ptgen = ptgen['format']
             if "[/img]" in ptgen:
                 ptgen = ptgen.split("[/img]")[1]
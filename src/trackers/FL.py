@@ -213,7 +213,7 @@ class FL():
             }
 
         try:
-            async with httpx.AsyncClient(cookies=cookies, timeout=10.0) as client:
+            async with COMMON.session(timeout=10.0, cookies=cookies) as client:
                 response = await client.get(search_url, params=params)
                 if response.status_code == 200:
                     soup = BeautifulSoup(response.text, 'html.parser')
@@ -242,17 +242,20 @@ class FL():
         vcookie = await self.validate_cookies(meta, cookiefile)
         if vcookie is not True:
             console.print('[red]Failed to validate cookies. Please confirm that the site is up and your passkey is valid.')
-            recreate = cli_ui.ask_yes_no("Log in again and create new session?")
-            if recreate is True:
-                if os.path.exists(cookiefile):
-                    os.remove(cookiefile)
-                await self.login(cookiefile)
-                vcookie = await self.validate_cookies(meta, cookiefile)
-                return vcookie
-            else:
+            if not meta['unattended'] or (meta['unattended'] and meta.get('unattended-confirm', False)):
+                # The tracker review asks whether to log in again, see recreate_session
+                meta['recreate_session'] = True
                 return False
+            return await self.recreate_session(meta)
         return True
 
+    async def recreate_session(self, meta):
+        cookiefile = os.path.abspath(f"{meta['base_dir']}/data/cookies/FL.pkl")
+        if os.path.exists(cookiefile):
+            os.remove(cookiefile)
+        await self.login(cookiefile)
+        return await self.validate_cookies(meta, cookiefile)
+
     async def validate_cookies(self, meta, cookiefile):
         url = "https://filelist.io/index.php"
         if os.path.exists(cookiefile):
@@ -331,7 +334,7 @@ class FL():
                 files = []
                 for screen in screen_glob:
                     files.append(('images', (os.path.basename(screen), open(f"{meta['base_dir']}/tmp/{meta['uuid']}/{screen}", 'rb'), 'image/png')))
-                response = requests.post(url, data=data, files=files, auth=(self.fltools['user'], self.fltools['pass']))
+                response = await COMMON.blocking_request("POST", url, data=data, files=files, auth=(self.fltools['user'], self.fltools['pass']))
                 final_desc = response.text.replace('\r\n', '\n')
             else:
                 # BD Description Generator
@@ -346,7 +349,7 @@ class FL():
                     files = []
                     for screen in screen_glob:
                         files.append(('images', (os.path.basename(screen), open(f"{meta['base_dir']}/tmp/{meta['uuid']}/{screen}", 'rb'), 'image/png')))
-                    response = requests.post(url, files=files, auth=(self.fltools['user'], self.fltools['pass']))
+                    response = await COMMON.blocking_request("POST", url, files=files, auth=(self.fltools['user'], self.fltools['pass']))
                     final_desc += response.text.replace('\r\n', '\n')
             descfile.write(final_desc)
 
@@ -13,7 +13,8 @@ from src.exceptions import *  # noqa F403
 from src.console import console
 from datetime import datetime
 from torf import Torrent
-from src.torrentcreate import CustomTorrent, torf_cb
+from src.torrentcreate import CustomTorrent, torf_cb, find_piece_size_variant
+from src.imagecache import get_image_cache, get_cached_upload, store_upload, files_digest
 
 
 class HDB():
@@ -222,6 +223,13 @@ class HDB():
         torrent_path = f"{meta['base_dir']}/tmp/{meta['uuid']}/[{self.tracker}]{meta['clean_name']}.torrent"
         torrent = Torrent.read(torrent_path)
 
+        # Use the 16 MiB variant hashed alongside BASE.torrent if there is one
+        if torrent.piece_size > 16777216:
+            variant = find_piece_size_variant(meta, 16777216)
+            if variant:
+                await common.edit_torrent(meta, self.tracker, self.source_flag, torrent_filename=variant)
+                torrent = Torrent.read(torrent_path)
+
         # Check if the piece size exceeds 16 MiB and regenerate the torrent if needed
         if torrent.piece_size > 16777216:  # 16 MiB in bytes
             console.print("[red]Piece size is OVER 16M and does not work on HDB. Generating a new .torrent")
@@ -340,7 +348,7 @@ class HDB():
 
         try:
             # Send POST request with JSON body
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with COMMON.session(timeout=5.0) as client:
                 response = await client.post(url, json=data)
 
                 if response.status_code == 200:
@@ -380,7 +388,7 @@ class HDB():
             'passkey': self.passkey
         }
         try:
-            r = requests.post(url, data=json.dumps(data)).json()
+            r = (await COMMON.blocking_request("POST", url, data=json.dumps(data))).json()
             if r.get('status', 5) == 0:
                 return True
             return False
@@ -416,7 +424,7 @@ class HDB():
             'passkey': self.passkey,
             'id': id
         }
-        r = requests.get(url=api_url, data=json.dumps(data))
+        r = await COMMON.blocking_request("GET", api_url, data=json.dumps(data))
         filename = r.json()['data'][0]['filename']
 
         # Download new .torrent
@@ -426,7 +434,7 @@ class HDB():
             'id': id
         }
 
-        r = requests.get(url=download_url, params=params)
+        r = await COMMON.blocking_request("GET", download_url, params=params)
         with open(torrent_path, "wb") as tor:
             tor.write(r.content)
         return
@@ -489,7 +497,7 @@ class HDB():
             unwanted_files.update(glob.glob(pattern))
 
         image_glob = [file for file in image_glob if file not in unwanted_files]
-        images = list(set(image_glob))
+        images = sorted(set(image_glob))
         url = "https://img.hdbits.org/upload_api.php"
 
         data = {
@@ -510,6 +518,18 @@ class HDB():
         if meta['debug']:
             print(f"[DEBUG] Using {hdbimg_screen_count} images for upload")
 
+        # The same screenshots and gallery fields give the same gallery, so reuse its BBCode from the image cache
+        cache = get_image_cache(meta['base_dir'], self.config)
+        digest = None
+        if cache is not None and hdbimg_screen_count > 0:
+            gallery = json.dumps({key: data[key] for key in ('galleryoption', 'galleryname', 'thumbsize')}, sort_keys=True)
+            digest = await asyncio.to_thread(files_digest, images[:hdbimg_screen_count], gallery)
+            cached = await get_cached_upload(cache, digest, "hdbimg", self.config, meta['debug'])
+            if cached is not None:
+                if meta['debug']:
+                    print("[DEBUG] Reusing the cached hdbimg gallery of these images")
+                return cached['bbcode']
+
         files = {}
         for i in range(hdbimg_screen_count):
             file_path = images[i]
@@ -522,12 +542,17 @@ class HDB():
                 return None
 
         try:
-            response = requests.post(url, data=data, files=files)
+            async with COMMON.session(timeout=120.0) as client:
+                response = await client.post(url, data=data, files=files)
             if meta['debug']:
                 print(f"[DEBUG] HTTP Response Code: {response.status_code}")
                 print(f"[DEBUG] Response Text: {response.text[:500]}")  # Limit output for readability
+            # Only gallery BBCode is worth keeping, not an HTML error or login page
+            bbcode = response.text.lower()
+            if digest is not None and response.is_success and ('[url' in bbcode or '[img' in bbcode):
+                await store_upload(cache, digest, "hdbimg", {'bbcode': response.text})
             return response.text
-        except requests.RequestException as e:
+        except httpx.RequestError as e:
             print(f"[ERROR] HTTP Request failed: {e}")
             return None
         finally:
@@ -547,7 +572,7 @@ class HDB():
         }
 
         try:
-            response = requests.get(url, json=data)
+            response = await COMMON.blocking_request("GET", url, json=data)
             if response.ok:
                 response = response.json()
                 if response.get('data'):
@@ -610,7 +635,7 @@ class HDB():
             # console.print(f"[yellow]Using this data: {data}")
 
         try:
-            response = requests.get(url, json=data)
+            response = await COMMON.blocking_request("GET", url, json=data)
             if response.ok:
                 try:
                     response_json = response.json()
@@ -6,13 +6,12 @@ from torf import Torrent
 import httpx
 import xml.etree.ElementTree as ET
 import os
-import cli_ui
 import pickle
 import re
 from pathlib import Path
 from src.trackers.COMMON import COMMON
 from datetime import datetime
-from src.torrentcreate import CustomTorrent, torf_cb
+from src.torrentcreate import CustomTorrent, torf_cb, find_piece_size_variant
 from src.rehostimages import check_hosts
 
 
@@ -37,6 +36,12 @@ class MTV():
             'KiNGDOM', 'Leffe', 'mHD', 'mSD', 'nHD', 'nikt0', 'nSD', 'NhaNc3', 'PRODJi', 'RDN', 'SANTi',
             'STUTTERSHIT', 'TERMiNAL', 'ViSION', 'WAF', 'x0r', 'YIFY', ['EVO', 'WEB-DL Only']
         ]
+        self.url_host_mapping = {
+            "ibb.co": "imgbb",
+            "ptpimg.me": "ptpimg",
+            "imgbox.com": "imgbox",
+        }
+        self.approved_image_hosts = ['ptpimg', 'imgbox', 'imgbb']
         pass
 
     async def upload(self, meta, disctype):
@@ -48,7 +53,12 @@ class MTV():
             torrent_path = f"{meta['base_dir']}/tmp/{meta['uuid']}/BASE.torrent"
             torrent = Torrent.read(torrent_path)
 
-            if torrent.piece_size > 8388608:
+            variant = find_piece_size_variant(meta, 8388608) if torrent.piece_size > 8388608 else None
+            if variant:
+                # Hashed alongside BASE.torrent, no need to read the content again
+                torrent_filename = variant
+
+            elif torrent.piece_size > 8388608:
                 tracker_config = self.config['TRACKERS'].get(self.tracker, {})
                 if str(tracker_config.get('skip_if_rehash', 'false')).lower() == "false":
                     console.print("[red]Piece size is OVER 8M and does not work on MTV. Generating a new .torrent")
@@ -86,14 +96,7 @@ class MTV():
                     return
             await common.edit_torrent(meta, self.tracker, self.source_flag, torrent_filename=torrent_filename)
 
-        approved_image_hosts = ['ptpimg', 'imgbox', 'imgbb']
-        url_host_mapping = {
-            "ibb.co": "imgbb",
-            "ptpimg.me": "ptpimg",
-            "imgbox.com": "imgbox",
-        }
-
-        await check_hosts(meta, self.tracker, url_host_mapping=url_host_mapping, img_host_index=1, approved_image_hosts=approved_image_hosts)
+        await check_hosts(meta, self.tracker, url_host_mapping=self.url_host_mapping, img_host_index=1, approved_image_hosts=self.approved_image_hosts)
         cat_id = await self.get_cat_id(meta)
         resolution_id = await self.get_res_id(meta['resolution'])
         source_id = await self.get_source_id(meta)
@@ -422,29 +425,29 @@ class MTV():
         if vcookie is not True:
             console.print('[red]Failed to validate cookies. Please confirm that the site is up and your username and password is valid.')
             if not meta['unattended'] or (meta['unattended'] and meta.get('unattended-confirm', False)):
-                recreate = cli_ui.ask_yes_no("Log in again and create new session?")
-            else:
-                recreate = True
-            if recreate is True:
-                if os.path.exists(cookiefile):
-                    os.remove(cookiefile)
-                await self.login(cookiefile)
-                vcookie = await self.validate_cookies(meta, cookiefile)
-                return vcookie
-            else:
+                # The tracker review asks whether to log in again, see recreate_session
+                meta['recreate_session'] = True
                 return False
+            return await self.recreate_session(meta)
         vapi = await self.validate_api()
         if vapi is not True:
             console.print('[red]Failed to validate API. Please confirm that the site is up and your API key is valid.')
         return True
 
+    async def recreate_session(self, meta):
+        cookiefile = os.path.abspath(f"{meta['base_dir']}/data/cookies/MTV.pkl")
+        if os.path.exists(cookiefile):
+            os.remove(cookiefile)
+        await self.login(cookiefile)
+        return await self.validate_cookies(meta, cookiefile)
+
     async def validate_api(self):
         url = self.search_url
         params = {
             'apikey': self.config['TRACKERS'][self.tracker]['api_key'].strip(),
         }
         try:
-            r = requests.get(url, params=params)
+            r = await COMMON.blocking_request("GET", url, params=params)
             if not r.ok:
                 if "unauthorized api key" in r.text.lower():
                     console.print("[red]Invalid API Key")
@@ -547,7 +550,7 @@ class MTV():
             params['q'] = meta['title'].replace(': ', ' ').replace('’', '').replace("'", '')
 
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with COMMON.session(timeout=5.0) as client:
                 response = await client.get(url=self.search_url, params=params)
 
                 if response.status_code == 200 and response.text:
@@ -1,6 +1,5 @@
 # -*- coding: utf-8 -*-
 import json
-import requests
 import httpx
 
 from src.trackers.COMMON import COMMON
@@ -61,7 +60,7 @@ class NBL():
         }
 
         if meta['debug'] is False:
-            response = requests.post(url=self.upload_url, files=files, data=data)
+            response = await COMMON.blocking_request("POST", self.upload_url, files=files, data=data)
             try:
                 if response.ok:
                     response = response.json()
@@ -109,7 +108,7 @@ class NBL():
         }
 
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with COMMON.session(timeout=5.0) as client:
                 response = await client.post(self.search_url, json=payload)
                 if response.status_code == 200:
                     try:
@@ -5,8 +5,6 @@ import platform
 import os
 import httpx
 import glob
-import requests
-import cli_ui
 from src.trackers.COMMON import COMMON
 from src.console import console
 
@@ -154,7 +152,7 @@ class OTW():
         }
 
         if meta['debug'] is False:
-            response = requests.post(url=self.upload_url, files=files, data=data, headers=headers, params=params)
+            response = await COMMON.blocking_request("POST", self.upload_url, files=files, data=data, headers=headers, params=params)
             try:
                 console.print(response.json())
                 # adding torrent link to comment of torrent file
@@ -170,14 +168,10 @@ class OTW():
 
     async def search_existing(self, meta, disctype):
         if not any(genre in meta['genres'] for genre in ['Animation', 'Family']):
-            console.print('[bold red]Genre does not match Animation or Family.')
             if not meta['unattended'] or (meta['unattended'] and meta.get('unattended-confirm', False)):
-                if cli_ui.ask_yes_no("Do you want to upload anyway?", default=False):
-                    pass
-                else:
-                    meta['skipping'] = "OTW"
-                    return
+                meta['upload_warnings'] = meta.get('upload_warnings', []) + ["Genre does not match Animation or Family."]
             else:
+                console.print('[bold red]Genre does not match Animation or Family.')
                 meta['skipping'] = "OTW"
                 return
         disallowed_keywords = {'XXX', 'Erotic', 'Porn', 'Hentai', 'Adult Animation', 'Orgy', 'softcore'}
@@ -204,7 +198,7 @@ class OTW():
         if meta.get('edition', "") != "":
             params['name'] = params['name'] + f" {meta['edition']}"
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with COMMON.session(timeout=5.0) as client:
                 response = await client.get(url=self.search_url, params=params)
                 if response.status_code == 200:
                     data = response.json()
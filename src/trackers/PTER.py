@@ -72,7 +72,7 @@ class PTER():
         search_url = f"https://pterclub.com/torrents.php?search={imdb}&incldead=0&search_mode=0&source{source}=1"
 
         try:
-            async with httpx.AsyncClient(cookies=cookies, timeout=10.0) as client:
+            async with COMMON.session(timeout=10.0, cookies=cookies) as client:
                 response = await client.get(search_url)
 
                 if response.status_code == 200:
@@ -406,7 +406,7 @@ class PTER():
 
     async def download_new_torrent(self, id, torrent_path):
         download_url = f"https://pterclub.com/download.php?id={id}&passkey={self.passkey}"
-        r = requests.get(url=download_url)
+        r = await COMMON.blocking_request("GET", download_url)
         if r.status_code == 200:
             with open(torrent_path, "wb") as tor:
                 tor.write(r.content)
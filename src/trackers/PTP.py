@@ -15,11 +15,12 @@ from src.trackers.COMMON import COMMON
 from src.bbcode import BBCODE
 from src.exceptions import *  # noqa F403
 from src.console import console
+from src.metastore import save_meta
 from torf import Torrent
 from datetime import datetime
 from src.takescreens import disc_screenshots, dvd_screenshots, screenshots
 from src.uploadscreens import upload_screens
-from src.torrentcreate import CustomTorrent, torf_cb
+from src.torrentcreate import CustomTorrent, torf_cb, find_piece_size_variant
 
 
 class PTP():
@@ -98,7 +99,7 @@ class PTP():
             'User-Agent': self.user_agent
         }
         url = 'https://passthepopcorn.me/torrents.php'
-        response = requests.get(url, params=params, headers=headers)
+        response = await COMMON.blocking_request("GET", url, params=params, headers=headers)
         await asyncio.sleep(1)
         console.print(f"[green]Searching PTP for: [bold yellow]{filename}[/bold yellow]")
 
@@ -169,7 +170,7 @@ class PTP():
             'User-Agent': self.user_agent
         }
         url = 'https://passthepopcorn.me/torrents.php'
-        response = requests.get(url, params=params, headers=headers)
+        response = await COMMON.blocking_request("GET", url, params=params, headers=headers)
         await asyncio.sleep(1)
         try:
             if response.status_code == 200:
@@ -203,7 +204,7 @@ class PTP():
         }
         url = 'https://passthepopcorn.me/torrents.php'
         console.print(f"[yellow]Requesting description from {url} with ID {ptp_torrent_id}")
-        response = requests.get(url, params=params, headers=headers)
+        response = await COMMON.blocking_request("GET", url, params=params, headers=headers)
         await asyncio.sleep(1)
 
         ptp_desc = response.text
@@ -250,7 +251,7 @@ class PTP():
             'User-Agent': self.user_agent
         }
         url = 'https://passthepopcorn.me/torrents.php'
-        response = requests.get(url=url, headers=headers, params=params)
+        response = await COMMON.blocking_request("GET", url, headers=headers, params=params)
         await asyncio.sleep(1)
         try:
             response = response.json()
@@ -278,7 +279,7 @@ class PTP():
             'User-Agent': self.user_agent
         }
         url = "https://passthepopcorn.me/ajax.php"
-        response = requests.get(url=url, params=params, headers=headers)
+        response = await COMMON.blocking_request("GET", url, params=params, headers=headers)
         await asyncio.sleep(1)
         tinfo = {}
         try:
@@ -348,7 +349,7 @@ class PTP():
         url = 'https://passthepopcorn.me/torrents.php'
 
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with COMMON.session(timeout=10.0) as client:
                 response = await client.get(url, headers=headers, params=params)
                 await asyncio.sleep(1)  # Mimic server-friendly delay
                 if response.status_code == 200:
@@ -383,7 +384,7 @@ class PTP():
         headers = {'referer': 'https://ptpimg.me/index.php'}
         url = "https://ptpimg.me/upload.php"
 
-        response = requests.post(url, headers=headers, data=payload)
+        response = await COMMON.blocking_request("POST", url, headers=headers, data=payload)
         try:
             response = response.json()
             ptpimg_code = response[0]['code']
@@ -725,7 +726,7 @@ class PTP():
                                     print(f"Error during BDMV screenshot capture: {e}")
                                 new_screens = glob.glob1(f"{meta['base_dir']}/tmp/{meta['uuid']}", f"PLAYLIST_{i}-*.png")
                             if new_screens and not meta.get('skip_imghost_upload', False):
-                                uploaded_images, _ = await upload_screens(meta, multi_screens, 1, 0, multi_screens, new_screens, {new_images_key: meta[new_images_key]})
+                                uploaded_images, _ = await upload_screens(meta, multi_screens, 1, multi_screens, new_screens)
                                 for img in uploaded_images:
                                     meta[new_images_key].append({
                                         'img_url': img['img_url'],
@@ -737,9 +738,7 @@ class PTP():
                                     raw_url = img['raw_url']
                                     desc.write(f"[img]{raw_url}[/img]\n")
 
-                            meta_filename = f"{meta['base_dir']}/tmp/{meta['uuid']}/meta.json"
-                            with open(meta_filename, 'w') as f:
-                                json.dump(meta, f, indent=4)
+                            save_meta(meta)
 
             # Handle multiple discs case
             elif len(discs) > 1:
@@ -783,7 +782,7 @@ class PTP():
                                         print(f"Error during BDMV screenshot capture: {e}")
                                 new_screens = glob.glob1(f"{meta['base_dir']}/tmp/{meta['uuid']}", f"FILE_{i}-*.png")
                                 if new_screens and not meta.get('skip_imghost_upload', False):
-                                    uploaded_images, _ = await upload_screens(meta, multi_screens, 1, 0, multi_screens, new_screens, {new_images_key: meta[new_images_key]})
+                                    uploaded_images, _ = await upload_screens(meta, multi_screens, 1, multi_screens, new_screens)
                                     for img in uploaded_images:
                                         meta[new_images_key].append({
                                             'img_url': img['img_url'],
@@ -794,9 +793,7 @@ class PTP():
                                         desc.write(f"[img]{raw_url}[/img]\n")
                                     desc.write("\n")
 
-                                meta_filename = f"{meta['base_dir']}/tmp/{meta['uuid']}/meta.json"
-                                with open(meta_filename, 'w') as f:
-                                    json.dump(meta, f, indent=4)
+                                save_meta(meta)
 
                     elif each['type'] == "DVD":
                         if i == 0:
@@ -837,7 +834,7 @@ class PTP():
                                         print(f"Error during DVD screenshot capture: {e}")
                                 new_screens = glob.glob1(f"{meta['base_dir']}/tmp/{meta['uuid']}", f"{meta['discs'][i]['name']}-*.png")
                                 if new_screens and not meta.get('skip_imghost_upload', False):
-                                    uploaded_images, _ = await upload_screens(meta, multi_screens, 1, 0, multi_screens, new_screens, {new_images_key: meta[new_images_key]})
+                                    uploaded_images, _ = await upload_screens(meta, multi_screens, 1, multi_screens, new_screens)
                                     for img in uploaded_images:
                                         meta[new_images_key].append({
                                             'img_url': img['img_url'],
@@ -848,9 +845,7 @@ class PTP():
                                         desc.write(f"[img]{raw_url}[/img]\n")
                                     desc.write("\n")
 
-                            meta_filename = f"{meta['base_dir']}/tmp/{meta['uuid']}/meta.json"
-                            with open(meta_filename, 'w') as f:
-                                json.dump(meta, f, indent=4)
+                            save_meta(meta)
 
             # Handle single file case
             elif len(filelist) == 1:
@@ -912,7 +907,7 @@ class PTP():
                                     print(f"Error during generic screenshot capture: {e}")
                             new_screens = glob.glob1(f"{meta['base_dir']}/tmp/{meta['uuid']}", f"FILE_{i}-*.png")
                             if new_screens and not meta.get('skip_imghost_upload', False):
-                                uploaded_images, _ = await upload_screens(meta, multi_screens, 1, 0, multi_screens, new_screens, {new_images_key: meta[new_images_key]})
+                                uploaded_images, _ = await upload_screens(meta, multi_screens, 1, multi_screens, new_screens)
                                 for img in uploaded_images:
                                     meta[new_images_key].append({
                                         'img_url': img['img_url'],
@@ -923,9 +918,7 @@ class PTP():
                                     desc.write(f"[img]{raw_url}[/img]\n")
                                 desc.write("\n")
 
-                        meta_filename = f"{meta['base_dir']}/tmp/{meta['uuid']}/meta.json"
-                        with open(meta_filename, 'w') as f:
-                            json.dump(meta, f, indent=4)
+                        save_meta(meta)
 
     async def get_AntiCsrfToken(self, meta):
         if not os.path.exists(f"{meta['base_dir']}/data/cookies"):
@@ -1132,6 +1125,13 @@ class PTP():
         torrent_path = f"{meta['base_dir']}/tmp/{meta['uuid']}/{torrent_filename}"
         torrent = Torrent.read(torrent_path)
 
+        # Use the 16 MiB variant hashed alongside BASE.torrent if there is one
+        if torrent.piece_size > 16777216:
+            variant = find_piece_size_variant(meta, 16777216)
+            if variant:
+                await COMMON(config=self.config).edit_torrent(meta, self.tracker, self.source_flag, torrent_filename=variant)
+                torrent = Torrent.read(torrent_path)
+
         # Check if the piece size exceeds 16 MiB and regenerate the torrent if needed
         if torrent.piece_size > 16777216:  # 16 MiB in bytes
             console.print("[red]Piece size is OVER 16M and does not work on PTP. Generating a new .torrent")
@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
 # import discord
 import asyncio
-import requests
 import platform
 import os
 import glob
@@ -87,7 +86,7 @@ class R4E():
             data['season_number'] = meta.get('season_int', '0')
             data['episode_number'] = meta.get('episode_int', '0')
         if meta['debug'] is False:
-            response = requests.post(url=url, files=files, data=data, headers=headers)
+            response = await COMMON.blocking_request("POST", url, files=files, data=data, headers=headers)
             try:
 
                 console.print(response.json())
@@ -161,7 +160,7 @@ class R4E():
         if meta.get('edition', "") != "":
             params['name'] = params['name'] + meta['edition']
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with COMMON.session(timeout=5.0) as client:
                 response = await client.get(url=url, params=params)
                 if response.status_code == 200:
                     data = response.json()
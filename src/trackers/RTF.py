@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
 # import discord
 import asyncio
-import requests
 import base64
 import re
 import datetime
@@ -75,7 +74,7 @@ class RTF():
         }
 
         if meta['debug'] is False:
-            response = requests.post(url=self.upload_url, json=json_data, headers=headers)
+            response = await COMMON.blocking_request("POST", self.upload_url, json=json_data, headers=headers)
             try:
                 console.print(response.json())
 
@@ -117,7 +116,7 @@ class RTF():
             params['search'] = meta['title'].replace(':', '').replace("'", '').replace(",", '')
 
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with COMMON.session(timeout=5.0) as client:
                 response = await client.get(self.search_url, params=params, headers=headers)
                 if response.status_code == 200:
                     data = response.json()
@@ -145,7 +144,7 @@ class RTF():
             'Authorization': self.config['TRACKERS'][self.tracker]['api_key'].strip(),
         }
 
-        response = requests.get('https://retroflix.club/api/test', headers=headers)
+        response = await COMMON.blocking_request("GET", 'https://retroflix.club/api/test', headers=headers)
 
         if response.status_code != 200:
             console.print('[bold red]Your API key is incorrect SO generating a new one')
@@ -167,7 +166,7 @@ class RTF():
         config_path = f"{base_dir}/data/config.py"
 
         try:
-            async with httpx.AsyncClient() as client:
+            async with COMMON.session() as client:
                 response = await client.post('https://retroflix.club/api/login', headers=headers, json=json_data)
 
             if response.status_code == 201:
@@ -1,5 +1,4 @@
 # -*- coding: utf-8 -*-
-import requests
 import asyncio
 import httpx
 
@@ -107,7 +106,7 @@ class SN():
         }
 
         if meta['debug'] is False:
-            response = requests.request("POST", url=self.upload_url, data=data, files=files)
+            response = await COMMON.blocking_request("POST", self.upload_url, data=data, files=files)
 
             try:
                 if response.json().get('success'):
@@ -165,7 +164,7 @@ class SN():
                 params['filter'] = meta['resolution']
 
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with COMMON.session(timeout=10.0) as client:
                 response = await client.get(self.search_url, params=params)
                 if response.status_code == 200:
                     data = response.json()
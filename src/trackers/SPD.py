@@ -85,7 +85,7 @@ class SPD():
         headers = {'Authorization': 'Bearer ' + self.config['TRACKERS'][self.tracker]['api_key'].strip()}
 
         if meta['debug'] is False:
-            response = requests.request("POST", url=self.upload_url, json=data, headers=headers)
+            response = await COMMON.blocking_request("POST", self.upload_url, json=data, headers=headers)
             try:
                 if response.status_code == 200:
                     # response = {'status': True, 'error': False, 'downloadUrl': '/api/torrent/383435/download', 'torrent': {'id': 383435, 'name': 'name-with-full-stops', 'slug': 'name-with-dashs', 'category_id': 3}}
@@ -147,7 +147,7 @@ class SPD():
             params['search'] = meta['title'].replace(':', '').replace("'", '').replace(",", '')
 
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with COMMON.session(timeout=5.0) as client:
                 response = await client.get(url=self.search_url, params=params, headers=headers)
                 if response.status_code == 200:
                     data = response.json()
@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
 import asyncio
 from torf import Torrent
-import requests
 import json
 import glob
 import cli_ui
@@ -12,6 +11,7 @@ import httpx
 from bs4 import BeautifulSoup
 from unidecode import unidecode
 from src.console import console
+from src.trackers.COMMON import COMMON
 
 
 class THR():
@@ -208,7 +208,7 @@ class THR():
                     # 'source' : base64.b64encode(open(image, "rb").read()).decode('utf8')
                 }
                 files = {'source': open(image, 'rb')}
-                response = requests.post(url, data=data, files=files)
+                response = await COMMON.blocking_request("POST", url, data=data, files=files)
                 try:
                     response = response.json()
                     # med_url = response['image']['medium']['url']
@@ -234,7 +234,7 @@ class THR():
                     'theme': self.config['TRACKERS']['THR'].get('pronfo_theme', 'gray'),
                     'rapi': self.config['TRACKERS']['THR'].get('pronfo_rapi_id')
                 }
-                response = requests.post(pronfo_url, data=data)
+                response = await COMMON.blocking_request("POST", pronfo_url, data=data)
                 try:
                     response = response.json()
                     if response.get('error', True) is False:
@@ -264,7 +264,7 @@ class THR():
         console.print("[yellow]Searching for existing torrents on THR...")
 
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with COMMON.session(timeout=10.0) as client:
                 response = await client.get(search_url)
                 if response.status_code == 200:
                     soup = BeautifulSoup(response.text, 'html.parser')
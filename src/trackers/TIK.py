@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
 # import discord
 import asyncio
-import requests
 import os
 import re
 import platform
@@ -12,6 +11,7 @@ import click
 import httpx
 from src.trackers.COMMON import COMMON
 from src.console import console
+from src.uploadscreens import upload_screens
 
 
 class TIK():
@@ -125,7 +125,7 @@ class TIK():
         }
 
         if meta['debug'] is False:
-            response = requests.post(url=self.upload_url, files=files, data=data, headers=headers, params=params)
+            response = await COMMON.blocking_request("POST", self.upload_url, files=files, data=data, headers=headers, params=params)
             try:
                 console.print(response.json())
                 # adding torrent link to comment of torrent file
@@ -331,7 +331,7 @@ class TIK():
         if os.path.exists(poster_path):
             try:
                 console.print("Uploading standard poster to image host....")
-                new_poster_url, _ = prep.upload_screens(meta, 1, 1, 0, 1, [poster_path], {})
+                new_poster_url, _ = await upload_screens(meta, 1, 1, 1, [poster_path])
 
                 # Ensure that the new poster URL is assigned only once
                 if len(new_poster_url) > 0:
@@ -581,7 +581,7 @@ class TIK():
         if meta.get('edition', "") != "":
             params['name'] = params['name'] + f" {meta['edition']}"
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with COMMON.session(timeout=5.0) as client:
                 response = await client.get(url=self.search_url, params=params)
                 if response.status_code == 200:
                     data = response.json()
@@ -1,6 +1,5 @@
 # -*- coding: utf-8 -*-
 # import discord
-import requests
 import platform
 
 from src.trackers.COMMON import COMMON
@@ -104,7 +103,7 @@ class TL():
         }
 
         if meta['debug'] is False:
-            response = requests.post(url=self.upload_url, files=files, data=data, headers=headers)
+            response = await COMMON.blocking_request("POST", self.upload_url, files=files, data=data, headers=headers)
             if not response.text.isnumeric():
                 console.print(f'[red]{response.text}')
         else:
@@ -4,7 +4,6 @@ import requests
 import asyncio
 import re
 import os
-import cli_ui
 import httpx
 from unidecode import unidecode
 from urllib.parse import urlparse
@@ -201,7 +200,7 @@ class TTG():
         search_url = f"https://totheglory.im/browse.php?search_field= {imdb} {res_type}"
 
         try:
-            async with httpx.AsyncClient(cookies=cookies, timeout=10.0) as client:
+            async with COMMON.session(timeout=10.0, cookies=cookies) as client:
                 response = await client.get(search_url)
                 if response.status_code == 200:
                     soup = BeautifulSoup(response.text, 'html.parser')
@@ -233,17 +232,20 @@ class TTG():
         vcookie = await self.validate_cookies(meta, cookiefile)
         if vcookie is not True:
             console.print('[red]Failed to validate cookies. Please confirm that the site is up and your passkey is valid.')
-            recreate = cli_ui.ask_yes_no("Log in again and create new session?")
-            if recreate is True:
-                if os.path.exists(cookiefile):
-                    os.remove(cookiefile)
-                await self.login(cookiefile)
-                vcookie = await self.validate_cookies(meta, cookiefile)
-                return vcookie
-            else:
+            if not meta['unattended'] or (meta['unattended'] and meta.get('unattended-confirm', False)):
+                # The tracker review asks whether to log in again, see recreate_session
+                meta['recreate_session'] = True
                 return False
+            return await self.recreate_session(meta)
         return True
 
+    async def recreate_session(self, meta):
+        cookiefile = os.path.abspath(f"{meta['base_dir']}/data/cookies/TTG.pkl")
+        if os.path.exists(cookiefile):
+            os.remove(cookiefile)
+        await self.login(cookiefile)
+        return await self.validate_cookies(meta, cookiefile)
+
     async def validate_cookies(self, meta, cookiefile):
         url = "https://totheglory.im"
         if os.path.exists(cookiefile):
@@ -347,7 +349,7 @@ class TTG():
 
     async def download_new_torrent(self, id, torrent_path):
         download_url = f"https://totheglory.im/dl/{id}/{self.passkey}"
-        r = requests.get(url=download_url)
+        r = await COMMON.blocking_request("GET", download_url)
         if r.status_code == 200:
             with open(torrent_path, "wb") as tor:
                 tor.write(r.content)
@@ -1,12 +1,10 @@
 # -*- coding: utf-8 -*-
 # import discord
 import asyncio
-import requests
 import platform
 import os
 import glob
 import httpx
-import cli_ui
 from src.trackers.COMMON import COMMON
 from src.console import console
 
@@ -143,7 +141,7 @@ class ULCX():
         }
 
         if meta['debug'] is False:
-            response = requests.post(url=self.upload_url, files=files, data=data, headers=headers, params=params)
+            response = await COMMON.blocking_request("POST", self.upload_url, files=files, data=data, headers=headers, params=params)
             try:
                 console.print(response.json())
                 # adding torrent link to comment of torrent file
@@ -167,25 +165,17 @@ class ULCX():
 
     async def search_existing(self, meta, disctype):
         if 'concert' in meta['keywords']:
-            console.print('[bold red]Concerts not allowed at ULCX.')
             if not meta['unattended'] or (meta['unattended'] and meta.get('unattended-confirm', False)):
-                if cli_ui.ask_yes_no("Do you want to upload anyway?", default=False):
-                    pass
-                else:
-                    meta['skipping'] = "ULCX"
-                    return
+                meta['upload_warnings'] = meta.get('upload_warnings', []) + ["Concerts not allowed at ULCX."]
             else:
+                console.print('[bold red]Concerts not allowed at ULCX.')
                 meta['skipping'] = "ULCX"
                 return
         if meta['video_codec'] == "HEVC" and meta['resolution'] != "2160p" and 'animation' not in meta['keywords'] and meta.get('anime', False) is not True:
-            console.print('[bold red]This content might not fit HEVC rules.')
             if not meta['unattended'] or (meta['unattended'] and meta.get('unattended-confirm', False)):
-                if cli_ui.ask_yes_no("Do you want to upload anyway?", default=False):
-                    pass
-                else:
-                    meta['skipping'] = "ULCX"
-                    return
+                meta['upload_warnings'] = meta.get('upload_warnings', []) + ["This content might not fit HEVC rules."]
             else:
+                console.print('[bold red]This content might not fit HEVC rules.')
                 meta['skipping'] = "ULCX"
                 return
         dupes = []
@@ -203,7 +193,7 @@ class ULCX():
         if meta.get('edition', "") != "":
             params['name'] = params['name'] + f" {meta['edition']}"
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with COMMON.session(timeout=5.0) as client:
                 response = await client.get(url=self.search_url, params=params)
                 if response.status_code == 200:
                     data = response.json()
@@ -45,6 +45,7 @@ from src.trackers.SP import SP
 from src.trackers.YUS import YUS
 from src.trackers.TOCA import TOCA
 from src.console import console
+from src.trackerhttp import tracker_session
 import httpx
 import os
 import json
@@ -109,7 +110,7 @@ class TRACKER_SETUP:
         all_data = []
         next_cursor = None
 
-        async with httpx.AsyncClient() as client:
+        async with tracker_session() as client:
             while True:
                 try:
                     # Add query parameters for pagination
@@ -207,16 +208,16 @@ class TRACKER_SETUP:
         with open(file_path, "r", encoding="utf-8") as file:
             return file.read()
 
-    async def check_banned_group(self, tracker, banned_group_list, meta):
-        result = False
+    async def find_banned_group(self, tracker, banned_group_list, meta):
+        """Entry of the tracker's banned group list that matches meta's tag, None when the group is not banned."""
         if not meta['tag']:
-            return False
+            return None
 
         if tracker.upper() in ("AITHER", "LST"):
             file_path = await self.get_banned_groups(meta, tracker)
             if not file_path:
                 console.print(f"[bold red]Failed to load banned groups for '{tracker}'.")
-                return False
+                return None
 
             # Load the banned groups from the file
             try:
@@ -228,33 +229,33 @@ class TRACKER_SETUP:
 
             except FileNotFoundError:
                 console.print(f"[bold red]Banned group file for '{tracker}' not found.")
-                return False
+                return None
             except json.JSONDecodeError:
                 console.print(f"[bold red]Failed to parse banned group file for '{tracker}'.")
-                return False
+                return None
 
         for tag in banned_group_list:
-            if isinstance(tag, list):
-                if meta['tag'][1:].lower() == tag[0].lower():
-                    console.print(f"[bold yellow]{meta['tag'][1:]}[/bold yellow][bold red] was found on [bold yellow]{tracker}'s[/bold yellow] list of banned groups.")
-                    console.print(f"[bold red]NOTE: [bold yellow]{tag[1]}")
-                    await asyncio.sleep(5)
-                    result = True
-            else:
-                if meta['tag'][1:].lower() == tag.lower():
-                    console.print(f"[bold yellow]{meta['tag'][1:]}[/bold yellow][bold red] was found on [bold yellow]{tracker}'s[/bold yellow] list of banned groups.")
-                    await asyncio.sleep(5)
-                    result = True
-
-        if result:
-            if not meta['unattended'] or meta.get('unattended-confirm', False):
-                if cli_ui.ask_yes_no(cli_ui.red, "Do you want to continue anyway?", default=False):
-                    return False
-                return True
+            group = tag[0] if isinstance(tag, list) else tag
+            if meta['tag'][1:].lower() == group.lower():
+                return tag
+        return None
+
+    async def check_banned_group(self, tracker, banned_group_list, meta):
+        tag = await self.find_banned_group(tracker, banned_group_list, meta)
+        if tag is None:
+            return False
+
+        console.print(f"[bold yellow]{meta['tag'][1:]}[/bold yellow][bold red] was found on [bold yellow]{tracker}'s[/bold yellow] list of banned groups.")
+        if isinstance(tag, list):
+            console.print(f"[bold red]NOTE: [bold yellow]{tag[1]}")
+        await asyncio.sleep(5)
 
+        if not meta['unattended'] or meta.get('unattended-confirm', False):
+            if cli_ui.ask_yes_no(cli_ui.red, "Do you want to continue anyway?", default=False):
+                return False
             return True
 
-        return False
+        return True
 
     async def write_internal_claims_to_file(self, file_path, data):
         try:
@@ -315,7 +316,7 @@ class TRACKER_SETUP:
         all_data = []
         next_cursor = None
 
-        async with httpx.AsyncClient() as client:
+        async with tracker_session() as client:
             while True:
                 try:
                     # Add query parameters for pagination
@@ -1,16 +1,15 @@
 import asyncio
 import os
 from torf import Torrent
-from src.trackers.PTP import PTP
 from src.trackersetup import TRACKER_SETUP, tracker_class_map, http_trackers
 from src.console import console
 from data.config import config
 from src.trackers.COMMON import COMMON
 from src.clients import Clients
 from src.uphelper import UploadHelper
-from src.torrentcreate import create_base_from_existing_torrent
+from src.torrentcreate import create_base_from_existing_torrent, find_piece_size_variant
+from src.metaoverlay import MetaOverlay
 import cli_ui
-import copy
 
 
 async def process_all_trackers(meta):
@@ -22,44 +21,85 @@ async def process_all_trackers(meta):
     helper = UploadHelper()
     meta_lock = asyncio.Lock()  # noqa F841
 
-    async def process_single_tracker(tracker_name, shared_meta):
-        nonlocal successful_trackers
-        local_meta = copy.deepcopy(shared_meta)  # Ensure each task gets its own copy of meta
-        local_tracker_status = {'banned': False, 'skipped': False, 'dupe': False, 'upload': False}
-        disctype = local_meta.get('disctype', None)
-        console.print(f"\n[bold yellow]Processing Tracker: {tracker_name}[/bold yellow]")
+    async def check_single_tracker(tracker_name, shared_meta):
+        """Network half of the tracker checks (credentials, PTP group, banned list, claims, dupe search), no prompts."""
+        local_meta = MetaOverlay(shared_meta)  # Each task writes to its own overlay of meta
+        checks = {'meta': local_meta, 'tracker_class': None, 'group_id': None, 'banned': False, 'claimed': False, 'dupes': []}
 
         if local_meta['name'].endswith('DUPE?'):
             local_meta['name'] = local_meta['name'].replace(' DUPE?', '')
 
+        if tracker_name not in tracker_class_map:
+            return checks
+
+        tracker_class = checks['tracker_class'] = tracker_class_map[tracker_name](config=config)
+        if tracker_name in http_trackers:
+            await tracker_class.validate_credentials(local_meta)
+
+        if tracker_name == "PTP":
+            console.print("[yellow]Searching for Group ID on PTP")
+            checks['group_id'] = await tracker_class.get_group_by_imdb(local_meta['imdb'])
+
+        # Also refreshes the downloaded AITHER/LST lists, the review only reads them
+        checks['banned'] = await tracker_setup.find_banned_group(tracker_class.tracker, tracker_class.banned_groups, local_meta) is not None
+
+        if tracker_name == "AITHER":
+            checks['claimed'] = await tracker_setup.get_torrent_claims(local_meta, tracker_name)
+
+        # Banned groups are only searched if the review decides to upload anyway,
+        # a dead session after the review logs back in
+        if not checks['banned'] and not local_meta.get('recreate_session', False):
+            checks['dupes'] = await search_dupes(tracker_name, checks)
+
+        return checks
+
+    async def search_dupes(tracker_name, checks):
+        local_meta = checks['meta']
+        tracker_class = checks['tracker_class']
+        disctype = local_meta.get('disctype', None)
+        dupes = []
+        if tracker_name not in {"THR", "PTP", "TL"}:
+            dupes = await tracker_class.search_existing(local_meta, disctype)
+        elif tracker_name == "PTP":
+            dupes = await tracker_class.search_existing(checks['group_id'], local_meta, disctype)
+
+        if ('skipping' not in local_meta or local_meta['skipping'] is None) and tracker_name != "TL":
+            dupes = await common.filter_dupes(dupes, local_meta, tracker_name)
+        return dupes
+
+    async def review_single_tracker(tracker_name, checks):
+        """Interactive half of the tracker checks, run one tracker at a time on the results of check_single_tracker."""
+        nonlocal successful_trackers
+        local_meta = checks['meta']
+        local_tracker_status = {'banned': False, 'skipped': False, 'dupe': False, 'upload': False}
+        console.print(f"\n[bold yellow]Processing Tracker: {tracker_name}[/bold yellow]")
+
         if tracker_name == "MANUAL":
             local_tracker_status['upload'] = True
             successful_trackers += 1
 
         if tracker_name in tracker_class_map:
-            tracker_class = tracker_class_map[tracker_name](config=config)
-            if tracker_name in http_trackers:
-                await tracker_class.validate_credentials(meta)
-            if tracker_name in {"THR", "PTP"}:
-                if local_meta.get('imdb_id', 0) == 0:
-                    imdb_id = 0 if local_meta.get('unattended', False) else cli_ui.ask_string(
-                        "Unable to find IMDB id, please enter e.g.(tt1234567)"
-                    ).strip()
-
-                    if not imdb_id:
-                        meta['imdb'] = '0'
-                    else:
-                        imdb_id = imdb_id.lower()
-                        if imdb_id.startswith("tt") and imdb_id[2:].isdigit():
-                            meta['imdb'] = imdb_id[2:].zfill(7)
-                        else:
-                            cli_ui.error("Invalid IMDB ID format. Expected format: tt1234567")
-                            meta['imdb'] = '0'
+            tracker_class = checks['tracker_class']
+
+            # Questions the network checks left for the review: an expired session and the tracker's own rules
+            if local_meta.get('recreate_session', False):
+                local_meta['recreate_session'] = False
+                if cli_ui.ask_yes_no("Log in again and create new session?") and await tracker_class.recreate_session(local_meta) is True:
+                    if not checks['banned']:
+                        checks['dupes'] = await search_dupes(tracker_name, checks)
+                else:
+                    local_tracker_status['skipped'] = True
+                    return local_tracker_status
+
+            if local_meta.get('upload_warnings'):
+                for warning in local_meta['upload_warnings']:
+                    console.print(f"[bold red]{warning}")
+                if not cli_ui.ask_yes_no("Do you want to upload anyway?", default=False):
+                    local_tracker_status['skipped'] = True
+                    return local_tracker_status
 
             if tracker_name == "PTP":
-                console.print("[yellow]Searching for Group ID on PTP")
-                ptp = PTP(config=config)
-                groupID = await ptp.get_group_by_imdb(local_meta['imdb'])
+                groupID = checks['group_id']
                 if groupID is None:
                     console.print("[yellow]No Existing Group found")
                     if local_meta.get('youtube', None) is None or "youtube" not in str(local_meta.get('youtube', '')):
@@ -72,22 +112,19 @@ async def process_all_trackers(meta):
                 local_tracker_status['banned'] = True
             else:
                 local_tracker_status['banned'] = False
+                if checks['banned']:
+                    # Uploading a banned group anyway, search for dupes now
+                    checks['dupes'] = await search_dupes(tracker_name, checks)
 
             if not local_tracker_status['banned']:
                 if tracker_name == "AITHER":
-                    if await tracker_setup.get_torrent_claims(local_meta, tracker_name):
+                    if checks['claimed']:
                         local_tracker_status['skipped'] = True
                     else:
                         local_tracker_status['skipped'] = False
 
-                if tracker_name not in {"THR", "PTP", "TL"}:
-                    dupes = await tracker_class.search_existing(local_meta, disctype)
-                elif tracker_name == "PTP":
-                    dupes = await ptp.search_existing(groupID, local_meta, disctype)
-
                 if ('skipping' not in local_meta or local_meta['skipping'] is None) and tracker_name != "TL":
-                    dupes = await common.filter_dupes(dupes, local_meta, tracker_name)
-                    local_meta, is_dupe = await helper.dupe_check(dupes, local_meta, tracker_name)
+                    local_meta, is_dupe = await helper.dupe_check(checks['dupes'], local_meta, tracker_name)
                     if is_dupe:
                         local_tracker_status['dupe'] = True
                 elif 'skipping' in local_meta:
@@ -109,7 +146,7 @@ async def process_all_trackers(meta):
                                         local_tracker_status['skipped'] = True
                             elif os.path.exists(torrent_path):
                                 torrent = Torrent.read(torrent_path)
-                                if torrent.piece_size > 8388608:
+                                if torrent.piece_size > 8388608 and not find_piece_size_variant(local_meta, 8388608):
                                     console.print("[yellow]Existing torrent found with piece size greater than 8MB[yellow]")
                                     local_tracker_status['skipped'] = True
 
@@ -136,17 +173,29 @@ async def process_all_trackers(meta):
                 successful_trackers += 1
             meta['we_asked'] = False
 
-        return tracker_name, local_tracker_status
-
-    if meta.get('unattended', False):
-        tasks = [process_single_tracker(tracker_name, meta) for tracker_name in meta['trackers']]
-        results = await asyncio.gather(*tasks)
-        for tracker_name, status in results:
-            tracker_status[tracker_name] = status
-    else:
-        for tracker_name in meta['trackers']:
-            tracker_name, status = await process_single_tracker(tracker_name, meta)
-            tracker_status[tracker_name] = status
+        return local_tracker_status
+
+    # THR and PTP need an IMDb id, ask for a missing one once before the checks start
+    if {"THR", "PTP"} & set(meta['trackers']) and meta.get('imdb_id', 0) == 0:
+        imdb_id = 0 if meta.get('unattended', False) else cli_ui.ask_string(
+            "Unable to find IMDB id, please enter e.g.(tt1234567)"
+        ).strip()
+
+        if not imdb_id:
+            meta['imdb'] = '0'
+        else:
+            imdb_id = imdb_id.lower()
+            if imdb_id.startswith("tt") and imdb_id[2:].isdigit():
+                meta['imdb'] = imdb_id[2:].zfill(7)
+            else:
+                cli_ui.error("Invalid IMDB ID format. Expected format: tt1234567")
+                meta['imdb'] = '0'
+
+    # All network work for every tracker at once, then a single review of the results in tracker order
+    shared_meta = dict(meta)
+    checks = await asyncio.gather(*(check_single_tracker(tracker_name, shared_meta) for tracker_name in meta['trackers']))
+    for tracker_name, tracker_checks in zip(meta['trackers'], checks):
+        tracker_status[tracker_name] = await review_single_tracker(tracker_name, tracker_checks)
 
     if meta['debug']:
         console.print("\n[bold]Tracker Processing Summary:[/bold]")
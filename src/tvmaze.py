@@ -1,5 +1,6 @@
 from src.console import console
 import httpx
+from src.httpcache import cached_client
 import json
 
 
@@ -114,7 +115,7 @@ async def search_tvmaze(filename, year, imdbID, tvdbID, manual_date=None, tvmaze
 async def _make_tvmaze_request(url, params):
     """Sync function to make the request inside ThreadPoolExecutor."""
     try:
-        async with httpx.AsyncClient(follow_redirects=True) as client:
+        async with cached_client(follow_redirects=True) as client:
             resp = await client.get(url, params=params, timeout=10)
             if resp.status_code == 200:
                 return resp.json()
@@ -0,0 +1,92 @@
+import time
+import asyncio
+import traceback
+from src.console import console
+
+# Seconds a tracker needs between the end of one upload and the start of the next, unless set per tracker
+# with "upload_spacing" in its config
+DEFAULT_UPLOAD_SPACING = {
+    'PTP': 5,
+    'SN': 16,
+}
+# Seconds to wait after an upload before its torrent is added to the client, unless set per tracker with "add_delay"
+DEFAULT_ADD_DELAY = {
+    'PTP': 5,
+    'SN': 16,
+}
+DEFAULT_UPLOAD_CONCURRENCY = 4
+
+_schedulers = {}
+
+
+class TrackerUploadScheduler:
+    """
+    Runs tracker uploads concurrently: at most tracker_upload_concurrency uploads at once overall, at most a tracker's
+    "upload_concurrency" (default 1) on any one tracker, and a tracker's "upload_spacing" seconds between its uploads.
+    One scheduler lives for the whole run so spacing also holds between queued items.
+    """
+
+    def __init__(self, config):
+        self.config = config
+        limit = int(config['DEFAULT'].get('tracker_upload_concurrency', DEFAULT_UPLOAD_CONCURRENCY) or 1)
+        self.slots = asyncio.Semaphore(max(1, limit))
+        self.tracker_slots = {}
+        self.last_finished = {}
+
+    def tracker_config(self, tracker):
+        return self.config['TRACKERS'].get(tracker, {})
+
+    def tracker_slot(self, tracker):
+        if tracker not in self.tracker_slots:
+            limit = int(self.tracker_config(tracker).get('upload_concurrency', 1) or 1)
+            self.tracker_slots[tracker] = asyncio.Semaphore(max(1, limit))
+        return self.tracker_slots[tracker]
+
+    def spacing(self, tracker):
+        return float(self.tracker_config(tracker).get('upload_spacing', DEFAULT_UPLOAD_SPACING.get(tracker, 0)) or 0)
+
+    def add_delay(self, tracker):
+        return float(self.tracker_config(tracker).get('add_delay', DEFAULT_ADD_DELAY.get(tracker, 0)) or 0)
+
+    async def run(self, tracker, upload):
+        """
+        Await upload() (truthy when the torrent was uploaded) within the limits of tracker.
+        Returns a row for report_uploads: tracker, seconds waited, seconds uploading, result.
+        """
+        queued = time.time()
+        async with self.tracker_slot(tracker):
+            wait = self.last_finished.get(tracker, 0) + self.spacing(tracker) - time.time()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            async with self.slots:
+                started = time.time()
+                try:
+                    result = "uploaded" if await upload() else "not uploaded"
+                except Exception as e:
+                    # One failing tracker does not stop the uploads to the others
+                    console.print(f"[red]{tracker} upload failed")
+                    console.print(traceback.format_exc())
+                    result = f"failed: {e}"
+                finished = time.time()
+                if result != "not uploaded":
+                    self.last_finished[tracker] = finished
+        return tracker, started - queued, finished - started, result
+
+
+def get_upload_scheduler(config):
+    """The scheduler of the running event loop."""
+    loop = asyncio.get_running_loop()
+    if loop not in _schedulers:
+        _schedulers[loop] = TrackerUploadScheduler(config)
+    return _schedulers[loop]
+
+
+def report_uploads(rows):
+    """Print the per-tracker timing and result table of one item's uploads."""
+    if not rows:
+        return
+    console.print("[bold]Tracker uploads:[/bold]")
+    width = max(len(row[0]) for row in rows)
+    for tracker, waited, elapsed, result in rows:
+        color = "green" if result == "uploaded" else "yellow" if result == "not uploaded" else "red"
+        console.print(f"  {tracker.ljust(width)}  waited {waited:6.2f}s  upload {elapsed:6.2f}s  [{color}]{result}[/{color}]")
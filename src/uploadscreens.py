@@ -1,311 +1,145 @@
 from src.console import console
 from data.config import config
 import os
-import pyimgbox
 import asyncio
-import requests
 import glob
-import base64
 import time
 import re
 import gc
-import json
-from concurrent.futures import ThreadPoolExecutor
-
-
-def upload_image_task(args):
-    image, img_host, config, meta = args
-    try:
-        timeout = 60  # Default timeout
-        img_url, raw_url, web_url = None, None, None
-
-        if img_host == "imgbox":
-            try:
-                image_list = asyncio.run(imgbox_upload(os.getcwd(), [image], meta, return_dict={}))
-                if image_list and all(
-                    'img_url' in img and 'raw_url' in img and 'web_url' in img for img in image_list
-                ):
-                    img_url = image_list[0]['img_url']
-                    raw_url = image_list[0]['raw_url']
-                    web_url = image_list[0]['web_url']
-                else:
-                    return {
-                        'status': 'failed',
-                        'reason': "Imgbox upload failed. No valid URLs returned."
-                    }
-            except Exception as e:
-                return {
-                    'status': 'failed',
-                    'reason': f"Error during Imgbox upload: {str(e)}"
-                }
-
-        elif img_host == "ptpimg":
-            payload = {
-                'format': 'json',
-                'api_key': config['DEFAULT']['ptpimg_api']
-            }
-
-            with open(image, 'rb') as file:
-                files = [('file-upload[0]', file)]
-                headers = {'referer': 'https://ptpimg.me/index.php'}
-
-                try:
-                    response = requests.post(
-                        "https://ptpimg.me/upload.php", headers=headers, data=payload, files=files, timeout=timeout
-                    )
-                    response.raise_for_status()  # Raise an exception for HTTP errors
-                    response_data = response.json()
-
-                    if not response_data or not isinstance(response_data, list) or 'code' not in response_data[0]:
-                        return {'status': 'failed', 'reason': "Invalid JSON response from ptpimg"}
-
-                    code = response_data[0]['code']
-                    ext = response_data[0]['ext']
-                    img_url = f"https://ptpimg.me/{code}.{ext}"
-                    raw_url = img_url
-                    web_url = img_url
-
-                except requests.exceptions.Timeout:
-                    return {'status': 'failed', 'reason': 'Request timed out'}
-                except requests.exceptions.RequestException as e:
-                    return {'status': 'failed', 'reason': f"Request failed: {str(e)}"}
-                except json.JSONDecodeError:
-                    return {'status': 'failed', 'reason': 'Invalid JSON response from ptpimg'}
-
-        elif img_host == "imgbb":
-            url = "https://api.imgbb.com/1/upload"
-            try:
-                with open(image, "rb") as img_file:
-                    encoded_image = base64.b64encode(img_file.read()).decode('utf8')
-
-                data = {
-                    'key': config['DEFAULT']['imgbb_api'],
-                    'image': encoded_image,
-                }
-
-                response = requests.post(url, data=data, timeout=timeout)
-                response_data = response.json()
-                if response.status_code != 200 or not response_data.get('success'):
-                    console.print("[yellow]imgbb failed, trying next image host")
-                    return {'status': 'failed', 'reason': 'imgbb upload failed'}
-
-                img_url = response_data['data'].get('medium', {}).get('url') or response_data['data']['thumb']['url']
-                raw_url = response_data['data']['image']['url']
-                web_url = response_data['data']['url_viewer']
-
-                if meta['debug']:
-                    console.print(f"[green]Image URLs: img_url={img_url}, raw_url={raw_url}, web_url={web_url}")
-
-                return {'status': 'success', 'img_url': img_url, 'raw_url': raw_url, 'web_url': web_url}
-
-            except requests.exceptions.Timeout:
-                console.print("[red]Request timed out. The server took too long to respond.")
-                return {'status': 'failed', 'reason': 'Request timed out'}
-
-            except ValueError as e:  # JSON decoding error
-                console.print(f"[red]Invalid JSON response: {e}")
-                return {'status': 'failed', 'reason': 'Invalid JSON response'}
-
-            except requests.exceptions.RequestException as e:
-                console.print(f"[red]Request failed with error: {e}")
-                return {'status': 'failed', 'reason': str(e)}
-
-        elif img_host == "dalexni":
-            url = "https://dalexni.com/1/upload"
-            try:
-                with open(image, "rb") as img_file:
-                    encoded_image = base64.b64encode(img_file.read()).decode('utf8')
-
-                data = {
-                    'key': config['DEFAULT']['dalexni_api'],
-                    'image': encoded_image,
-                }
-
-                response = requests.post(url, data=data, timeout=timeout)
-                response_data = response.json()
-                if response.status_code != 200 or not response_data.get('success'):
-                    console.print("[yellow]DALEXNI failed, trying next image host")
-                    return {'status': 'failed', 'reason': 'DALEXNI upload failed'}
-
-                img_url = response_data['data'].get('medium', {}).get('url') or response_data['data']['thumb']['url']
-                raw_url = response_data['data']['image']['url']
-                web_url = response_data['data']['url_viewer']
-
-                if meta['debug']:
-                    console.print(f"[green]Image URLs: img_url={img_url}, raw_url={raw_url}, web_url={web_url}")
-
-                return {'status': 'success', 'img_url': img_url, 'raw_url': raw_url, 'web_url': web_url}
-
-            except requests.exceptions.Timeout:
-                console.print("[red]Request timed out. The server took too long to respond.")
-                return {'status': 'failed', 'reason': 'Request timed out'}
-
-            except ValueError as e:  # JSON decoding error
-                console.print(f"[red]Invalid JSON response: {e}")
-                return {'status': 'failed', 'reason': 'Invalid JSON response'}
-
-            except requests.exceptions.RequestException as e:
-                console.print(f"[red]Request failed with error: {e}")
-                return {'status': 'failed', 'reason': str(e)}
-
-        elif img_host == "ptscreens":
-            url = "https://ptscreens.com/api/1/upload"
-            try:
-                files = {
-                    'source': ('file-upload[0]', open(image, 'rb')),
-                }
-                headers = {
-                    'X-API-Key': config['DEFAULT']['ptscreens_api']
-                }
-                response = requests.post(url, headers=headers, files=files, timeout=timeout)
-                response_data = response.json()
-                if response_data.get('status_code') != 200:
-                    console.print("[yellow]ptscreens failed, trying next image host")
-                    return {'status': 'failed', 'reason': 'ptscreens upload failed'}
-
-                img_url = response_data['image']['medium']['url']
-                raw_url = response_data['image']['url']
-                web_url = response_data['image']['url_viewer']
-                if meta['debug']:
-                    console.print(f"[green]Image URLs: img_url={img_url}, raw_url={raw_url}, web_url={web_url}")
-
-            except requests.exceptions.Timeout:
-                console.print("[red]Request timed out. The server took too long to respond.")
-                return {'status': 'failed', 'reason': 'Request timed out'}
-            except requests.exceptions.RequestException as e:
-                console.print(f"[red]Request failed with error: {e}")
-                return {'status': 'failed', 'reason': str(e)}
-
-        elif img_host == "oeimg":
-            url = "https://imgoe.download/api/1/upload"
-            try:
-                data = {
-                    'image': base64.b64encode(open(image, "rb").read()).decode('utf8')
-                }
-                headers = {
-                    'X-API-Key': config['DEFAULT']['oeimg_api'],
-                }
-                response = requests.post(url, data=data, headers=headers, timeout=timeout)
-                response_data = response.json()
-                if response.status_code != 200 or not response_data.get('success'):
-                    console.print("[yellow]OEimg failed, trying next image host")
-                    return {'status': 'failed', 'reason': 'OEimg upload failed'}
-
-                img_url = response_data['data']['image']['url']
-                raw_url = response_data['data']['image']['url']
-                web_url = response_data['data']['url_viewer']
-                if meta['debug']:
-                    console.print(f"[green]Image URLs: img_url={img_url}, raw_url={raw_url}, web_url={web_url}")
-
-            except requests.exceptions.Timeout:
-                console.print("[red]Request timed out. The server took too long to respond.")
-                return {'status': 'failed', 'reason': 'Request timed out'}
-            except requests.exceptions.RequestException as e:
-                console.print(f"[red]Request failed with error: {e}")
-                return {'status': 'failed', 'reason': str(e)}
-
-        elif img_host == "pixhost":
-            url = "https://api.pixhost.to/images"
-            data = {
-                'content_type': '0',
-                'max_th_size': 350
-            }
-            files = {
-                'img': ('file-upload[0]', open(image, 'rb'))
-            }
-            response = requests.post(url, data=data, files=files, timeout=timeout)
-            response_data = response.json()
-            if response.status_code == 200:
-                raw_url = response_data['th_url'].replace('https://t', 'https://img').replace('/thumbs/', '/images/')
-                img_url = response_data['th_url']
-                web_url = response_data['show_url']
-
-        elif img_host == "lensdump":
-            url = "https://lensdump.com/api/1/upload"
-            data = {
-                'image': base64.b64encode(open(image, "rb").read()).decode('utf8')
-            }
-            headers = {
-                'X-API-Key': config['DEFAULT']['lensdump_api']
-            }
-            response = requests.post(url, data=data, headers=headers, timeout=timeout)
-            response_data = response.json()
-            if response_data.get('status_code') == 200:
-                img_url = response_data['data']['image']['url']
-                raw_url = response_data['data']['image']['url']
-                web_url = response_data['data']['url_viewer']
-
-        elif img_host == "zipline":
-            url = config['DEFAULT'].get('zipline_url')
-            api_key = config['DEFAULT'].get('zipline_api_key')
-
-            if not url or not api_key:
-                console.print("[red]Error: Missing Zipline URL or API key in config.")
-                return {'status': 'failed', 'reason': 'Missing Zipline URL or API key'}
-
-            try:
-                with open(image, "rb") as img_file:
-                    files = {'file': img_file}
-                    headers = {
-                        'Authorization': f'{api_key}',
-                    }
-
-                    response = requests.post(url, files=files, headers=headers, timeout=timeout)
-                    if response.status_code == 200:
-                        response_data = response.json()
-                        if 'files' in response_data:
-                            img_url = response_data['files'][0]
-                            raw_url = img_url.replace('/u/', '/r/')
-                            web_url = img_url.replace('/u/', '/r/')
-                            return {
-                                'status': 'success',
-                                'img_url': img_url,
-                                'raw_url': raw_url,
-                                'web_url': web_url
-                            }
-                        else:
-                            return {'status': 'failed', 'reason': 'No valid URL returned from Zipline'}
-
-                    else:
-                        return {'status': 'failed', 'reason': f"Zipline upload failed: {response.text}"}
-            except requests.exceptions.Timeout:
-                console.print("[red]Request timed out. The server took too long to respond.")
-                return {'status': 'failed', 'reason': 'Request timed out'}
-
-            except ValueError as e:  # JSON decoding error
-                console.print(f"[red]Invalid JSON response: {e}")
-                return {'status': 'failed', 'reason': 'Invalid JSON response'}
-
-            except requests.exceptions.RequestException as e:
-                console.print(f"[red]Request failed with error: {e}")
-                return {'status': 'failed', 'reason': str(e)}
-
-        if img_url and raw_url and web_url:
-            return {
-                'status': 'success',
-                'img_url': img_url,
-                'raw_url': raw_url,
-                'web_url': web_url,
-                'local_file_path': image
-            }
-        else:
-            return {
-                'status': 'failed',
-                'reason': f"Failed to upload image to {img_host}. No URLs received."
-            }
-
-    except Exception as e:
-        return {
-            'status': 'failed',
-            'reason': str(e)
-        }
-
+from src.imagehosts import upload_image
+
+
+def extract_numeric_suffix(filename):
+    match = re.search(r"-(\d+)\.png$", filename)
+    return int(match.group(1)) if match else float('inf')
+
+
+def img_host_number(img_host):
+    """Position of img_host in the img_host_N config keys, 1 if it is not configured."""
+    for key, value in config['DEFAULT'].items():
+        if key.startswith('img_host_') and value == img_host and key[len('img_host_'):].isdigit():
+            return int(key[len('img_host_'):])
+    return 1
+
+
+async def upload_with_fallback(image, img_host_num, meta):
+    """Upload one image that failed on img_host_<img_host_num>, moving it alone on to each later image host."""
+    result = {'status': 'failed', 'reason': 'No more image hosts available'}
+    img_host_num += 1
+    while f'img_host_{img_host_num}' in config['DEFAULT']:
+        img_host = config['DEFAULT'][f'img_host_{img_host_num}']
+        console.print(f"[cyan]Retrying {os.path.basename(image)} on the next image host: {img_host}[/cyan]")
+        result = await upload_image(image, img_host, config, meta)
+        if result['status'] == 'success':
+            return result
+        img_host_num += 1
+    console.print(f"[red]Unable to upload {os.path.basename(image)} to any image host: {result['reason']}")
+    return result
+
+
+def screenshot_files(meta):
+    """Screenshot file names in the item's tmp folder that get uploaded, sorted by their numeric suffix."""
+    tmp_dir = f"{meta['base_dir']}/tmp/{meta['uuid']}"
+    images = {os.path.basename(image) for image in glob.glob(os.path.join(glob.escape(tmp_dir), "*.png"))}
+    images = [image for image in images if not image.startswith(("FILE", "PLAYLIST", "POSTER"))]
+    images.sort(key=extract_numeric_suffix)
+    return images
+
+
+class ScreenUploadStream:
+    """
+    Uploads screenshots to the current image host as soon as the capture code publishes them, so host
+    latency is hidden behind the remaining captures. finish() reconciles the uploads with the screenshots
+    that were finally kept (dropped or retaken frames are discarded or re-uploaded) and stores the results
+    in meta['image_list'] in screenshot order, falling back to the next image host like upload_screens.
+    """
+
+    def __init__(self, meta):
+        self.meta = meta
+        self.img_host = meta['imghost']
+        self.uploads = {}
+        self.start_time = time.time()
+
+    @staticmethod
+    def signature(image):
+        stat = os.stat(image)
+        return stat.st_size, stat.st_mtime
+
+    def publish(self, image):
+        """Start uploading a finished screenshot, unless this exact file is already being uploaded."""
+        image = os.path.abspath(image)
+        try:
+            signature = self.signature(image)
+        except OSError:
+            return
+        current = self.uploads.get(image)
+        if current is not None:
+            if current[0] == signature and not current[1].cancelled():
+                return
+            current[1].cancel()
+        if self.meta['debug']:
+            console.print(f"[cyan]Uploading {os.path.basename(image)} to {self.img_host}")
+        self.uploads[image] = (signature, asyncio.create_task(self._upload(image)))
+
+    async def _upload(self, image):
+        return await upload_image(image, self.img_host, config, self.meta)
+
+    def cancel(self):
+        for _, task in self.uploads.values():
+            task.cancel()
 
-# Global Thread Pool Executor for better thread control
-thread_pool = ThreadPoolExecutor(max_workers=10)
+    async def finish(self, total_screens):
+        meta = self.meta
+        tmp_dir = f"{meta['base_dir']}/tmp/{meta['uuid']}"
+        if 'image_sizes' not in meta:
+            meta['image_sizes'] = {}
+        existing_count = len([img for img in meta['image_list'] if img.get('img_url') and img.get('web_url')])
+        images_needed = max(total_screens - existing_count, 0)
+        selected = [os.path.abspath(os.path.join(tmp_dir, image)) for image in screenshot_files(meta)][:images_needed]
+
+        for image in list(self.uploads):
+            if image not in selected:
+                self.uploads.pop(image)[1].cancel()
+        for image in selected:
+            current = self.uploads.get(image)
+            if current is not None and current[1].done() and (current[1].cancelled() or current[1].exception() is not None):
+                self.uploads.pop(image)
+            self.publish(image)
+
+        uploaded = [image for image in selected if image in self.uploads]
+        results = await asyncio.gather(*[self.uploads[image][1] for image in uploaded], return_exceptions=True)
+        img_host_num = img_host_number(self.img_host)
+        failed = []
+        for image, result in zip(uploaded, results):
+            if not (isinstance(result, dict) and result.get('status') == 'success'):
+                console.print(f"[red]{result}")
+                failed.append(image)
+        # Only the images that failed move on to the next image host
+        retried = dict(zip(failed, await asyncio.gather(*[upload_with_fallback(image, img_host_num, meta) for image in failed])))
+        results = [retried.get(image, result) for image, result in zip(uploaded, results)]
+        successfully_uploaded = [result for result in results if isinstance(result, dict) and result.get('status') == 'success']
+
+        if len(successfully_uploaded) + len(meta['image_list']) < meta.get('cutoff', 1):
+            console.print(f"[red]Only {len(successfully_uploaded)} screenshots could be uploaded to any image host.")
+
+        for upload in successfully_uploaded:
+            raw_url = upload['raw_url']
+            if raw_url in {img['raw_url'] for img in meta['image_list']}:
+                continue
+            if meta['debug']:
+                console.print(f"[blue]Adding {raw_url} to image_list")
+            meta['image_list'].append({'img_url': upload['img_url'], 'raw_url': raw_url, 'web_url': upload['web_url'], 'img_host': upload.get('img_host')})
+            local_file_path = upload.get('local_file_path')
+            if local_file_path and os.path.exists(local_file_path):
+                meta['image_sizes'][raw_url] = os.path.getsize(local_file_path)
+
+        console.print(f"[green]Successfully uploaded {len(successfully_uploaded)} images.")
+        if meta['debug']:
+            console.print(f"Screenshot uploads finished {time.time() - self.start_time:.4f} seconds after the first capture started")
+        return meta['image_list'], len(successfully_uploaded)
 
 
-async def upload_screens(meta, screens, img_host_num, i, total_screens, custom_img_list, return_dict, retry_mode=False, max_retries=3):
+async def upload_screens(meta, screens, img_host_num, total_screens, custom_img_list, retry_mode=False):
     if meta['debug']:
         upload_start_time = time.time()
 
@@ -323,21 +157,7 @@ async def upload_screens(meta, screens, img_host_num, i, total_screens, custom_i
         existing_images = []
         existing_count = 0
     else:
-        image_glob = glob.glob("*.png")
-        unwanted_patterns = ["FILE*", "PLAYLIST*", "POSTER*"]
-        unwanted_files = set()
-        for pattern in unwanted_patterns:
-            unwanted_files.update(glob.glob(pattern))
-
-        image_glob = [file for file in image_glob if file not in unwanted_files]
-        image_glob = list(set(image_glob))
-
-        # Sort images by numeric suffix
-        def extract_numeric_suffix(filename):
-            match = re.search(r"-(\d+)\.png$", filename)
-            return int(match.group(1)) if match else float('inf')
-
-        image_glob.sort(key=extract_numeric_suffix)
+        image_glob = screenshot_files(meta)
 
         if meta['debug']:
             console.print("image globs (sorted):", image_glob)
@@ -357,37 +177,30 @@ async def upload_screens(meta, screens, img_host_num, i, total_screens, custom_i
         for index, image in enumerate(image_glob[:images_needed])
     ]
 
-    # Concurrency Control
-    default_pool_size = len(upload_tasks)
-    host_limits = {"oeimg": 6, "ptscreens": 1, "lensdump": 1}
-    pool_size = host_limits.get(img_host, default_pool_size)
-    max_workers = min(len(upload_tasks), pool_size)
-    semaphore = asyncio.Semaphore(max_workers)
-
     # Track running tasks for cancellation
     running_tasks = set()
 
     async def async_upload(task):
-        """Upload image with concurrency control."""
-        index, *task_args = task
-        async with semaphore:
-            try:
-                future = asyncio.create_task(asyncio.to_thread(upload_image_task, task_args))
-                running_tasks.add(future)
-                result = await future
-                running_tasks.discard(future)
-
-                if result.get('status') == 'success':
-                    return (index, result)
-                else:
-                    console.print(f"[red]{result}")
+        """Upload image within the host's concurrency limit, moving it alone to the next host if it fails."""
+        index, image, *task_args = task
+        try:
+            future = asyncio.create_task(upload_image(image, *task_args))
+            running_tasks.add(future)
+            result = await future
+            running_tasks.discard(future)
+
+            if result.get('status') != 'success':
+                console.print(f"[red]{result}")
+                if using_custom_img_list:
                     return None
-            except asyncio.CancelledError:
-                console.print(f"[red]Upload task {index} cancelled.")
-                return None
-            except Exception as e:
-                console.print(f"[red]Error during upload: {str(e)}")
-                return None
+                result = await upload_with_fallback(image, img_host_num, meta)
+            return (index, result) if result.get('status') == 'success' else None
+        except asyncio.CancelledError:
+            console.print(f"[red]Upload task {index} cancelled.")
+            return None
+        except Exception as e:
+            console.print(f"[red]Error during upload: {str(e)}")
+            return None
 
     try:
         upload_results = await asyncio.gather(*[async_upload(task) for task in upload_tasks])
@@ -396,18 +209,8 @@ async def upload_screens(meta, screens, img_host_num, i, total_screens, custom_i
 
         successfully_uploaded = [(index, result) for index, result in results if result['status'] == 'success']
 
-        # Ensure we only switch hosts if necessary
-        if (len(successfully_uploaded) + len(meta['image_list'])) < meta.get('cutoff', 1) and not retry_mode and img_host == initial_img_host and not using_custom_img_list:
-            img_host_num += 1
-            if f'img_host_{img_host_num}' in config['DEFAULT']:
-                meta['imghost'] = config['DEFAULT'][f'img_host_{img_host_num}']
-                console.print(f"[cyan]Switching to the next image host: {meta['imghost']}[/cyan]")
-
-                gc.collect()
-                return await upload_screens(meta, screens, img_host_num, i, total_screens, custom_img_list, return_dict, retry_mode=True)
-            else:
-                console.print("[red]No more image hosts available. Aborting upload process.")
-                return meta['image_list'], len(meta['image_list'])
+        if (len(successfully_uploaded) + len(meta['image_list'])) < meta.get('cutoff', 1) and not using_custom_img_list:
+            console.print(f"[red]Only {len(successfully_uploaded)} screenshots could be uploaded to any image host.")
 
         # Process and store successfully uploaded images
         new_images = []
@@ -416,7 +219,9 @@ async def upload_screens(meta, screens, img_host_num, i, total_screens, custom_i
             new_image = {
                 'img_url': upload['img_url'],
                 'raw_url': raw_url,
-                'web_url': upload['web_url']
+                'web_url': upload['web_url'],
+                # Images that fell back to a later host do not share meta['imghost']
+                'img_host': upload.get('img_host')
             }
             new_images.append(new_image)
             if not using_custom_img_list and raw_url not in {img['raw_url'] for img in meta['image_list']}:
@@ -449,41 +254,4 @@ async def upload_screens(meta, screens, img_host_num, i, total_screens, custom_i
         return meta['image_list'], len(meta['image_list'])
 
     finally:
-        # Cleanup
-        thread_pool.shutdown(wait=True)
         gc.collect()
-
-
-async def imgbox_upload(chdir, image_glob, meta, return_dict):
-    try:
-        os.chdir(chdir)
-        image_list = []
-
-        async with pyimgbox.Gallery(thumb_width=350, square_thumbs=False) as gallery:
-            for image in image_glob:
-                try:
-                    async for submission in gallery.add([image]):
-                        if not submission['success']:
-                            console.print(f"[red]Error uploading to imgbox: [yellow]{submission['error']}[/yellow][/red]")
-                        else:
-                            web_url = submission.get('web_url')
-                            img_url = submission.get('thumbnail_url')
-                            raw_url = submission.get('image_url')
-                            if web_url and img_url and raw_url:
-                                image_dict = {
-                                    'web_url': web_url,
-                                    'img_url': img_url,
-                                    'raw_url': raw_url
-                                }
-                                image_list.append(image_dict)
-                            else:
-                                console.print(f"[red]Incomplete URLs received for image: {image}")
-                except Exception as e:
-                    console.print(f"[red]Error during upload for {image}: {str(e)}")
-
-        return_dict['image_list'] = image_list
-        return image_list
-
-    except Exception as e:
-        console.print(f"[red]An error occurred while uploading images to imgbox: {str(e)}")
-        return []
@@ -1,7 +1,9 @@
 #!/usr/bin/env python3
 from src.args import Args
-from src.clients import Clients
-from src.uploadscreens import upload_screens
+from src.clients import Clients, report_qbit_latency
+from src.httpcache import report_http_cache
+from src.trackerhttp import report_tracker_http, close_sessions as close_tracker_sessions
+from src.uploadscreens import upload_screens, ScreenUploadStream
 import json
 from pathlib import Path
 import asyncio
@@ -21,11 +23,13 @@ from src.trackersetup import tracker_class_map, api_trackers, other_api_trackers
 from src.trackerhandle import process_trackers
 from src.queuemanage import handle_queue
 from src.console import console
-from src.torrentcreate import create_torrent, create_random_torrents, create_base_from_existing_torrent
+from src.torrentcreate import create_torrent, create_random_torrents, create_base_from_existing_torrent, create_torrent_background, get_piece_size_caps
 from src.uphelper import UploadHelper
 from src.trackerstatus import process_all_trackers
-from src.takescreens import disc_screenshots, dvd_screenshots, screenshots
+from src.takescreens import disc_screenshots, dvd_screenshots, screenshots, optimize_pool
 from src.cleanup import cleanup
+from src.imagehosts import close_clients as close_image_host_clients
+from src.metastore import StoredMeta, load_meta, save_meta, delete_meta
 if os.name == "posix":
     import termios
 
@@ -52,33 +56,33 @@ parser = Args(config)
 
 async def merge_meta(meta, saved_meta, path):
     """Merges saved metadata with the current meta, respecting overwrite rules."""
-    with open(f"{base_dir}/tmp/{os.path.basename(path)}/meta.json") as f:
-        saved_meta = json.load(f)
-        overwrite_list = [
-            'trackers', 'dupe', 'debug', 'anon', 'category', 'type', 'screens', 'nohash', 'manual_edition', 'imdb', 'tmdb_manual', 'mal', 'manual',
-            'hdb', 'ptp', 'blu', 'no_season', 'no_aka', 'no_year', 'no_dub', 'no_tag', 'no_seed', 'client', 'desclink', 'descfile', 'desc', 'draft',
-            'modq', 'region', 'freeleech', 'personalrelease', 'unattended', 'manual_season', 'manual_episode', 'torrent_creation', 'qbit_tag', 'qbit_cat',
-            'skip_imghost_upload', 'imghost', 'manual_source', 'webdv', 'hardcoded-subs', 'dual_audio', 'manual_type', 'tvmaze_manual'
-        ]
-        sanitized_saved_meta = {}
-        for key, value in saved_meta.items():
-            clean_key = key.strip().strip("'").strip('"')
-            if clean_key in overwrite_list:
-                if clean_key in meta and meta.get(clean_key) is not None:
-                    sanitized_saved_meta[clean_key] = meta[clean_key]
-                    if meta['debug']:
-                        console.print(f"Overriding {clean_key} with meta value:", meta[clean_key])
-                else:
-                    sanitized_saved_meta[clean_key] = value
+    overwrite_list = [
+        'trackers', 'dupe', 'debug', 'anon', 'category', 'type', 'screens', 'nohash', 'manual_edition', 'imdb', 'tmdb_manual', 'mal', 'manual',
+        'hdb', 'ptp', 'blu', 'no_season', 'no_aka', 'no_year', 'no_dub', 'no_tag', 'no_seed', 'client', 'desclink', 'descfile', 'desc', 'draft',
+        'modq', 'region', 'freeleech', 'personalrelease', 'unattended', 'manual_season', 'manual_episode', 'torrent_creation', 'qbit_tag', 'qbit_cat',
+        'skip_imghost_upload', 'imghost', 'manual_source', 'webdv', 'hardcoded-subs', 'dual_audio', 'manual_type', 'tvmaze_manual', 'pipeline'
+    ]
+    sanitized_saved_meta = {}
+    for key, value in saved_meta.items():
+        clean_key = key.strip().strip("'").strip('"')
+        if clean_key in overwrite_list:
+            if clean_key in meta and meta.get(clean_key) is not None:
+                sanitized_saved_meta[clean_key] = meta[clean_key]
+                if meta['debug']:
+                    console.print(f"Overriding {clean_key} with meta value:", meta[clean_key])
             else:
                 sanitized_saved_meta[clean_key] = value
-        meta.update(sanitized_saved_meta)
-    f.close()
+        else:
+            sanitized_saved_meta[clean_key] = value
+    meta.update(sanitized_saved_meta)
     return sanitized_saved_meta
 
 
-async def process_meta(meta, base_dir):
-    """Process the metadata for each queued path."""
+async def process_meta(meta, base_dir, hash_torrent=True):
+    """
+    Process the metadata for each queued path.
+    When hash_torrent is False, BASE.torrent creation is left to the caller (see process_torrent).
+    """
 
     if meta['imghost'] is None:
         meta['imghost'] = config['DEFAULT']['img_host_1']
@@ -113,9 +117,7 @@ async def process_meta(meta, base_dir):
     else:
         trackers = [t.strip().upper() for t in trackers]
     meta['trackers'] = trackers
-    with open(f"{meta['base_dir']}/tmp/{meta['uuid']}/meta.json", 'w') as f:
-        json.dump(meta, f, indent=4)
-        f.close()
+    save_meta(meta)
     confirm = await helper.get_confirmation(meta)
     while confirm is False:
         editargs = cli_ui.ask_string("Input args that need correction e.g. (--tag NTb --category tv --tmdb 12345)")
@@ -146,6 +148,8 @@ async def process_meta(meta, base_dir):
 
     else:
         meta['we_are_uploading'] = True
+        # Dupe checks passed, hash BASE.torrent in the background while screens are captured and uploaded
+        torrent_task = asyncio.create_task(process_torrent(meta, threaded=True)) if hash_torrent else None
         filename = meta.get('title', None)
         bdmv_filename = meta.get('filename', None)
         bdinfo = meta.get('bdinfo', None)
@@ -155,6 +159,13 @@ async def process_meta(meta, base_dir):
         if 'manual_frames' not in meta:
             meta['manual_frames'] = {}
         manual_frames = meta['manual_frames']
+        meta['cutoff'] = int(config['DEFAULT'].get('cutoff_screens', 1))
+        if 'image_list' not in meta:
+            meta['image_list'] = []
+        # Screenshots are uploaded as they are captured when the image host upload below will be needed
+        upload_stream = None
+        if len(meta['image_list']) < meta['cutoff'] and meta.get('skip_imghost_upload', False) is False:
+            upload_stream = ScreenUploadStream(meta)
         # Take Screenshots
         try:
             if meta['is_disc'] == "BDMV":
@@ -162,7 +173,7 @@ async def process_meta(meta, base_dir):
                 try:
                     await disc_screenshots(
                         meta, bdmv_filename, bdinfo, meta['uuid'], base_dir, use_vs,
-                        meta.get('image_list', []), meta.get('ffdebug', False), None
+                        meta.get('image_list', []), meta.get('ffdebug', False), None, upload_stream=upload_stream
                     )
                 except asyncio.CancelledError:
                     console.print("[red]Screenshot capture was cancelled. Cleaning up...[/red]")
@@ -175,7 +186,7 @@ async def process_meta(meta, base_dir):
             elif meta['is_disc'] == "DVD":
                 try:
                     await dvd_screenshots(
-                        meta, 0, None, None
+                        meta, 0, None, None, upload_stream=upload_stream
                     )
                 except asyncio.CancelledError:
                     console.print("[red]DVD screenshot capture was cancelled. Cleaning up...[/red]")
@@ -192,7 +203,7 @@ async def process_meta(meta, base_dir):
 
                     await screenshots(
                         videopath, filename, meta['uuid'], base_dir, meta,
-                        manual_frames=manual_frames  # Pass additional kwargs directly
+                        manual_frames=manual_frames, upload_stream=upload_stream
                     )
                 except asyncio.CancelledError:
                     console.print("[red]Generic screenshot capture was cancelled. Cleaning up...[/red]")
@@ -204,6 +215,8 @@ async def process_meta(meta, base_dir):
 
         except asyncio.CancelledError:
             console.print("[red]Process was cancelled. Performing cleanup...[/red]")
+            if upload_stream is not None:
+                upload_stream.cancel()
             await cleanup_screenshot_temp_files(meta)
             raise
         except Exception as e:
@@ -211,21 +224,27 @@ async def process_meta(meta, base_dir):
             await cleanup_screenshot_temp_files(meta)
         finally:
             await asyncio.sleep(0.1)
-            await cleanup()
+            # cleanup() cancels every other task, which would take down background hashing, streamed
+            # screenshot uploads and the other pipeline stages
+            if not meta.get('pipeline') and torrent_task is None and upload_stream is None:
+                await cleanup()
             gc.collect()
             reset_terminal()
 
-        meta['cutoff'] = int(config['DEFAULT'].get('cutoff_screens', 1))
-        if 'image_list' not in meta:
-            meta['image_list'] = []
         if len(meta.get('image_list', [])) < meta.get('cutoff') and meta.get('skip_imghost_upload', False) is False:
-            return_dict = {}
             try:
-                new_images, dummy_var = await upload_screens(
-                    meta, meta['screens'], 1, 0, meta['screens'], [], return_dict=return_dict
-                )
+                if upload_stream is not None:
+                    new_images, dummy_var = await upload_stream.finish(meta['screens'])
+                else:
+                    new_images, dummy_var = await upload_screens(
+                        meta, meta['screens'], 1, meta['screens'], []
+                    )
             except asyncio.CancelledError:
                 console.print("\n[red]Upload process interrupted! Cancelling tasks...[/red]")
+                if upload_stream is not None:
+                    upload_stream.cancel()
+                if torrent_task is not None:
+                    torrent_task.cancel()
                 return
             except Exception as e:
                 console.print(f"\n[red]Unexpected error during upload: {e}[/red]")
@@ -236,30 +255,13 @@ async def process_meta(meta, base_dir):
 
         elif meta.get('skip_imghost_upload', False) is True and meta.get('image_list', False) is False:
             meta['image_list'] = []
+        elif upload_stream is not None:
+            upload_stream.cancel()
 
-        with open(f"{meta['base_dir']}/tmp/{meta['uuid']}/meta.json", 'w') as f:
-            json.dump(meta, f, indent=4)
-
-        if not meta['mkbrr']:
-            meta['mkbrr'] = int(config['DEFAULT'].get('mkbrr', False))
-        torrent_path = os.path.abspath(f"{meta['base_dir']}/tmp/{meta['uuid']}/BASE.torrent")
-        if not os.path.exists(torrent_path):
-            reuse_torrent = None
-            if meta.get('rehash', False) is False:
-                reuse_torrent = await client.find_existing_torrent(meta)
-                if reuse_torrent is not None:
-                    await create_base_from_existing_torrent(reuse_torrent, meta['base_dir'], meta['uuid'])
+        save_meta(meta)
 
-            if meta['nohash'] is False and reuse_torrent is None:
-                create_torrent(meta, Path(meta['path']), "BASE")
-            if meta['nohash']:
-                meta['client'] = "none"
-
-        elif os.path.exists(torrent_path) and meta.get('rehash', False) is True and meta['nohash'] is False:
-            create_torrent(meta, Path(meta['path']), "BASE")
-
-        if int(meta.get('randomized', 0)) >= 1:
-            create_random_torrents(meta['base_dir'], meta['uuid'], meta['randomized'], meta['path'])
+        if torrent_task is not None:
+            await torrent_task
 
         if 'saved_description' in meta and meta['saved_description'] is False:
             meta = await prep.gen_desc(meta)
@@ -269,8 +271,45 @@ async def process_meta(meta, base_dir):
         if meta.get('description') in ('None', '', ' '):
             meta['description'] = None
 
-        with open(f"{meta['base_dir']}/tmp/{meta['uuid']}/meta.json", 'w') as f:
-            json.dump(meta, f, indent=4)
+        save_meta(meta)
+
+
+async def process_torrent(meta, threaded=False):
+    """
+    Create BASE.torrent for the item, reusing an existing client torrent where possible.
+    With threaded=True hashing runs in a worker thread so the event loop stays responsive.
+    """
+    if not meta['mkbrr']:
+        meta['mkbrr'] = int(config['DEFAULT'].get('mkbrr', False))
+    meta['native_hash'] = bool(config['DEFAULT'].get('native_hash', False))
+    meta['hash_threads'] = int(config['DEFAULT'].get('hash_threads', 0)) or None
+    torrent_path = os.path.abspath(f"{meta['base_dir']}/tmp/{meta['uuid']}/BASE.torrent")
+    if not os.path.exists(torrent_path):
+        reuse_torrent = None
+        if meta.get('rehash', False) is False:
+            reuse_torrent = await client.find_existing_torrent(meta)
+            if reuse_torrent is not None:
+                await create_base_from_existing_torrent(reuse_torrent, meta['base_dir'], meta['uuid'])
+
+        if meta['nohash'] is False and reuse_torrent is None:
+            await hash_base_torrent(meta, threaded)
+        if meta['nohash']:
+            meta['client'] = "none"
+
+    elif os.path.exists(torrent_path) and meta.get('rehash', False) is True and meta['nohash'] is False:
+        await hash_base_torrent(meta, threaded)
+
+    if int(meta.get('randomized', 0)) >= 1:
+        create_random_torrents(meta['base_dir'], meta['uuid'], meta['randomized'], meta['path'])
+
+
+async def hash_base_torrent(meta, threaded=False):
+    # Trackers with piece size caps get their variants from the same read of the data
+    piece_sizes = get_piece_size_caps(meta)
+    if threaded:
+        await create_torrent_background(meta, Path(meta['path']), "BASE", piece_sizes=piece_sizes)
+    else:
+        create_torrent(meta, Path(meta['path']), "BASE", piece_sizes=piece_sizes)
 
 
 async def cleanup_screenshot_temp_files(meta):
@@ -480,34 +519,18 @@ async def do_the_thing(base_dir):
 
         processed_files_count = 0
         base_meta = {k: v for k, v in meta.items()}
-        for path in queue:
-            total_files = len(queue)
-            try:
-                meta = base_meta.copy()
-                meta['path'] = path
-                meta['uuid'] = None
-
-                if not path:
-                    raise ValueError("The 'path' variable is not defined or is empty.")
-
-                meta_file = os.path.join(base_dir, "tmp", os.path.basename(path), "meta.json")
-
-                if meta.get('delete_meta') and os.path.exists(meta_file):
-                    os.remove(meta_file)
-                    console.print("[bold red]Successfully deleted meta.json")
 
-                if os.path.exists(meta_file):
-                    with open(meta_file, "r") as f:
-                        saved_meta = json.load(f)
-                        console.print("[yellow]Existing metadata file found, it holds cached values")
-                        meta.update(await merge_meta(meta, saved_meta, path))
-                else:
-                    if meta['debug']:
-                        console.print(f"[yellow]No metadata file found at {meta_file}")
+        if meta.get('pipeline') and len(queue) > 1:
+            auto_mode = str(config['DEFAULT'].get('auto_mode', False)).lower() == "true"
+            if meta.get('unattended') or auto_mode:
+                await run_pipeline(queue, base_meta, base_dir, log_file)
+                return
+            console.print("[yellow]--pipeline requires unattended mode, processing the queue sequentially.")
+        base_meta['pipeline'] = False
 
-            except Exception as e:
-                console.print(f"[red]Failed to load metadata for path '{path}': {e}")
-                reset_terminal()
+        for path in queue:
+            total_files = len(queue)
+            meta = await load_item_meta(base_meta, path, base_dir)
 
             if meta['debug']:
                 start_time = time.time()
@@ -541,6 +564,10 @@ async def do_the_thing(base_dir):
             if meta['debug']:
                 finish_time = time.time()
                 console.print(f"Uploads processed in {finish_time - start_time:.4f} seconds")
+                report_qbit_latency()
+                report_http_cache()
+                report_tracker_http()
+                optimize_pool.report()
 
     except Exception as e:
         console.print(f"[bold red]An unexpected error occurred: {e}")
@@ -552,6 +579,120 @@ async def do_the_thing(base_dir):
             reset_terminal()
 
 
+async def load_item_meta(base_meta, path, base_dir):
+    """Build the meta for a queued path, merging any cached meta.json."""
+    meta = StoredMeta(base_meta)
+    try:
+        meta['path'] = path
+        meta['uuid'] = None
+
+        if not path:
+            raise ValueError("The 'path' variable is not defined or is empty.")
+
+        meta_file = os.path.join(base_dir, "tmp", os.path.basename(path), "meta.json")
+
+        if meta.get('delete_meta') and os.path.exists(meta_file):
+            delete_meta(meta_file)
+            console.print("[bold red]Successfully deleted meta.json")
+
+        if os.path.exists(meta_file):
+            saved_meta = load_meta(meta_file)
+            console.print("[yellow]Existing metadata file found, it holds cached values")
+            await merge_meta(meta, saved_meta, path)
+        else:
+            if meta['debug']:
+                console.print(f"[yellow]No metadata file found at {meta_file}")
+
+    except Exception as e:
+        console.print(f"[red]Failed to load metadata for path '{path}': {e}")
+        reset_terminal()
+
+    return meta
+
+
+async def run_pipeline(queue, base_meta, base_dir, log_file):
+    """
+    Process the queue as three overlapping stages connected by bounded queues:
+    metadata/dupe checks/screens -> BASE.torrent hashing -> tracker uploads.
+    While item N is hashed, item N+1 gathers metadata and item N-1 uploads.
+    """
+    total_files = len(queue)
+    limit = int(base_meta.get('limit_queue') or 0)
+    processed_files_count = 0
+    start_times = {}
+    hash_queue = asyncio.Queue(maxsize=1)
+    upload_queue = asyncio.Queue(maxsize=1)
+
+    async def mark_processed(meta):
+        nonlocal processed_files_count
+        if 'queue' in meta and meta.get('queue') is not None:
+            processed_files_count += 1
+            console.print(f"[cyan]Processed {processed_files_count}/{total_files} files.")
+            if not meta['debug']:
+                if log_file:
+                    await save_processed_file(log_file, meta['path'])
+
+    async def meta_stage():
+        admitted = 0
+        try:
+            for path in queue:
+                if limit > 0 and admitted >= limit:
+                    console.print(f"[red]Processing limit of {limit} files reached. Stopping queue processing.")
+                    break
+                admitted += 1
+                meta = await load_item_meta(base_meta, path, base_dir)
+                start_times[path] = time.time()
+                console.print(f"[green]Gathering info for {os.path.basename(path)}")
+                try:
+                    await process_meta(meta, base_dir, hash_torrent=False)
+                except Exception as e:
+                    console.print(f"[red]Pipeline metadata stage failed for {path}: {e}")
+                    console.print(traceback.format_exc())
+                    continue
+                if 'we_are_uploading' not in meta:
+                    console.print("we are not uploading.......")
+                    await mark_processed(meta)
+                else:
+                    await hash_queue.put(meta)
+        finally:
+            await hash_queue.put(None)
+
+    async def hash_stage():
+        try:
+            while True:
+                meta = await hash_queue.get()
+                if meta is None:
+                    break
+                try:
+                    await process_torrent(meta, threaded=True)
+                    save_meta(meta)
+                except Exception as e:
+                    console.print(f"[red]Pipeline hashing stage failed for {meta['path']}: {e}")
+                    console.print(traceback.format_exc())
+                    continue
+                await upload_queue.put(meta)
+        finally:
+            await upload_queue.put(None)
+
+    async def upload_stage():
+        while True:
+            meta = await upload_queue.get()
+            if meta is None:
+                break
+            try:
+                await process_trackers(meta, config, client, console, api_trackers, tracker_class_map, http_trackers, other_api_trackers)
+            except Exception as e:
+                console.print(f"[red]Pipeline upload stage failed for {meta['path']}: {e}")
+                console.print(traceback.format_exc())
+                continue
+            await mark_processed(meta)
+            if meta['debug']:
+                console.print(f"{os.path.basename(meta['path'])} processed in {time.time() - start_times[meta['path']]:.4f} seconds")
+
+    console.print(f"[cyan]Processing {total_files} queued items in pipeline mode")
+    await asyncio.gather(meta_stage(), hash_stage(), upload_stage())
+
+
 def check_python_version():
     pyver = platform.python_version_tuple()
     if int(pyver[0]) != 3 or int(pyver[1]) < 9:
@@ -569,6 +710,9 @@ async def main():
     except Exception as e:
         console.print(f"[bold red]Unexpected error: {e}[/bold red]")
     finally:
+        optimize_pool.shutdown()
+        await close_image_host_clients()
+        await close_tracker_sessions()
         await cleanup()
         reset_terminal()
 